@@ -4,17 +4,29 @@ CLI script to test the USPTO status-codes endpoint.
 Tests both paginated and non-paginated requests to see the API responses.
 """
 import asyncio
+import functools
 import json
+import logging
 import os
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
 from uspto_odp.controller.uspto_odp_client import USPTOClient, USPTOError
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
 # Load environment variables from .env file
 env_path = Path(__file__).parent.parent / '.env'
 load_dotenv(env_path)
 
+logger = logging.getLogger(__name__)
+
+# On-disk cache for status-code responses; set USPTO_CACHE_DIR to override
+STATUS_CODES_CACHE_DIR = os.environ.get("USPTO_CACHE_DIR", "~/.cache/uspto_odp")
+
 
 def print_section(title: str):
     """Print a formatted section header."""
@@ -23,6 +35,27 @@ def print_section(title: str):
     print("=" * 80)
 
 
+def _pretty(obj) -> str:
+    """Format obj as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+# Bound format method for one listing row, parsed once at import
+_format_status_code_row = "{:3d}. Code: {:3d} | Description: {}\n".format
+
+
+def write_status_codes(status_codes, start: int = 1):
+    """Write numbered status-code rows to stdout in a single call."""
+    sys.stdout.write("".join(
+        _format_status_code_row(idx, status_code.application_status_code,
+                                status_code.application_status_description_text)
+        for idx, status_code in enumerate(status_codes, start)
+    ))
+    sys.stdout.flush()
+
+
 def print_response(result, title: str):
     """Pretty print the API response."""
     print_section(title)
@@ -34,15 +67,13 @@ def print_response(result, title: str):
     if result.status_codes:
         print("\nStatus Codes:")
         print("-" * 80)
-        for idx, status_code in enumerate(result.status_codes, 1):
-            print(f"{idx:3d}. Code: {status_code.application_status_code:3d} | "
-                  f"Description: {status_code.application_status_description_text}")
+        write_status_codes(result.status_codes)
     else:
         print("\n⚠️  No status codes returned in response (only count provided)")
     
     print("\n" + "-" * 80)
     print("Raw JSON Response:")
-    print(json.dumps({
+    print(_pretty({
         "count": result.count,
         "statusCodeDataBag": [
             {
@@ -52,133 +83,158 @@ def print_response(result, title: str):
             for sc in result.status_codes
         ],
         "requestIdentifier": result.request_identifier
-    }, indent=2))
+    }))
+
+
+def with_error_log(test):
+    """Log USPTO and unexpected errors raised by a test and return None instead."""
+    @functools.wraps(test)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await test(*args, **kwargs)
+        except USPTOError as e:
+            logger.error("%s failed: %s - %s%s", test.__name__, e.code, e.error,
+                         f" ({e.error_details})" if e.error_details else "")
+        except Exception:
+            logger.exception("%s failed with an unexpected error", test.__name__)
+        return None
+    return wrapper
 
 
+@with_error_log
 async def test_without_pagination(client: USPTOClient):
     """Test the endpoint without any pagination parameters."""
     print_section("Test 1: GET /status-codes (No Parameters)")
     print("Calling endpoint without any query parameters or pagination...")
     
-    try:
-        result = await client.search_status_codes_get()
-        print_response(result, "Response: No Parameters")
-        return result
-    except USPTOError as e:
-        print(f"\n❌ Error: {e.code} - {e.error}")
-        if e.error_details:
-            print(f"   Details: {e.error_details}")
-        return None
-    except Exception as e:
-        print(f"\n❌ Unexpected error: {type(e).__name__}: {e}")
-        return None
+    result = await client.search_status_codes_get()
+    print_response(result, "Response: No Parameters")
+    return result
 
 
+@with_error_log
 async def test_with_pagination(client: USPTOClient, limit: int = 25, offset: int = 0):
     """Test the endpoint with pagination parameters."""
     print_section(f"Test 2: GET /status-codes (With Pagination: limit={limit}, offset={offset})")
     print(f"Calling endpoint with pagination parameters (limit={limit}, offset={offset})...")
     
-    try:
-        result = await client.search_status_codes_get(limit=limit, offset=offset)
-        print_response(result, f"Response: Pagination (limit={limit}, offset={offset})")
-        return result
-    except USPTOError as e:
-        print(f"\n❌ Error: {e.code} - {e.error}")
-        if e.error_details:
-            print(f"   Details: {e.error_details}")
-        return None
-    except Exception as e:
-        print(f"\n❌ Unexpected error: {type(e).__name__}: {e}")
-        return None
+    result = await client.search_status_codes_get(limit=limit, offset=offset)
+    print_response(result, f"Response: Pagination (limit={limit}, offset={offset})")
+    return result
+
+
+async def fetch_all_status_codes(client: USPTOClient, page_size: int = 25, q: str = None):
+    """Collect every status code (optionally filtered server-side by ``q``) into a list.
+
+    The first page is fetched on its own to learn the total count; the remaining
+    pages are then requested concurrently. The client bounds how many of those
+    requests are in flight at once. When ``q`` is set the API reports the filtered
+    total, so only the matching pages are requested.
+
+    Returns:
+        tuple: (total count reported by the API, list of StatusCode objects)
+    """
+    async def fetch_page(offset: int):
+        logger.debug("Fetching page: offset=%d, limit=%d", offset, page_size)
+        return offset, await client.search_status_codes_get(q=q, limit=page_size, offset=offset)
+
+    # The first response tells us how many pages remain
+    _, first_page = await fetch_page(0)
+    total_count = first_page.count
+    logger.debug("Total available: %d status codes", total_count)
+    
+    # Pre-size the result so each page is slice-assigned into place by offset
+    all_status_codes = [None] * total_count
+    pages = [(0, first_page)]
+    if first_page.status_codes:
+        offsets = range(page_size, total_count, page_size)
+        pages += await asyncio.gather(*(fetch_page(offset) for offset in offsets))
+    
+    retrieved_count = 0
+    for offset, page in pages:
+        page_codes = page.status_codes[:max(total_count - offset, 0)]
+        all_status_codes[offset:offset + len(page_codes)] = page_codes
+        retrieved_count += len(page_codes)
+    if retrieved_count < total_count:
+        # A page came back short; drop the unfilled slots
+        all_status_codes = [status_code for status_code in all_status_codes if status_code is not None]
+    logger.debug("Retrieved %d status codes across %d pages", retrieved_count, len(pages))
+    
+    return total_count, all_status_codes
+
 
+@with_error_log
+async def test_fetch_all_with_pagination(client: USPTOClient, page_size: int = 25, collect: bool = False,
+                                         q: str = None):
+    """Fetch all status codes by paginating through all results.
 
-async def test_fetch_all_with_pagination(client: USPTOClient, page_size: int = 25):
-    """Fetch all status codes by paginating through all results."""
+    By default the codes are streamed page by page and printed as they arrive, so
+    only one page is held in memory. Pass ``collect=True`` to gather every page
+    concurrently and return the full list. ``q`` filters on the server so only
+    matching status codes are transferred.
+    """
     print_section(f"Test 3: GET /status-codes (Fetch All with Pagination, page_size={page_size})")
     print(f"Fetching all status codes by paginating through results...")
     
-    all_status_codes = []
-    offset = 0
-    total_count = None
-    
-    try:
-        while True:
-            print(f"\n📄 Fetching page: offset={offset}, limit={page_size}")
-            result = await client.search_status_codes_get(limit=page_size, offset=offset)
-            
-            # Store total count from first response
-            if total_count is None:
-                total_count = result.count
-                print(f"   Total available: {total_count} status codes")
-            
-            # Add status codes from this page
-            if result.status_codes:
-                all_status_codes.extend(result.status_codes)
-                print(f"   Retrieved: {len(result.status_codes)} status codes (total so far: {len(all_status_codes)})")
-            
-            # Check if we've retrieved all available status codes
-            if len(all_status_codes) >= total_count or not result.status_codes:
-                break
-            
-            # Move to next page
-            offset += page_size
-            
-            # Small delay to respect rate limits
-            await asyncio.sleep(0.5)
-        
+    if collect:
+        total_count, all_status_codes = await fetch_all_status_codes(client, page_size, q=q)
+
         print_section("Final Results: All Status Codes Retrieved")
         print(f"Total Count (from API): {total_count}")
         print(f"Status Codes Retrieved: {len(all_status_codes)}")
-        
+
         if all_status_codes:
             print("\nAll Status Codes:")
             print("-" * 80)
-            for idx, status_code in enumerate(all_status_codes, 1):
-                print(f"{idx:3d}. Code: {status_code.application_status_code:3d} | "
-                      f"Description: {status_code.application_status_description_text}")
-        
+            write_status_codes(all_status_codes)
+
         return {
             "total_count": total_count,
             "retrieved_count": len(all_status_codes),
             "status_codes": all_status_codes
         }
-        
-    except USPTOError as e:
-        print(f"\n❌ Error: {e.code} - {e.error}")
-        if e.error_details:
-            print(f"   Details: {e.error_details}")
-        return None
-    except Exception as e:
-        print(f"\n❌ Unexpected error: {type(e).__name__}: {e}")
-        return None
 
+    print_section("Final Results: All Status Codes Retrieved")
+    print("\nAll Status Codes:")
+    print("-" * 80)
+    retrieved_count = 0
+    pending = []
+    async for status_code in client.iter_status_codes(q=q, page_size=page_size):
+        pending.append(status_code)
+        # Flush once per page rather than once per row
+        if len(pending) == page_size:
+            write_status_codes(pending, start=retrieved_count + 1)
+            retrieved_count += len(pending)
+            pending.clear()
+    write_status_codes(pending, start=retrieved_count + 1)
+    retrieved_count += len(pending)
+    print(f"\nStatus Codes Retrieved: {retrieved_count}")
 
+    return {
+        "retrieved_count": retrieved_count
+    }
+
+
+@with_error_log
 async def test_with_query(client: USPTOClient):
     """Test the endpoint with a query parameter."""
     print_section("Test 4: GET /status-codes (With Query Parameter)")
     print("Calling endpoint with a query parameter to filter results...")
     
-    try:
-        # Search for status codes containing "Patent" in description
-        result = await client.search_status_codes_get(
-            q="applicationStatusDescriptionText:Patent",
-            limit=10
-        )
-        print_response(result, "Response: With Query Parameter")
-        return result
-    except USPTOError as e:
-        print(f"\n❌ Error: {e.code} - {e.error}")
-        if e.error_details:
-            print(f"   Details: {e.error_details}")
-        return None
-    except Exception as e:
-        print(f"\n❌ Unexpected error: {type(e).__name__}: {e}")
-        return None
+    # Search for status codes containing "Patent" in description
+    result = await client.search_status_codes_get(
+        q="applicationStatusDescriptionText:Patent",
+        limit=10
+    )
+    print_response(result, "Response: With Query Parameter")
+    return result
 
 
 async def main():
     """Main function to run all tests."""
+    # Per-page progress is logged at DEBUG and hidden by default
+    logging.basicConfig(level=logging.INFO)
+    
     # Get API key from environment
     api_key = os.environ.get("USPTO_API_KEY")
     
@@ -193,32 +249,38 @@ async def main():
     print(f"\nAPI Key: {api_key[:10]}...{api_key[-4:] if len(api_key) > 14 else ''}")
     print(f"Endpoint: https://api.uspto.gov/api/v1/patent/status-codes")
     
-    # Create client
-    client = USPTOClient(api_key=api_key)
-    
-    try:
+    # The client's session (and its connection pool) is shared by all tests, and
+    # its rate limiter paces requests, so no sleeps are needed between tests.
+    # Status codes rarely change, so responses are cached on disk between runs.
+    async with USPTOClient(api_key=api_key, cache_dir=STATUS_CODES_CACHE_DIR) as client:
         # Test 1: Without pagination
         await test_without_pagination(client)
-        await asyncio.sleep(1)  # Rate limiting
         
         # Test 2: With pagination
         await test_with_pagination(client, limit=10, offset=0)
-        await asyncio.sleep(1)  # Rate limiting
         
         # Test 3: Fetch all with pagination
         await test_fetch_all_with_pagination(client, page_size=25)
-        await asyncio.sleep(1)  # Rate limiting
         
         # Test 4: With query parameter
         await test_with_query(client)
-        
-    finally:
-        # Clean up
-        await client.session.close()
     
     print_section("All Tests Complete")
     print("✅ Finished testing status-codes endpoint")
 
 
+def run(coro):
+    """Run coro on uvloop when it is installed, otherwise on the default event loop."""
+    try:
+        import uvloop  # Not available on Windows
+    except ImportError:
+        return asyncio.run(coro)
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    uvloop.install()
+    return asyncio.run(coro)
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -1,24 +1,49 @@
-from . import controller
-from . import models
+from functools import cache
+from importlib import import_module
 from importlib.metadata import version, PackageNotFoundError
-from uspto_odp.models.patent_continuity import (
-    ParentContinuity,
-    ChildContinuity, 
-    ContinuityCollection,
-    ContinuityData,
-)
-from uspto_odp.models.patent_file_wrapper import (
-    PatentFileWrapper,
-    Event,
-    Inventor,
-    ApplicationMetadata
-)
-
-try:
-    __version__ = version("uspto_odp")
-except PackageNotFoundError:  # pragma: no cover
-    # Package is not installed
-    __version__ = "unknown"
+
+# Public names are resolved on first access (PEP 562) so that importing the
+# package, or just the client, does not load every model module up front.
+_LAZY_SUBMODULES = {'controller', 'models'}
+_LAZY_ATTRIBUTES = {
+    'ParentContinuity': 'uspto_odp.models.patent_continuity',
+    'ChildContinuity': 'uspto_odp.models.patent_continuity',
+    'ContinuityCollection': 'uspto_odp.models.patent_continuity',
+    'ContinuityData': 'uspto_odp.models.patent_continuity',
+    'PatentFileWrapper': 'uspto_odp.models.patent_file_wrapper',
+    'Event': 'uspto_odp.models.patent_file_wrapper',
+    'Inventor': 'uspto_odp.models.patent_file_wrapper',
+    'ApplicationMetadata': 'uspto_odp.models.patent_file_wrapper',
+}
+
+
+@cache
+def _get_version() -> str:
+    # Reading installed metadata scans sys.path, so do it at most once and only on demand
+    try:
+        return version("uspto_odp")
+    except PackageNotFoundError:  # pragma: no cover
+        # Package is not installed
+        return "unknown"
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return import_module(f'.{name}', __name__)
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+    elif name == '__version__':
+        value = _get_version()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     'controller',
@@ -22,17 +22,24 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 '''
 
-from dataclasses import dataclass
-from typing import Optional, Union
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from functools import cached_property, wraps
+from typing import AsyncContextManager, AsyncIterator, Dict, Optional, Sequence, Union
+import asyncio
 import aiohttp
+from multidict import CIMultiDict
 import logging
+import random
+from email.utils import parsedate_to_datetime
 from uspto_odp.models.patent_file_wrapper import PatentFileWrapper
 from uspto_odp.models.patent_documents import PatentDocumentCollection, PatentDocument
 from uspto_odp.models.patent_continuity import ContinuityCollection
 from uspto_odp.models.foreign_priority import ForeignPriorityCollection
 from uspto_odp.models.patent_transactions import TransactionCollection
 from uspto_odp.models.patent_assignment import AssignmentCollection
-from uspto_odp.models.patent_status_codes import StatusCodeCollection
+from uspto_odp.models.patent_status_codes import StatusCode, StatusCodeCollection
 from uspto_odp.models.patent_metadata import ApplicationMetadataResponse
 from uspto_odp.models.patent_attorney import AttorneyResponse
 from uspto_odp.models.patent_adjustment import AdjustmentResponse
@@ -45,55 +52,591 @@ from uspto_odp.models.patent_trials_documents import TrialDocumentResponseBag, T
 from uspto_odp.models.patent_appeals_decisions import AppealDecisionResponseBag, AppealDecisionIdentifierResponseBag, AppealDecisionByAppealResponseBag
 from uspto_odp.models.patent_interferences_decisions import InterferenceDecisionResponseBag, InterferenceDecisionIdentifierResponseBag, InterferenceDecisionByInterferenceResponseBag
 from uspto_odp.models.bulk_datasets import DatasetProductSearchResponseBag, DatasetProductResponseBag, DatasetFileResponseBag
+import hashlib
+import json
 import os
 import re
+import stat
+import time
+import weakref
 try:
-    from enum import StrEnum  # Python 3.11+
+    import orjson  # Optional C-accelerated JSON codec
 except ImportError:
-    from strenum import StrEnum  # Python 3.9+
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+else:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+try:
+    import httpx  # Optional HTTP/2 transport
+except ImportError:
+    httpx = None
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Errors worth retrying that are raised before any response arrives
+_RETRYABLE_EXCEPTIONS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+if httpx is not None:
+    _RETRYABLE_EXCEPTIONS += (httpx.TransportError,)
+
+# PCT application numbers: optional country code (default US), two-digit year
+# (optionally prefixed with 20), then the remaining digits
+_PCT_RE = re.compile(r'PCT(US|IB|AU)?(?:20)?(\d{2})(\d+)')
+
+# str.translate table deleting every Latin-1 character except the ASCII digits,
+# used to reduce patent numbers such as "US11,989,999" to "11989999"
+_NON_DIGITS = str.maketrans('', '', ''.join(chr(c) for c in range(256) if not '0' <= chr(c) <= '9'))
+
+# Search payload used to find the granted utility application for a patent number.
+# Only "q" varies per lookup; the shared nested values must not be mutated. The
+# lookups read nothing but the application and patent numbers, so only those
+# fields are requested rather than the whole applicationMetaData object.
+_PATENT_LOOKUP_TEMPLATE = {
+    "filters": [
+        {
+            "name": "applicationMetaData.applicationTypeLabelName",
+            "value": ["Utility"]
+        },
+        {
+            "name": "applicationMetaData.publicationCategoryBag",
+            "value": ["Granted/Issued"]
+        }
+    ],
+    "sort": [
+        {
+            "field": "applicationMetaData.filingDate",
+            "order": "desc"
+        }
+    ],
+    "pagination": {
+        "offset": 0,
+        "limit": 25
+    },
+    "fields": ["applicationNumberText", "applicationMetaData.patentNumber"],
+    "facets": [
+        "applicationMetaData.applicationTypeLabelName"
+    ]
+}
+
+# File extension for each downloadable document format
+_MIME_EXTENSIONS = {"PDF": ".pdf", "MS_WORD": ".doc", "XML": ".xml"}
+
+# Search GET endpoints: Python argument name -> USPTO query parameter name
+_SEARCH_PARAM_MAP = (
+    ('q', 'q'),
+    ('sort', 'sort'),
+    ('offset', 'offset'),
+    ('limit', 'limit'),
+    ('facets', 'facets'),
+    ('fields', 'fields'),
+    ('filters', 'filters'),
+    ('range_filters', 'rangeFilters'),
+    ('format', 'format'),
+)
+
+def _search_params(**kwargs) -> dict:
+    """Build search query parameters from keyword arguments, dropping those left as None."""
+    return {api: kwargs[py] for py, api in _SEARCH_PARAM_MAP if kwargs.get(py) is not None}
+
+# Error messages used when an error response body does not include one
+_DEFAULT_ERROR_MESSAGES = {
+    400: "Bad Request",
+    403: "Forbidden",
+    404: "Not Found",
+    500: "Internal Server Error"
+}
+
+# HTTP statuses that indicate a transient failure worth retrying
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+def _parse_retry_after(value) -> Optional[float]:
+    """Parse a Retry-After header (delay in seconds or an HTTP date) into seconds to wait."""
+    if not isinstance(value, str):
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
 class USPTOError(Exception):
     """Exception for USPTO API errors."""
-    def __init__(self, code: int, error: str, error_details: Optional[str] = None, request_identifier: Optional[str] = None):
+    def __init__(self, code: int, error: str, error_details: Optional[str] = None, request_identifier: Optional[str] = None,
+                 retry_after: Optional[float] = None):
         self.code = code
         self.error = error
         self.error_details = error_details
         self.request_identifier = request_identifier
+        self.retry_after = retry_after
         super().__init__(f"{code}: {error} - {error_details or 'No details provided'}")
 
+    def __reduce__(self):
+        # args only holds the message, so rebuild from the constructor arguments when unpickling
+        return (type(self), (self.code, self.error, self.error_details, self.request_identifier, self.retry_after))
+
     @classmethod
     def from_dict(cls, data: dict, status_code: int) -> 'USPTOError':
-        default_messages = {
-            400: "Bad Request",
-            403: "Forbidden",
-            404: "Not Found",
-            500: "Internal Server Error"
-        }
         return cls(
             code=data.get('code', status_code),
-            error=data.get('error', default_messages.get(status_code, "Unknown Error")),
+            error=data.get('error', _DEFAULT_ERROR_MESSAGES.get(status_code, "Unknown Error")),
             error_details=data.get('errorDetails') or data.get('errorDetailed'),
             request_identifier=data.get('requestIdentifier')
         )
 
+    @property
+    def is_retryable(self) -> bool:
+        """Whether the error is a transient failure (rate limiting or server error)."""
+        try:
+            return int(self.code) in RETRYABLE_STATUS_CODES
+        except (TypeError, ValueError):
+            return False
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter for asyncio code.
+
+    Allows bursts of up to ``rate`` acquisitions and refills at ``rate / per``
+    tokens per second, so callers only wait once the budget is actually spent.
+    """
+    def __init__(self, rate: float, per: float = 1.0):
+        self.rate = rate
+        self.per = per
+        self._tokens = float(rate)
+        self._updated_at: Optional[float] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_lock(self, loop: asyncio.AbstractEventLoop) -> asyncio.Lock:
+        # The lock is tied to the loop it was created in, so a limiter shared across
+        # event loops (e.g. one per test) gets a fresh lock for each loop
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        loop = asyncio.get_running_loop()
+        async with self._get_lock(loop):
+            while True:
+                now = loop.time()
+                if self._updated_at is not None:
+                    elapsed = now - self._updated_at
+                    self._tokens = min(self.rate, self._tokens + elapsed * self.rate / self.per)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self.per / self.rate)
+
+    async def pause(self, seconds: float) -> None:
+        """
+        Hold back every caller of acquire() for the given number of seconds.
+
+        Used when the server asks for a pause (Retry-After), so that all requests
+        sharing the limiter back off, not just the one that was throttled. Pauses
+        requested at the same time overlap rather than add up.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + seconds
+        async with self._get_lock(loop):
+            remaining = deadline - loop.time()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+
+class _AsyncTTLCache:
+    """
+    In-memory LRU cache of awaitable results with a time-to-live.
+
+    Entries hold the task computing the result rather than the result itself, so
+    concurrent callers asking for the same key share a single in-flight request.
+    Failed or cancelled calls are evicted as soon as they finish so that errors
+    are never cached.
+    """
+    def __init__(self, ttl: float, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        # Per-URL (etag, last_modified, parsed result) kept past expiry for conditional GETs
+        self._validators: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_call(self, key: tuple, coro_factory):
+        """Return the cached result for key, calling coro_factory() on a miss."""
+        if self.ttl <= 0:
+            return await coro_factory()
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            self._entries.move_to_end(key)
+            task = entry[1]
+        else:
+            task = asyncio.ensure_future(coro_factory())
+            self._entries[key] = (now + self.ttl, task)
+            self._entries.move_to_end(key)
+            task.add_done_callback(lambda t: self._evict_failed(key, t))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        # Shielded so one caller being cancelled does not cancel the shared request
+        return await asyncio.shield(task)
+
+    def _evict_failed(self, key: tuple, task: asyncio.Future) -> None:
+        if task.cancelled() or task.exception() is not None:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is task:
+                del self._entries[key]
+
+    def get_validator(self, url: str) -> Optional[tuple]:
+        """Return the stored (etag, last_modified, parsed result) for url, if any."""
+        validator = self._validators.get(url)
+        if validator is not None:
+            self._validators.move_to_end(url)
+        return validator
+
+    def set_validator(self, url: str, etag: Optional[str], last_modified: Optional[str], parsed) -> None:
+        """Remember the validators and parsed result of a 200 response for url."""
+        self._validators[url] = (etag, last_modified, parsed)
+        self._validators.move_to_end(url)
+        while len(self._validators) > self.maxsize:
+            self._validators.popitem(last=False)
+
+    def invalidate(self, method_name: str, *args) -> None:
+        """
+        Drop the cached result of one call.
+
+        Example:
+            client.cache.invalidate("get_patent_wrapper", "16123456")
+        """
+        self._entries.pop((method_name,) + args, None)
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        self._entries.clear()
+        self._validators.clear()
+
+def _memoized(method):
+    """
+    Cache a USPTOClient read-only method's results in the client's in-memory cache,
+    keyed by method name and arguments.
+    """
+    @wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        key = (method.__name__,) + args + tuple(sorted(kwargs.items()))
+        return await self.cache.get_or_call(key, lambda: method(self, *args, **kwargs))
+    return wrapper
+
+def _bulk_fetch_worker(client_cls, client_kwargs: dict, method_name: str, serial_numbers: list) -> list:
+    """Fetch one slice of a bulk_fetch() call in a worker process with its own event loop."""
+    async def run():
+        async with client_cls(**client_kwargs) as client:
+            return await client.batch(serial_numbers, getattr(client, method_name), return_exceptions=True)
+    return asyncio.run(run())
+
+
+class _HttpxContent:
+    """Streaming body of an httpx response, exposing aiohttp's iter_chunked."""
+    def __init__(self, response):
+        self._response = response
+
+    def iter_chunked(self, size: int):
+        return self._response.aiter_bytes(size)
+
+class _HttpxResponse:
+    """
+    Adapts a streamed httpx response to the subset of aiohttp.ClientResponse used
+    by the client (status, headers, json(), read() and content.iter_chunked()).
+    """
+    def __init__(self, response):
+        self._response = response
+        self.status = response.status_code
+        self.headers = response.headers
+        self.content = _HttpxContent(response)
+        content_length = response.headers.get("Content-Length")
+        self.content_length = int(content_length) if content_length is not None else None
+
+    async def read(self) -> bytes:
+        return await self._response.aread()
+
+    async def json(self, loads=json.loads, content_type=None):
+        body = await self.read()
+        if not body.strip():
+            return None
+        return loads(body)
+
 class USPTOClient:
     """Async client for USPTO Patent Application API"""
     
     BASE_API_URL = "https://api.uspto.gov/api"
 
-    def __init__(self, api_key: str, session: Optional[aiohttp.ClientSession] = None):
+    # Connection pool settings used when the client creates its own session
+    CONNECTION_LIMIT = 20
+    CONNECTION_LIMIT_PER_HOST = 10
+    DNS_CACHE_TTL = 300
+    KEEPALIVE_TIMEOUT = 60
+
+    # Session-wide timeouts in seconds. There is no total cap so that large
+    # document downloads are not cut off while data is still arriving.
+    CONNECT_TIMEOUT = 10
+    READ_TIMEOUT = 60
+
+    # Default request budget: RATE_LIMIT requests every RATE_PERIOD seconds
+    RATE_LIMIT = 10
+    RATE_PERIOD = 1.0
+
+    # Retry policy for transient failures: up to MAX_RETRIES retries with
+    # exponential backoff starting at RETRY_BACKOFF_BASE seconds, plus jitter
+    MAX_RETRIES = 5
+    RETRY_BACKOFF_BASE = 0.3
+    # Upper bound on a single computed backoff delay, in seconds
+    RETRY_BACKOFF_MAX = 30.0
+
+    # Read size for streaming document downloads to disk, in bytes
+    DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+    # In-memory cache for per-application GET endpoints: results stay fresh for
+    # MEMO_TTL seconds (0 disables caching) and at most MEMO_MAXSIZE are kept
+    MEMO_TTL = 300
+    MEMO_MAXSIZE = 1024
+
+    # Patent numbers resolved per search by get_app_metadata_from_patent_numbers, and the
+    # page size for those searches; larger than the batch since one patent number can match
+    # several applications
+    PATENT_LOOKUP_BATCH_SIZE = 25
+    PATENT_LOOKUP_PAGE_SIZE = 100
+
+    # How long cached status-code responses stay fresh on disk, in seconds
+    STATUS_CODES_CACHE_TTL = 86400
+
+    # Sessions shared by clients created with share_session=True, one per event loop
+    _shared_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = weakref.WeakKeyDictionary()
+
+    def __init__(
+        self,
+        api_key: str,
+        session: Optional[aiohttp.ClientSession] = None,
+        cache_dir: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        rps: Optional[float] = None,
+        transport: str = "aiohttp",
+        share_session: bool = False,
+        concurrency_controller: Optional[AsyncContextManager] = None
+    ):
+        """
+        Args:
+            api_key (str): USPTO Open Data Portal API key
+            session (aiohttp.ClientSession, optional): Session to use for requests. If omitted,
+                                                      the client creates and owns one.
+            cache_dir (str, optional): Directory for the on-disk response cache used by
+                                       reference-data endpoints such as status codes.
+                                       Caching is disabled when not set.
+            max_concurrency (int, optional): Maximum number of requests in flight at once.
+                                             Default: CONNECTION_LIMIT_PER_HOST
+            rps (float, optional): Maximum requests started per second, with bursts up to
+                                   the same number. Default: RATE_LIMIT per RATE_PERIOD
+            transport (str, optional): HTTP library used for requests. "aiohttp" (default) or
+                                       "httpx", which speaks HTTP/2 and multiplexes concurrent
+                                       requests over a few connections. "httpx" requires the
+                                       http2 extra: pip install uspto_odp[http2]
+            share_session (bool, optional): When no session is passed, use the session shared by
+                                            every client on the running event loop instead of
+                                            creating a private one, so clients created in a loop
+                                            reuse one connection pool and DNS cache. Close it with
+                                            USPTOClient.close_shared_session(). Default: False
+            concurrency_controller (async context manager, optional): Entered around every request
+                                            in place of the max_concurrency semaphore, e.g. an
+                                            adaptive limiter. Its __aexit__ receives the request's
+                                            exception, if any. Default: None
+
+        Raises:
+            ValueError: If transport is not "aiohttp" or "httpx"
+            ImportError: If transport is "httpx" and httpx is not installed
+        """
+        if transport not in ("aiohttp", "httpx"):
+            raise ValueError(f"Unknown transport '{transport}'. Expected 'aiohttp' or 'httpx'")
+        if transport == "httpx" and httpx is None:
+            raise ImportError("transport='httpx' requires httpx; install it with: pip install uspto_odp[http2]")
         self.API_KEY = api_key
-        self.headers = {
+        # Built once as a CIMultiDict, which aiohttp uses as is instead of converting
+        # a plain dict on every request
+        self.headers = CIMultiDict({
             "accept": "application/json",
             "X-API-KEY": self.API_KEY
-        }
-        self.session = session or aiohttp.ClientSession()
+        })
+        self._session = session
+        self._share_session = share_session and session is None
+        self._owns_session = session is None and not share_session
+        self.transport = transport
+        self._httpx_client = None
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None
+        self.max_concurrency = max_concurrency or self.CONNECTION_LIMIT_PER_HOST
+        if rps is None:
+            self.limiter = RateLimiter(rate=self.RATE_LIMIT, per=self.RATE_PERIOD)
+        else:
+            self.limiter = RateLimiter(rate=rps)
+        self._inflight_semaphore: Optional[AsyncContextManager] = concurrency_controller
+        self.cache = _AsyncTTLCache(ttl=self.MEMO_TTL, maxsize=self.MEMO_MAXSIZE)
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        The aiohttp session used for all requests.
+
+        If no session was passed to the constructor, one is created on first use
+        with a pooled, keep-alive TCPConnector so that every request made through
+        this client reuses the same connections and DNS cache.
+        """
+        if self._session is None:
+            self._session = self.get_shared_session() if self._share_session else self._create_session()
+        return self._session
+
+    @session.setter
+    def session(self, session: aiohttp.ClientSession) -> None:
+        # Like a session passed to the constructor, an assigned session is closed by the caller
+        self._session = session
+        self._owns_session = False
+
+    @classmethod
+    def get_shared_session(cls) -> aiohttp.ClientSession:
+        """
+        Return the session shared by clients created with share_session=True.
+
+        One session is kept per event loop, since aiohttp sessions cannot be used
+        across loops. It is created on first use and stays open until
+        close_shared_session() is awaited.
+        """
+        loop = asyncio.get_running_loop()
+        session = cls._shared_sessions.get(loop)
+        if session is None or session.closed:
+            session = cls._create_session()
+            cls._shared_sessions[loop] = session
+        return session
+
+    @classmethod
+    async def close_shared_session(cls) -> None:
+        """Close the running event loop's shared session, if one was created."""
+        session = cls._shared_sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
 
     @property
+    def _inflight(self) -> AsyncContextManager:
+        """
+        Caps in-flight requests at max_concurrency so that concurrent fan-out waits
+        here instead of piling up inside the connection pool, unless a
+        concurrency_controller was given.
+        """
+        # Created on first use so it binds to the running event loop on Python 3.9
+        if self._inflight_semaphore is None:
+            self._inflight_semaphore = asyncio.BoundedSemaphore(self.max_concurrency)
+        return self._inflight_semaphore
+
+    @asynccontextmanager
+    async def _request(self, method: str, url: str, **kwargs):
+        """
+        Send a request through the client's concurrency cap and rate limiter.
+
+        Every API call goes through here, so bursts from concurrent callers are
+        smoothed out before they reach the server instead of coming back as 429s.
+
+        Args:
+            method (str): HTTP method, e.g. "GET" or "POST"
+            url (str): Request URL
+            **kwargs: Extra arguments for the session request. The client's headers
+                      are used unless headers are given explicitly.
+
+        Yields:
+            aiohttp.ClientResponse: The response, released when the block exits (an
+                                    equivalent adapter when transport="httpx")
+        """
+        kwargs.setdefault("headers", self.headers)
+        async with self._inflight:
+            await self.limiter.acquire()
+            if self.transport == "httpx":
+                if "json" in kwargs:
+                    # httpx encodes json= with the stdlib; use the same encoder as the aiohttp session
+                    kwargs["content"] = _json_dumps(kwargs.pop("json"))
+                    kwargs["headers"] = {**kwargs["headers"], "Content-Type": "application/json"}
+                async with self.httpx_client.stream(method, url, **kwargs) as response:
+                    yield _HttpxResponse(response)
+            else:
+                async with getattr(self.session, method.lower())(url, **kwargs) as response:
+                    yield response
+
+    @property
+    def httpx_client(self) -> 'httpx.AsyncClient':
+        """
+        The HTTP/2 httpx client used for all requests when transport="httpx".
+
+        Created on first use with the same pool size and timeouts as the aiohttp session.
+        """
+        if self._httpx_client is None:
+            self._httpx_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=self.CONNECTION_LIMIT,
+                    max_keepalive_connections=self.CONNECTION_LIMIT_PER_HOST,
+                    keepalive_expiry=self.KEEPALIVE_TIMEOUT
+                ),
+                timeout=httpx.Timeout(self.READ_TIMEOUT, connect=self.CONNECT_TIMEOUT, pool=None)
+            )
+        return self._httpx_client
+
+    @classmethod
+    def _create_session(cls) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=cls.CONNECTION_LIMIT,
+            limit_per_host=cls.CONNECTION_LIMIT_PER_HOST,
+            ttl_dns_cache=cls.DNS_CACHE_TTL,
+            keepalive_timeout=cls.KEEPALIVE_TIMEOUT
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=None,
+            sock_connect=cls.CONNECT_TIMEOUT,
+            sock_read=cls.READ_TIMEOUT
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            json_serialize=_json_dumps
+        )
+
+    async def close(self) -> None:
+        """
+        Close the underlying session if it was created by this client.
+
+        Sessions passed in by the caller are left open; closing them is the
+        caller's responsibility.
+        """
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+        if self._owns_session:
+            self._session = None
+        if self._httpx_client is not None:
+            await self._httpx_client.aclose()
+            self._httpx_client = None
+
+    # Alias matching the aclose() naming used by other async clients
+    aclose = close
+
+    async def __aenter__(self) -> 'USPTOClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    @cached_property
     def _patent_applications_endpoint(self) -> str:
         """
         Patent Applications service endpoint.
@@ -101,7 +644,7 @@ class USPTOClient:
         """
         return f"{self.BASE_API_URL}/v1/patent/applications"
 
-    @property
+    @cached_property
     def _bulk_data_endpoint(self) -> str:
         """
         Bulk Data service endpoint (for future implementation).
@@ -109,7 +652,7 @@ class USPTOClient:
         """
         return f"{self.BASE_API_URL}/v1/bulkdata"
 
-    @property
+    @cached_property
     def _bulk_datasets_endpoint(self) -> str:
         """
         Bulk Datasets service endpoint.
@@ -117,7 +660,7 @@ class USPTOClient:
         """
         return f"{self.BASE_API_URL}/v1/datasets/products"
 
-    @property
+    @cached_property
     def _petition_decisions_endpoint(self) -> str:
         """
         Petition Decisions service endpoint.
@@ -125,7 +668,7 @@ class USPTOClient:
         """
         return f"{self.BASE_API_URL}/v1/petition/decisions"
 
-    @property
+    @cached_property
     def _ptab_trials_endpoint(self) -> str:
         """
         PTAB Trials service endpoint (for future implementation).
@@ -133,7 +676,7 @@ class USPTOClient:
         """
         return f"{self.BASE_API_URL}/v1/ptab/trials"
 
-    @property
+    @cached_property
     def _ptab_trials_proceedings_endpoint(self) -> str:
         """
         PTAB Trials Proceedings service endpoint.
@@ -141,7 +684,7 @@ class USPTOClient:
         """
         return f"{self.BASE_API_URL}/v1/patent/trials/proceedings"
 
-    @property
+    @cached_property
     def _ptab_trials_decisions_endpoint(self) -> str:
         """
         PTAB Trials Decisions service endpoint.
@@ -149,7 +692,7 @@ class USPTOClient:
         """
         return f"{self.BASE_API_URL}/v1/patent/trials/decisions"
 
-    @property
+    @cached_property
     def _ptab_trials_documents_endpoint(self) -> str:
         """
         PTAB Trials Documents service endpoint.
@@ -157,7 +700,7 @@ class USPTOClient:
         """
         return f"{self.BASE_API_URL}/v1/patent/trials/documents"
 
-    @property
+    @cached_property
     def _ptab_appeals_decisions_endpoint(self) -> str:
         """
         PTAB Appeals Decisions service endpoint.
@@ -165,7 +708,7 @@ class USPTOClient:
         """
         return f"{self.BASE_API_URL}/v1/patent/appeals/decisions"
 
-    @property
+    @cached_property
     def _ptab_interferences_decisions_endpoint(self) -> str:
         """
         PTAB Interferences Decisions service endpoint.
@@ -173,7 +716,7 @@ class USPTOClient:
         """
         return f"{self.BASE_API_URL}/v1/patent/interferences/decisions"
 
-    @property
+    @cached_property
     def _status_codes_endpoint(self) -> str:
         """
         Status Codes service endpoint.
@@ -196,32 +739,203 @@ class USPTOClient:
             url = self._build_url(self._patent_applications_endpoint, "12345678", "documents")
             # Returns: https://api.uspto.gov/api/v1/patent/applications/12345678/documents
         """
+        # Fast paths for the common one- and two-segment URLs
+        if len(path_segments) == 1 and path_segments[0]:
+            return f"{service_endpoint}/{path_segments[0]}"
+        if len(path_segments) == 2 and path_segments[0] and path_segments[1]:
+            return f"{service_endpoint}/{path_segments[0]}/{path_segments[1]}"
         path = "/".join(str(segment) for segment in path_segments if segment)
         if path:
             return f"{service_endpoint}/{path}"
         return service_endpoint
 
     async def _handle_response(self, response, parse_func):
-        try:
-            data = await response.json()
-        except Exception:
+        # parse_func=None passes a successful body through undecoded
+        if parse_func is None and response.status == 200:
+            return await response.read()
+        if response.status == 204 or response.content_length == 0:
+            # Nothing to decode
+            data = None
+        else:
+            try:
+                # content_type=None decodes the body even if the server mislabels it,
+                # and an empty body (which aiohttp decodes as None) becomes {}
+                data = await response.json(loads=_json_loads, content_type=None)
+            except Exception:
+                data = None
+        if data is None:
             data = {}
         
         if response.status == 200:
             return parse_func(data)
         
         error = USPTOError.from_dict(data, response.status)
+        if response.status in RETRYABLE_STATUS_CODES:
+            error.retry_after = _parse_retry_after(response.headers.get("Retry-After"))
         self._log_error(error)
         raise error
 
+    async def _get_json(self, url: str, parse_func, **kwargs):
+        """
+        GET url with the client's headers and parse the JSON response.
+
+        Transient failures (429/5xx, connection errors, timeouts) are retried with
+        backoff; each attempt goes through the concurrency cap and rate limiter again.
+
+        Args:
+            url (str): Request URL
+            parse_func: Callable applied to the decoded JSON body of a 200 response
+            **kwargs: Extra arguments for session.get, e.g. params
+
+        Returns:
+            The value returned by parse_func
+
+        Raises:
+            USPTOError: If the API request fails
+        """
+        async def attempt():
+            async with self._request("GET", url, **kwargs) as response:
+                return await self._handle_response(response, parse_func)
+        return await self._request_with_retry(attempt)
+
+    async def _post_json(self, url: str, payload: dict, parse_func):
+        """
+        POST a JSON payload to url and parse the JSON response, retrying transient failures.
+
+        Args:
+            url (str): Request URL
+            payload (dict): JSON-compatible request body
+            parse_func: Callable applied to the decoded JSON body of a 200 response
+
+        Returns:
+            The value returned by parse_func
+
+        Raises:
+            USPTOError: If the API request fails
+        """
+        async def attempt():
+            async with self._request("POST", url, json=payload) as response:
+                return await self._handle_response(response, parse_func)
+        return await self._request_with_retry(attempt)
+
+    async def _conditional_get(self, url: str, parse_func):
+        """
+        GET url, revalidating a previously seen response instead of re-downloading it.
+
+        When an earlier response for url carried an ETag or Last-Modified header, the
+        request is sent with If-None-Match/If-Modified-Since. A 304 reply then returns
+        the previously parsed result without transferring or parsing the body again.
+        """
+        validator = self.cache.get_validator(url)
+        headers = self.headers
+        if validator is not None:
+            etag, last_modified, _ = validator
+            headers = self.headers.copy()
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        async def attempt():
+            async with self._request("GET", url, headers=headers) as response:
+                if response.status == 304 and validator is not None:
+                    return validator[2]
+                result = await self._handle_response(response, parse_func)
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if etag or last_modified:
+                    self.cache.set_validator(url, etag, last_modified, result)
+                return result
+        return await self._request_with_retry(attempt)
+
+    async def _request_with_retry(self, coro_factory, *, retries: Optional[int] = None, base: Optional[float] = None):
+        """
+        Await coro_factory(), retrying transient failures with exponential backoff.
+
+        Retries on 429/5xx responses, connection errors and timeouts. The wait before
+        retry n is base * 2**n plus random jitter, capped at RETRY_BACKOFF_MAX, unless the
+        server sent a Retry-After header, in which case that delay is used instead and
+        the client's rate limiter is paused for it, so other requests wait as well.
+
+        Args:
+            coro_factory: Zero-argument callable returning a new awaitable for each attempt
+            retries (int, optional): Maximum number of retries. Default: MAX_RETRIES
+            base (float, optional): Initial backoff in seconds. Default: RETRY_BACKOFF_BASE
+
+        Returns:
+            The result of the first successful attempt
+
+        Raises:
+            USPTOError: If a non-retryable error occurs or retries are exhausted
+        """
+        retries = self.MAX_RETRIES if retries is None else retries
+        base = self.RETRY_BACKOFF_BASE if base is None else base
+        for attempt in range(retries + 1):
+            try:
+                return await coro_factory()
+            except USPTOError as e:
+                if not e.is_retryable or attempt == retries:
+                    raise
+                delay = e.retry_after
+                # The server asked everyone to slow down, not just this request
+                pause_limiter = delay is not None
+                reason = f"status {e.code}"
+            except _RETRYABLE_EXCEPTIONS as e:
+                if attempt == retries:
+                    raise
+                delay = None
+                pause_limiter = False
+                reason = type(e).__name__
+            if delay is None:
+                delay = min(base * 2 ** attempt + random.uniform(0, base), self.RETRY_BACKOFF_MAX)
+            logger.warning("Retrying USPTO request after %s in %.2fs (attempt %d of %d)", reason, delay, attempt + 1, retries)
+            if pause_limiter:
+                await self.limiter.pause(delay)
+            else:
+                await asyncio.sleep(delay)
+
+    def _cache_path(self, namespace: str, key: tuple) -> str:
+        digest = hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, namespace, f"{digest}.json")
+
+    def _read_cache(self, namespace: str, key: tuple, ttl: float) -> Optional[dict]:
+        """Return the cached response data for key, or None if caching is off, missing or stale."""
+        if not self.cache_dir:
+            return None
+        path = self._cache_path(namespace, key)
+        try:
+            if time.time() - os.path.getmtime(path) > ttl:
+                return None
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, namespace: str, key: tuple, data: dict) -> None:
+        if not self.cache_dir:
+            return
+        path = self._cache_path(namespace, key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file first so readers never see a partial entry
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Could not write response cache entry %s: %s", path, e)
+
     def _log_error(self, error: USPTOError):
+        # %-style arguments so nothing is formatted when ERROR logging is disabled
         logger.error(
-            f"USPTO API Error: {error.code}\n"
-            f"Error Message: {error.error}\n"
-            f"Details: {error.error_details or 'No details provided'}\n"
-            f"Request ID: {error.request_identifier or 'No request ID provided'}"
+            "USPTO API Error: %s\nError Message: %s\nDetails: %s\nRequest ID: %s",
+            error.code,
+            error.error,
+            error.error_details or 'No details provided',
+            error.request_identifier or 'No request ID provided'
         )
 
+    @_memoized
     async def get_patent_wrapper(self, serial_number: str) -> PatentFileWrapper:
         """
         Retrieve the patent application wrapper information.
@@ -242,40 +956,43 @@ class USPTOClient:
 
         # Check if this is a PCT application number
         if serial_number.startswith('PCT'):
-            # Pattern to match PCT numbers and extract country code, year and remaining digits
-            # Group 1: Country code (US|IB|AU)
-            # Group 2: Year (2 digits, optionally prefixed with 20)
-            # Group 3: Remaining digits
-            pct_pattern = r'PCT(US|IB|AU)?(?:20)?(\d{2})(\d+)'
-            match = re.match(pct_pattern, serial_number)
+            # Extract country code, year and remaining digits
+            match = _PCT_RE.match(serial_number)
             
             if match:
                 country, year, number = match.groups()
                 # Use US as default if no country code
                 country = country or 'US'
-                # First try with original number
-                standardized = f"PCT{country}{year}{number}"
-                
+                url = self._build_url(self._patent_applications_endpoint, f"PCT{country}{year}{number}")
+                if not number.startswith('0'):
+                    return await self._get_json(url, PatentFileWrapper.parse_response)
+
+                # Numbers with a leading zero may be filed with or without it. Request both
+                # forms at once so that a miss on the original costs no extra round trip;
+                # the original number still wins whenever it exists.
+                fallback_url = self._build_url(self._patent_applications_endpoint, f"PCT{country}{year}{int(number)}")
+                fallback = asyncio.ensure_future(self._get_json(fallback_url, PatentFileWrapper.parse_response))
                 try:
-                    url = self._build_url(self._patent_applications_endpoint, standardized)
-                    async with self.session.get(url, headers=self.headers) as response:
-                        if response.status == 404 and number.startswith('0'):
-                            # If 404 and has leading zero, try without it
-                            number_no_zero = str(int(number))
-                            standardized = f"PCT{country}{year}{number_no_zero}"
-                            url = self._build_url(self._patent_applications_endpoint, standardized)
-                            async with self.session.get(url, headers=self.headers) as retry_response:
-                                return await self._handle_response(retry_response, PatentFileWrapper.parse_response)
-                        return await self._handle_response(response, PatentFileWrapper.parse_response)
-                except Exception as e:
-                    # If any error occurs during retry, raise the original error
-                    raise e
+                    return await self._get_json(url, PatentFileWrapper.parse_response)
+                except USPTOError as e:
+                    if str(e.code) != "404":
+                        raise
+                    try:
+                        return await fallback
+                    except USPTOError:
+                        # If the fallback fails too, raise the original error
+                        raise e from None
+                finally:
+                    if not fallback.done():
+                        fallback.cancel()
+                    elif not fallback.cancelled():
+                        # Mark a fallback failure as retrieved when it was not needed
+                        fallback.exception()
             else:
                 raise ValueError(f"Invalid PCT application number format: {serial_number}")
         
         url = self._build_url(self._patent_applications_endpoint, serial_number)
-        async with self.session.get(url, headers=self.headers) as response:
-            return await self._handle_response(response, PatentFileWrapper.parse_response)
+        return await self._conditional_get(url, PatentFileWrapper.parse_response)
 
     async def get_patent_documents(
         self, 
@@ -338,8 +1055,7 @@ class USPTOClient:
         if document_codes is not None:
             params['documentCodes'] = document_codes
         
-        async with self.session.get(url, params=params, headers=self.headers) as response:
-            return await self._handle_response(response, PatentDocumentCollection.from_dict)
+        return await self._get_json(url, PatentDocumentCollection.from_dict, params=params)
 
     async def download_document(
         self, 
@@ -363,52 +1079,64 @@ class USPTOClient:
 
         Raises:
             FileNotFoundError: If save_path doesn't exist
+            NotADirectoryError: If save_path isn't a directory
             PermissionError: If save_path isn't writable
-            ValueError: If requested mime_type isn't available
+            ValueError: If mime_type isn't supported or isn't available for this document
             USPTOError: If the API request fails
             Exception: If download fails
         """
-        if not os.path.exists(save_path):
-            raise FileNotFoundError(f"Save path does not exist: {save_path}")
-        if not os.access(save_path, os.W_OK):
-            raise PermissionError(f"Save path is not writable: {save_path}")
+        # Catch typos before touching the filesystem or the network
+        if mime_type not in _MIME_EXTENSIONS:
+            raise ValueError(
+                f"Unsupported mime type '{mime_type}'. "
+                f"Supported types: {', '.join(_MIME_EXTENSIONS)}"
+            )
+        
+        # stat() can block on slow or network filesystems, so keep it off the event loop.
+        # Write permission is not checked up front; opening the file raises PermissionError.
+        try:
+            save_path_stat = await asyncio.to_thread(os.stat, save_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Save path does not exist: {save_path}") from None
+        if not stat.S_ISDIR(save_path_stat.st_mode):
+            raise NotADirectoryError(f"Save path is not a directory: {save_path}")
             
-        download_option = next(
-            (opt for opt in document.download_options if opt.mime_type == mime_type),
-            None
-        )
+        options_by_mime_type = document.download_options_by_mime_type
+        download_option = options_by_mime_type.get(mime_type)
         
         if not download_option:
-            available_types = [opt.mime_type for opt in document.download_options]
             raise ValueError(
                 f"Mime type '{mime_type}' not available for this document. "
-                f"Available types: {', '.join(available_types)}"
+                f"Available types: {', '.join(options_by_mime_type)}"
             )
             
         if not filename:
-            extension = ".pdf" if mime_type == "PDF" else ".doc" if mime_type == "MS_WORD" else ".xml"
+            extension = _MIME_EXTENSIONS[mime_type]
             filename = f"{document.application_number}_{document.document_code}_{document.document_identifier}{extension}"
             
         full_path = os.path.join(save_path, filename)
         
-        async with self.session.get(download_option.download_url, headers=self.headers) as response:
+        async with self._request("GET", download_option.download_url) as response:
             if response.status != 200:
                 raise Exception(f"Download failed with status {response.status}")
                 
-            with open(full_path, 'wb') as f:
-                while True:
-                    chunk = await response.content.read(8192)
-                    if not chunk:
-                        break
-                    f.write(chunk)
-                        
+            # Disk writes run in a worker thread so other requests keep making
+            # progress while large documents are written out
+            f = await asyncio.to_thread(open, full_path, 'wb')
+            try:
+                async for chunk in response.content.iter_chunked(self.DOWNLOAD_CHUNK_SIZE):
+                    await asyncio.to_thread(f.write, chunk)
+            finally:
+                await asyncio.to_thread(f.close)
+
         logger.info(
-            f"Successfully downloaded document {document.document_identifier} "
-            f"({mime_type}) to {full_path}"
+            "Successfully downloaded document %s (%s) to %s",
+            document.document_identifier, mime_type, full_path
         )
         
         return full_path
 
+    @_memoized
     async def get_continuity(self, serial_number: str) -> ContinuityCollection:
         """
         Retrieve continuity information for a patent application.
@@ -423,9 +1151,9 @@ class USPTOClient:
             USPTOError: If the API request fails
         """
         url = self._build_url(self._patent_applications_endpoint, serial_number, "continuity")
-        async with self.session.get(url, headers=self.headers) as response:
-            return await self._handle_response(response, ContinuityCollection.from_dict)
+        return await self._conditional_get(url, ContinuityCollection.from_dict)
 
+    @_memoized
     async def get_foreign_priority(self, serial_number: str) -> ForeignPriorityCollection:
         """
         Retrieve foreign priority claims for a patent application.
@@ -440,9 +1168,9 @@ class USPTOClient:
             USPTOError: If the API request fails
         """
         url = self._build_url(self._patent_applications_endpoint, serial_number, "foreign-priority")
-        async with self.session.get(url, headers=self.headers) as response:
-            return await self._handle_response(response, ForeignPriorityCollection.from_dict)
+        return await self._conditional_get(url, ForeignPriorityCollection.from_dict)
 
+    @_memoized
     async def get_patent_transactions(self, serial_number: str) -> TransactionCollection:
         """
         Retrieve transaction history for a patent application.
@@ -457,9 +1185,9 @@ class USPTOClient:
             USPTOError: If the API request fails
         """
         url = self._build_url(self._patent_applications_endpoint, serial_number, "transactions")
-        async with self.session.get(url, headers=self.headers) as response:
-            return await self._handle_response(response, TransactionCollection.from_dict)
+        return await self._conditional_get(url, TransactionCollection.from_dict)
 
+    @_memoized
     async def get_patent_assignments(self, serial_number: str) -> AssignmentCollection:
         """
         Retrieve assignment information for a patent application.
@@ -474,9 +1202,9 @@ class USPTOClient:
             USPTOError: If the API request fails
         """
         url = self._build_url(self._patent_applications_endpoint, serial_number, "assignment")
-        async with self.session.get(url, headers=self.headers) as response:
-            return await self._handle_response(response, AssignmentCollection.from_dict)
+        return await self._conditional_get(url, AssignmentCollection.from_dict)
 
+    @_memoized
     async def get_attorney(self, serial_number: str) -> AttorneyResponse:
         """
         Retrieve attorney/agent information for a patent application.
@@ -491,9 +1219,9 @@ class USPTOClient:
             USPTOError: If the API request fails
         """
         url = self._build_url(self._patent_applications_endpoint, serial_number, "attorney")
-        async with self.session.get(url, headers=self.headers) as response:
-            return await self._handle_response(response, AttorneyResponse.from_dict)
+        return await self._conditional_get(url, AttorneyResponse.from_dict)
 
+    @_memoized
     async def get_adjustment(self, serial_number: str) -> AdjustmentResponse:
         """
         Retrieve patent term adjustment information for a patent application.
@@ -508,9 +1236,9 @@ class USPTOClient:
             USPTOError: If the API request fails
         """
         url = self._build_url(self._patent_applications_endpoint, serial_number, "adjustment")
-        async with self.session.get(url, headers=self.headers) as response:
-            return await self._handle_response(response, AdjustmentResponse.from_dict)
+        return await self._conditional_get(url, AdjustmentResponse.from_dict)
 
+    @_memoized
     async def get_associated_documents(self, serial_number: str) -> AssociatedDocumentsResponse:
         """
         Retrieve associated documents (PGPub and Grant) metadata for a patent application.
@@ -525,10 +1253,215 @@ class USPTOClient:
             USPTOError: If the API request fails
         """
         url = self._build_url(self._patent_applications_endpoint, serial_number, "associated-documents")
-        async with self.session.get(url, headers=self.headers) as response:
-            return await self._handle_response(response, AssociatedDocumentsResponse.from_dict)
+        return await self._conditional_get(url, AssociatedDocumentsResponse.from_dict)
+
+    # Parts fetched by get_application_bundle when no explicit list is given
+    APPLICATION_BUNDLE_PARTS = (
+        "wrapper",
+        "continuity",
+        "transactions",
+        "assignments",
+        "foreign_priority",
+        "attorney",
+        "adjustment",
+        "associated_documents",
+        "metadata",
+    )
+
+    async def get_application_bundle(
+        self,
+        serial_number: str,
+        parts: Sequence[str] = APPLICATION_BUNDLE_PARTS
+    ) -> Dict[str, object]:
+        """
+        Retrieve several kinds of information about one application concurrently.
+
+        This is a convenience method (not a USPTO endpoint). Each requested part maps to
+        one of the single-application methods below, and all of the requests are issued
+        at once, so the total wait is roughly that of the slowest request rather than
+        the sum of all of them.
+
+        Args:
+            serial_number (str): The USPTO patent application serial number (e.g., '16123456')
+            parts (Sequence[str], optional): Which parts to fetch. Any of:
+                'wrapper' (get_patent_wrapper), 'continuity' (get_continuity),
+                'transactions' (get_patent_transactions), 'assignments' (get_patent_assignments),
+                'foreign_priority' (get_foreign_priority), 'attorney' (get_attorney),
+                'adjustment' (get_adjustment), 'associated_documents' (get_associated_documents),
+                'metadata' (get_app_metadata), 'documents' (get_patent_documents).
+                Default: every part except 'documents'
+
+        Returns:
+            Dict[str, object]: Maps each requested part to its result. A part whose request
+                               failed maps to the raised exception (e.g. a USPTOError for a
+                               404), so one missing part does not discard the others.
+
+        Raises:
+            ValueError: If an unknown part name is requested
+
+        Example:
+            bundle = await client.get_application_bundle("16123456", parts=("wrapper", "continuity"))
+            wrapper = bundle["wrapper"]
+            if isinstance(bundle["continuity"], USPTOError):
+                print("No continuity data")
+        """
+        fetchers = {
+            "wrapper": self.get_patent_wrapper,
+            "continuity": self.get_continuity,
+            "transactions": self.get_patent_transactions,
+            "assignments": self.get_patent_assignments,
+            "foreign_priority": self.get_foreign_priority,
+            "attorney": self.get_attorney,
+            "adjustment": self.get_adjustment,
+            "associated_documents": self.get_associated_documents,
+            "metadata": self.get_app_metadata,
+            "documents": self.get_patent_documents,
+        }
+        unknown = [part for part in parts if part not in fetchers]
+        if unknown:
+            raise ValueError(
+                f"Unknown application bundle part(s): {', '.join(unknown)}. "
+                f"Available parts: {', '.join(fetchers)}"
+            )
+
+        results = await asyncio.gather(
+            *(fetchers[part](serial_number) for part in parts),
+            return_exceptions=True
+        )
+        return dict(zip(parts, results))
+
+    async def batch(
+        self,
+        serial_numbers: Sequence[str],
+        fetch,
+        return_exceptions: bool = False
+    ) -> list:
+        """
+        Call a per-application method for many applications concurrently.
+
+        This is a convenience method (not a USPTO endpoint). The calls overlap their
+        network round trips while the client's concurrency cap and rate limiter keep
+        the number of requests in flight bounded. Unless return_exceptions is set, the
+        first failure cancels the calls still outstanding, so they stop using the rate
+        limit budget.
+
+        Args:
+            serial_numbers (Sequence[str]): Application serial numbers (e.g., ['16123456', '17654321'])
+            fetch: A client method taking a serial number, e.g. client.get_continuity
+            return_exceptions (bool, optional): Return failures (e.g. a USPTOError for a 404) in
+                                                place of their results instead of raising the
+                                                first one. Default: False
+
+        Returns:
+            list: The results, in the same order as serial_numbers
+
+        Raises:
+            USPTOError: If a request fails and return_exceptions is False
+
+        Example:
+            continuity = await client.batch(["16123456", "17654321"], client.get_continuity)
+        """
+        tasks = [asyncio.ensure_future(fetch(serial_number)) for serial_number in serial_numbers]
+        try:
+            return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def batch_get_wrappers(
+        self,
+        serial_numbers: Sequence[str],
+        return_exceptions: bool = False
+    ) -> list:
+        """
+        Retrieve the patent wrappers for many applications concurrently.
+
+        Args:
+            serial_numbers (Sequence[str]): Application serial numbers (e.g., ['16123456', '17654321'])
+            return_exceptions (bool, optional): Return failures in place of their wrappers
+                                                instead of raising. Default: False
+
+        Returns:
+            list: PatentFileWrapper objects, in the same order as serial_numbers
+
+        Raises:
+            USPTOError: If a request fails and return_exceptions is False
+        """
+        return await self.batch(serial_numbers, self.get_patent_wrapper, return_exceptions)
+
+    async def bulk_fetch(
+        self,
+        serial_numbers: Sequence[str],
+        method_name: str,
+        processes: int = 4,
+        return_exceptions: bool = False
+    ) -> list:
+        """
+        Call a per-application method for many applications across worker processes.
+
+        This is a convenience method (not a USPTO endpoint). Each process runs its own
+        event loop and client, so parsing responses into model objects is spread over
+        several cores instead of contending for one. The worker clients are built with
+        this client's api_key, cache_dir and transport, and its request rate and
+        concurrency cap are split evenly between the processes. Sessions and in-memory
+        memo/ETag caches cannot cross process boundaries, so each worker starts with its
+        own. For small batches, batch() is cheaper.
+
+        Args:
+            serial_numbers (Sequence[str]): Application serial numbers (e.g., ['16123456', '17654321'])
+            method_name (str): Name of a client method taking a serial number, e.g. 'get_continuity'
+            processes (int, optional): Number of worker processes. Default: 4
+            return_exceptions (bool, optional): Return failures in place of their results
+                                                instead of raising the first one. Default: False
+
+        Returns:
+            list: The results, in the same order as serial_numbers
 
-    async def search_patent_applications(self, payload: dict) -> dict:
+        Raises:
+            ValueError: If method_name is not a method of the client
+            USPTOError: If a request fails and return_exceptions is False
+
+        Example:
+            continuity = await client.bulk_fetch(serial_numbers, "get_continuity", processes=8)
+        """
+        if not callable(getattr(self, method_name, None)) or method_name.startswith("_"):
+            raise ValueError(f"Unknown client method: {method_name!r}")
+        serial_numbers = list(serial_numbers)
+        if not serial_numbers:
+            return []
+        processes = max(1, min(processes, len(serial_numbers)))
+        chunk_size = -(-len(serial_numbers) // processes)
+        client_kwargs = {
+            "api_key": self.API_KEY,
+            "cache_dir": self.cache_dir,
+            "transport": self.transport,
+            "rps": self.limiter.rate / self.limiter.per / processes,
+            "max_concurrency": max(1, self.max_concurrency // processes),
+        }
+        loop = asyncio.get_running_loop()
+        executor = ProcessPoolExecutor(max_workers=processes)
+        try:
+            chunks = await asyncio.gather(*(
+                loop.run_in_executor(
+                    executor, _bulk_fetch_worker, type(self), client_kwargs, method_name,
+                    serial_numbers[start:start + chunk_size]
+                )
+                for start in range(0, len(serial_numbers), chunk_size)
+            ))
+        finally:
+            # Never wait for the workers on the event loop; if a chunk failed or the call
+            # was cancelled, chunks that have not started yet are dropped
+            executor.shutdown(wait=False, cancel_futures=True)
+        results = [result for chunk in chunks for result in chunk]
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+        return results
+
+    async def search_patent_applications(self, payload: dict, raw: bool = False) -> Union[dict, bytes]:
         """
         Search for patent applications using a JSON payload (POST method).
 
@@ -537,16 +1470,17 @@ class USPTOClient:
         Args:
             payload (dict): The search criteria as a JSON-compatible dictionary.
                            Can include fields like query text, sort options, filters, etc.
+            raw (bool, optional): Return the undecoded response body as bytes instead of
+                                  parsing it, e.g. to write it straight to disk. Default: False
 
         Returns:
-            dict: The search results as returned by the USPTO API
+            dict: The search results as returned by the USPTO API (bytes if raw=True)
 
         Raises:
             USPTOError: If the API request fails (400, 403, 404, 413, 500)
         """
         url = self._build_url(self._patent_applications_endpoint, "search")
-        async with self.session.post(url, json=payload, headers=self.headers) as response:
-            return await self._handle_response(response, lambda x: x)  # Return raw JSON response
+        return await self._post_json(url, payload, None if raw else lambda x: x)  # Return raw JSON response
 
     async def search_patent_applications_get(
         self,
@@ -557,8 +1491,9 @@ class USPTOClient:
         facets: Optional[str] = None,
         fields: Optional[str] = None,
         filters: Optional[str] = None,
-        range_filters: Optional[str] = None
-    ) -> dict:
+        range_filters: Optional[str] = None,
+        raw: bool = False
+    ) -> Union[dict, bytes]:
         """
         Search for patent applications using query parameters (GET method).
 
@@ -578,9 +1513,11 @@ class USPTOClient:
                                     Example: 'applicationMetaData.applicationTypeCode UTL,DES'
             range_filters (str, optional): Filter by range. Format: 'fieldName min:max'
                                           Example: 'applicationMetaData.grantDate 2010-01-01:2011-01-01'
+            raw (bool, optional): Return the undecoded response body as bytes instead of
+                                  parsing it, e.g. to write it straight to disk. Default: False
 
         Returns:
-            dict: The search results as returned by the USPTO API
+            dict: The search results as returned by the USPTO API (bytes if raw=True)
 
         Raises:
             USPTOError: If the API request fails (400, 403, 404, 413, 500)
@@ -619,28 +1556,18 @@ class USPTOClient:
         url = self._build_url(self._patent_applications_endpoint, "search")
 
         # Build query parameters, only including non-None values
-        params = {}
-        if q is not None:
-            params['q'] = q
-        if sort is not None:
-            params['sort'] = sort
-        if offset is not None:
-            params['offset'] = offset
-        if limit is not None:
-            params['limit'] = limit
-        if facets is not None:
-            params['facets'] = facets
-        if fields is not None:
-            params['fields'] = fields
-        if filters is not None:
-            params['filters'] = filters
-        if range_filters is not None:
-            params['rangeFilters'] = range_filters
+        params = _search_params(
+            q=q, sort=sort, offset=offset, limit=limit, facets=facets, fields=fields,
+            filters=filters, range_filters=range_filters
+        )
 
-        async with self.session.get(url, params=params, headers=self.headers) as response:
-            return await self._handle_response(response, lambda x: x)  # Return raw JSON response
+        return await self._get_json(url, None if raw else lambda x: x, params=params)  # Return raw JSON response
 
-    async def search_patent_applications_download(self, payload: dict) -> PatentDataResponse:
+    async def search_patent_applications_download(
+        self,
+        payload: dict,
+        raw: bool = False
+    ) -> Union[PatentDataResponse, bytes]:
         """
         Download patent application search results using a JSON payload (POST method).
 
@@ -651,16 +1578,17 @@ class USPTOClient:
         Args:
             payload (dict): The search criteria as a JSON-compatible dictionary.
                            Can include fields like query text, sort options, filters, etc.
+            raw (bool, optional): Return the undecoded response body as bytes instead of
+                                  parsing it, e.g. to write it straight to disk. Default: False
 
         Returns:
-            PatentDataResponse: The download response containing search results
+            PatentDataResponse: The download response containing search results (bytes if raw=True)
 
         Raises:
             USPTOError: If the API request fails (400, 403, 404, 413, 500)
         """
         url = self._build_url(self._patent_applications_endpoint, "search", "download")
-        async with self.session.post(url, json=payload, headers=self.headers) as response:
-            return await self._handle_response(response, PatentDataResponse.from_dict)
+        return await self._post_json(url, payload, None if raw else PatentDataResponse.from_dict)
 
     async def search_patent_applications_download_get(
         self,
@@ -672,8 +1600,9 @@ class USPTOClient:
         fields: Optional[str] = None,
         filters: Optional[str] = None,
         range_filters: Optional[str] = None,
-        format: Optional[str] = None
-    ) -> PatentDataResponse:
+        format: Optional[str] = None,
+        raw: bool = False
+    ) -> Union[PatentDataResponse, bytes]:
         """
         Download patent application search results using query parameters (GET method).
 
@@ -697,9 +1626,11 @@ class USPTOClient:
             range_filters (str, optional): Filter by range. Format: 'fieldName min:max'
                                           Example: 'applicationMetaData.grantDate 2010-01-01:2011-01-01'
             format (str, optional): Download format. Options: 'json' or 'csv'. Default: 'json'
+            raw (bool, optional): Return the undecoded response body as bytes instead of
+                                  parsing it, e.g. to write it straight to disk. Default: False
 
         Returns:
-            PatentDataResponse: The download response containing search results
+            PatentDataResponse: The download response containing search results (bytes if raw=True)
 
         Raises:
             USPTOError: If the API request fails (400, 403, 404, 413, 500)
@@ -712,28 +1643,12 @@ class USPTOClient:
             results = await client.search_patent_applications_download_get(q='Utility', format='csv', limit=100)
         """
         url = self._build_url(self._patent_applications_endpoint, "search", "download")
-        params = {}
-        if q is not None:
-            params['q'] = q
-        if sort is not None:
-            params['sort'] = sort
-        if offset is not None:
-            params['offset'] = offset
-        if limit is not None:
-            params['limit'] = limit
-        if facets is not None:
-            params['facets'] = facets
-        if fields is not None:
-            params['fields'] = fields
-        if filters is not None:
-            params['filters'] = filters
-        if range_filters is not None:
-            params['rangeFilters'] = range_filters
-        if format is not None:
-            params['format'] = format
-
-        async with self.session.get(url, params=params, headers=self.headers) as response:
-            return await self._handle_response(response, PatentDataResponse.from_dict)
+        params = _search_params(
+            q=q, sort=sort, offset=offset, limit=limit, facets=facets, fields=fields,
+            filters=filters, range_filters=range_filters, format=format
+        )
+
+        return await self._get_json(url, None if raw else PatentDataResponse.from_dict, params=params)
 
     async def search_petition_decisions(self, payload: dict) -> PetitionDecisionResponseBag:
         """
@@ -752,8 +1667,7 @@ class USPTOClient:
             USPTOError: If the API request fails (400, 403, 404, 500)
         """
         url = self._build_url(self._petition_decisions_endpoint, "search")
-        async with self.session.post(url, json=payload, headers=self.headers) as response:
-            return await self._handle_response(response, PetitionDecisionResponseBag.from_dict)
+        return await self._post_json(url, payload, PetitionDecisionResponseBag.from_dict)
 
     async def search_petition_decisions_get(
         self,
@@ -802,26 +1716,12 @@ class USPTOClient:
             )
         """
         url = self._build_url(self._petition_decisions_endpoint, "search")
-        params = {}
-        if q is not None:
-            params['q'] = q
-        if sort is not None:
-            params['sort'] = sort
-        if offset is not None:
-            params['offset'] = offset
-        if limit is not None:
-            params['limit'] = limit
-        if facets is not None:
-            params['facets'] = facets
-        if fields is not None:
-            params['fields'] = fields
-        if filters is not None:
-            params['filters'] = filters
-        if range_filters is not None:
-            params['rangeFilters'] = range_filters
-
-        async with self.session.get(url, params=params, headers=self.headers) as response:
-            return await self._handle_response(response, PetitionDecisionResponseBag.from_dict)
+        params = _search_params(
+            q=q, sort=sort, offset=offset, limit=limit, facets=facets, fields=fields,
+            filters=filters, range_filters=range_filters
+        )
+
+        return await self._get_json(url, PetitionDecisionResponseBag.from_dict, params=params)
 
     async def search_petition_decisions_download(self, payload: dict) -> PetitionDecisionResponseBag:
         """
@@ -841,8 +1741,7 @@ class USPTOClient:
             USPTOError: If the API request fails (400, 403, 404, 500)
         """
         url = self._build_url(self._petition_decisions_endpoint, "search", "download")
-        async with self.session.post(url, json=payload, headers=self.headers) as response:
-            return await self._handle_response(response, PetitionDecisionResponseBag.from_dict)
+        return await self._post_json(url, payload, PetitionDecisionResponseBag.from_dict)
 
     async def search_petition_decisions_download_get(
         self,
@@ -887,26 +1786,12 @@ class USPTOClient:
             results = await client.search_petition_decisions_download_get(q='Denied', format='csv', limit=100)
         """
         url = self._build_url(self._petition_decisions_endpoint, "search", "download")
-        params = {}
-        if q is not None:
-            params['q'] = q
-        if sort is not None:
-            params['sort'] = sort
-        if offset is not None:
-            params['offset'] = offset
-        if limit is not None:
-            params['limit'] = limit
-        if fields is not None:
-            params['fields'] = fields
-        if filters is not None:
-            params['filters'] = filters
-        if range_filters is not None:
-            params['rangeFilters'] = range_filters
-        if format is not None:
-            params['format'] = format
-
-        async with self.session.get(url, params=params, headers=self.headers) as response:
-            return await self._handle_response(response, PetitionDecisionResponseBag.from_dict)
+        params = _search_params(
+            q=q, sort=sort, offset=offset, limit=limit, fields=fields, filters=filters,
+            range_filters=range_filters, format=format
+        )
+
+        return await self._get_json(url, PetitionDecisionResponseBag.from_dict, params=params)
 
     async def get_petition_decision(
         self,
@@ -943,8 +1828,7 @@ class USPTOClient:
         else:
             params['includeDocuments'] = 'false'
 
-        async with self.session.get(url, params=params, headers=self.headers) as response:
-            return await self._handle_response(response, PetitionDecisionIdentifierResponseBag.from_dict)
+        return await self._get_json(url, PetitionDecisionIdentifierResponseBag.from_dict, params=params)
 
     async def search_trial_proceedings(self, payload: dict) -> TrialProceedingResponseBag:
         """
@@ -963,8 +1847,7 @@ class USPTOClient:
             USPTOError: If the API request fails (400, 403, 404, 500)
         """
         url = self._build_url(self._ptab_trials_proceedings_endpoint, "search")
-        async with self.session.post(url, json=payload, headers=self.headers) as response:
-            return await self._handle_response(response, TrialProceedingResponseBag.from_dict)
+        return await self._post_json(url, payload, TrialProceedingResponseBag.from_dict)
 
     async def search_trial_proceedings_get(
         self,
@@ -1013,26 +1896,12 @@ class USPTOClient:
             )
         """
         url = self._build_url(self._ptab_trials_proceedings_endpoint, "search")
-        params = {}
-        if q is not None:
-            params['q'] = q
-        if sort is not None:
-            params['sort'] = sort
-        if offset is not None:
-            params['offset'] = offset
-        if limit is not None:
-            params['limit'] = limit
-        if facets is not None:
-            params['facets'] = facets
-        if fields is not None:
-            params['fields'] = fields
-        if filters is not None:
-            params['filters'] = filters
-        if range_filters is not None:
-            params['rangeFilters'] = range_filters
-
-        async with self.session.get(url, params=params, headers=self.headers) as response:
-            return await self._handle_response(response, TrialProceedingResponseBag.from_dict)
+        params = _search_params(
+            q=q, sort=sort, offset=offset, limit=limit, facets=facets, fields=fields,
+            filters=filters, range_filters=range_filters
+        )
+
+        return await self._get_json(url, TrialProceedingResponseBag.from_dict, params=params)
 
     async def search_trial_proceedings_download(self, payload: dict) -> TrialProceedingResponseBag:
         """
@@ -1052,8 +1921,7 @@ class USPTOClient:
             USPTOError: If the API request fails (400, 403, 404, 500)
         """
         url = self._build_url(self._ptab_trials_proceedings_endpoint, "search", "download")
-        async with self.session.post(url, json=payload, headers=self.headers) as response:
-            return await self._handle_response(response, TrialProceedingResponseBag.from_dict)
+        return await self._post_json(url, payload, TrialProceedingResponseBag.from_dict)
 
     async def search_trial_proceedings_download_get(
         self,
@@ -1098,26 +1966,12 @@ class USPTOClient:
             results = await client.search_trial_proceedings_download_get(q='IPR', format='csv', limit=100)
         """
         url = self._build_url(self._ptab_trials_proceedings_endpoint, "search", "download")
-        params = {}
-        if q is not None:
-            params['q'] = q
-        if sort is not None:
-            params['sort'] = sort
-        if offset is not None:
-            params['offset'] = offset
-        if limit is not None:
-            params['limit'] = limit
-        if fields is not None:
-            params['fields'] = fields
-        if filters is not None:
-            params['filters'] = filters
-        if range_filters is not None:
-            params['rangeFilters'] = range_filters
-        if format is not None:
-            params['format'] = format
-
-        async with self.session.get(url, params=params, headers=self.headers) as response:
-            return await self._handle_response(response, TrialProceedingResponseBag.from_dict)
+        params = _search_params(
+            q=q, sort=sort, offset=offset, limit=limit, fields=fields, filters=filters,
+            range_filters=range_filters, format=format
+        )
+
+        return await self._get_json(url, TrialProceedingResponseBag.from_dict, params=params)
 
     async def get_trial_proceeding(self, trial_number: str) -> TrialProceedingIdentifierResponseBag:
         """
@@ -1140,8 +1994,7 @@ class USPTOClient:
         """
         url = self._build_url(self._ptab_trials_proceedings_endpoint, trial_number)
 
-        async with self.session.get(url, headers=self.headers) as response:
-            return await self._handle_response(response, TrialProceedingIdentifierResponseBag.from_dict)
+        return await self._get_json(url, TrialProceedingIdentifierResponseBag.from_dict)
 
     async def search_trial_decisions(self, payload: dict) -> TrialDecisionResponseBag:
         """
@@ -1160,8 +2013,7 @@ class USPTOClient:
             USPTOError: If the API request fails (400, 403, 404, 500)
         """
         url = self._build_url(self._ptab_trials_decisions_endpoint, "search")
-        async with self.session.post(url, json=payload, headers=self.headers) as response:
-            return await self._handle_response(response, TrialDecisionResponseBag.from_dict)
+        return await self._post_json(url, payload, TrialDecisionResponseBag.from_dict)
 
     async def search_trial_decisions_get(
         self,
@@ -1210,26 +2062,12 @@ class USPTOClient:
             )
         """
         url = self._build_url(self._ptab_trials_decisions_endpoint, "search")
-        params = {}
-        if q is not None:
-            params['q'] = q
-        if sort is not None:
-            params['sort'] = sort
-        if offset is not None:
-            params['offset'] = offset
-        if limit is not None:
-            params['limit'] = limit
-        if facets is not None:
-            params['facets'] = facets
-        if fields is not None:
-            params['fields'] = fields
-        if filters is not None:
-            params['filters'] = filters
-        if range_filters is not None:
-            params['rangeFilters'] = range_filters
-
-        async with self.session.get(url, params=params, headers=self.headers) as response:
-            return await self._handle_response(response, TrialDecisionResponseBag.from_dict)
+        params = _search_params(
+            q=q, sort=sort, offset=offset, limit=limit, facets=facets, fields=fields,
+            filters=filters, range_filters=range_filters
+        )
+
+        return await self._get_json(url, TrialDecisionResponseBag.from_dict, params=params)
 
     async def search_trial_decisions_download(self, payload: dict) -> TrialDecisionResponseBag:
         """
@@ -1249,8 +2087,7 @@ class USPTOClient:
             USPTOError: If the API request fails (400, 403, 404, 500)
         """
         url = self._build_url(self._ptab_trials_decisions_endpoint, "search", "download")
-        async with self.session.post(url, json=payload, headers=self.headers) as response:
-            return await self._handle_response(response, TrialDecisionResponseBag.from_dict)
+        return await self._post_json(url, payload, TrialDecisionResponseBag.from_dict)
 
     async def search_trial_decisions_download_get(
         self,
@@ -1295,26 +2132,12 @@ class USPTOClient:
             results = await client.search_trial_decisions_download_get(q='IPR', format='csv', limit=100)
         """
         url = self._build_url(self._ptab_trials_decisions_endpoint, "search", "download")
-        params = {}
-        if q is not None:
-            params['q'] = q
-        if sort is not None:
-            params['sort'] = sort
-        if offset is not None:
-            params['offset'] = offset
-        if limit is not None:
-            params['limit'] = limit
-        if fields is not None:
-            params['fields'] = fields
-        if filters is not None:
-            params['filters'] = filters
-        if range_filters is not None:
-            params['rangeFilters'] = range_filters
-        if format is not None:
-            params['format'] = format
-
-        async with self.session.get(url, params=params, headers=self.headers) as response:
-            return await self._handle_response(response, TrialDecisionResponseBag.from_dict)
+        params = _search_params(
+            q=q, sort=sort, offset=offset, limit=limit, fields=fields, filters=filters,
+            range_filters=range_filters, format=format
+        )
+
+        return await self._get_json(url, TrialDecisionResponseBag.from_dict, params=params)
 
     async def get_trial_decision(self, document_identifier: str) -> TrialDecisionIdentifierResponseBag:
         """
@@ -1337,8 +2160,7 @@ class USPTOClient:
         """
         url = self._build_url(self._ptab_trials_decisions_endpoint, document_identifier)
 
-        async with self.session.get(url, headers=self.headers) as response:
-            return await self._handle_response(response, TrialDecisionIdentifierResponseBag.from_dict)
+        return await self._get_json(url, TrialDecisionIdentifierResponseBag.from_dict)
 
     async def get_trial_decisions_by_trial(self, trial_number: str) -> TrialDecisionByTrialResponseBag:
         """
@@ -1366,8 +2188,7 @@ class USPTOClient:
             "decisions"
         )
 
-        async with self.session.get(url, headers=self.headers) as response:
-            return await self._handle_response(response, TrialDecisionByTrialResponseBag.from_dict)
+        return await self._get_json(url, TrialDecisionByTrialResponseBag.from_dict)
 
     async def search_trial_documents(self, payload: dict) -> TrialDocumentResponseBag:
         """
@@ -1386,8 +2207,7 @@ class USPTOClient:
             USPTOError: If the API request fails (400, 403, 404, 500)
         """
         url = self._build_url(self._ptab_trials_documents_endpoint, "search")
-        async with self.session.post(url, json=payload, headers=self.headers) as response:
-            return await self._handle_response(response, TrialDocumentResponseBag.from_dict)
+        return await self._post_json(url, payload, TrialDocumentResponseBag.from_dict)
 
     async def search_trial_documents_get(
         self,
@@ -1436,26 +2256,12 @@ class USPTOClient:
             )
         """
         url = self._build_url(self._ptab_trials_documents_endpoint, "search")
-        params = {}
-        if q is not None:
-            params['q'] = q
-        if sort is not None:
-            params['sort'] = sort
-        if offset is not None:
-            params['offset'] = offset
-        if limit is not None:
-            params['limit'] = limit
-        if facets is not None:
-            params['facets'] = facets
-        if fields is not None:
-            params['fields'] = fields
-        if filters is not None:
-            params['filters'] = filters
-        if range_filters is not None:
-            params['rangeFilters'] = range_filters
-
-        async with self.session.get(url, params=params, headers=self.headers) as response:
-            return await self._handle_response(response, TrialDocumentResponseBag.from_dict)
+        params = _search_params(
+            q=q, sort=sort, offset=offset, limit=limit, facets=facets, fields=fields,
+            filters=filters, range_filters=range_filters
+        )
+
+        return await self._get_json(url, TrialDocumentResponseBag.from_dict, params=params)
 
     async def search_trial_documents_download(self, payload: dict) -> TrialDocumentResponseBag:
         """
@@ -1475,8 +2281,7 @@ class USPTOClient:
             USPTOError: If the API request fails (400, 403, 404, 500)
         """
         url = self._build_url(self._ptab_trials_documents_endpoint, "search", "download")
-        async with self.session.post(url, json=payload, headers=self.headers) as response:
-            return await self._handle_response(response, TrialDocumentResponseBag.from_dict)
+        return await self._post_json(url, payload, TrialDocumentResponseBag.from_dict)
 
     async def search_trial_documents_download_get(
         self,
@@ -1521,26 +2326,12 @@ class USPTOClient:
             results = await client.search_trial_documents_download_get(q='IPR', format='csv', limit=100)
         """
         url = self._build_url(self._ptab_trials_documents_endpoint, "search", "download")
-        params = {}
-        if q is not None:
-            params['q'] = q
-        if sort is not None:
-            params['sort'] = sort
-        if offset is not None:
-            params['offset'] = offset
-        if limit is not None:
-            params['limit'] = limit
-        if fields is not None:
-            params['fields'] = fields
-        if filters is not None:
-            params['filters'] = filters
-        if range_filters is not None:
-            params['rangeFilters'] = range_filters
-        if format is not None:
-            params['format'] = format
-
-        async with self.session.get(url, params=params, headers=self.headers) as response:
-            return await self._handle_response(response, TrialDocumentResponseBag.from_dict)
+        params = _search_params(
+            q=q, sort=sort, offset=offset, limit=limit, fields=fields, filters=filters,
+            range_filters=range_filters, format=format
+        )
+
+        return await self._get_json(url, TrialDocumentResponseBag.from_dict, params=params)
 
     async def get_trial_document(self, document_identifier: str) -> TrialDocumentIdentifierResponseBag:
         """
@@ -1563,8 +2354,7 @@ class USPTOClient:
         """
         url = self._build_url(self._ptab_trials_documents_endpoint, document_identifier)
 
-        async with self.session.get(url, headers=self.headers) as response:
-            return await self._handle_response(response, TrialDocumentIdentifierResponseBag.from_dict)
+        return await self._get_json(url, TrialDocumentIdentifierResponseBag.from_dict)
 
     async def get_trial_documents_by_trial(self, trial_number: str) -> TrialDocumentByTrialResponseBag:
         """
@@ -1592,8 +2382,7 @@ class USPTOClient:
             "documents"
         )
 
-        async with self.session.get(url, headers=self.headers) as response:
-            return await self._handle_response(response, TrialDocumentByTrialResponseBag.from_dict)
+        return await self._get_json(url, TrialDocumentByTrialResponseBag.from_dict)
 
     async def search_appeal_decisions(self, payload: dict) -> AppealDecisionResponseBag:
         """
@@ -1612,8 +2401,7 @@ class USPTOClient:
             USPTOError: If the API request fails (400, 403, 404, 500)
         """
         url = self._build_url(self._ptab_appeals_decisions_endpoint, "search")
-        async with self.session.post(url, json=payload, headers=self.headers) as response:
-            return await self._handle_response(response, AppealDecisionResponseBag.from_dict)
+        return await self._post_json(url, payload, AppealDecisionResponseBag.from_dict)
 
     async def search_appeal_decisions_get(
         self,
@@ -1662,26 +2450,12 @@ class USPTOClient:
             )
         """
         url = self._build_url(self._ptab_appeals_decisions_endpoint, "search")
-        params = {}
-        if q is not None:
-            params['q'] = q
-        if sort is not None:
-            params['sort'] = sort
-        if offset is not None:
-            params['offset'] = offset
-        if limit is not None:
-            params['limit'] = limit
-        if facets is not None:
-            params['facets'] = facets
-        if fields is not None:
-            params['fields'] = fields
-        if filters is not None:
-            params['filters'] = filters
-        if range_filters is not None:
-            params['rangeFilters'] = range_filters
-
-        async with self.session.get(url, params=params, headers=self.headers) as response:
-            return await self._handle_response(response, AppealDecisionResponseBag.from_dict)
+        params = _search_params(
+            q=q, sort=sort, offset=offset, limit=limit, facets=facets, fields=fields,
+            filters=filters, range_filters=range_filters
+        )
+
+        return await self._get_json(url, AppealDecisionResponseBag.from_dict, params=params)
 
     async def search_appeal_decisions_download(self, payload: dict) -> AppealDecisionResponseBag:
         """
@@ -1701,8 +2475,7 @@ class USPTOClient:
             USPTOError: If the API request fails (400, 403, 404, 500)
         """
         url = self._build_url(self._ptab_appeals_decisions_endpoint, "search", "download")
-        async with self.session.post(url, json=payload, headers=self.headers) as response:
-            return await self._handle_response(response, AppealDecisionResponseBag.from_dict)
+        return await self._post_json(url, payload, AppealDecisionResponseBag.from_dict)
 
     async def search_appeal_decisions_download_get(
         self,
@@ -1747,26 +2520,12 @@ class USPTOClient:
             results = await client.search_appeal_decisions_download_get(q='Final', format='csv', limit=100)
         """
         url = self._build_url(self._ptab_appeals_decisions_endpoint, "search", "download")
-        params = {}
-        if q is not None:
-            params['q'] = q
-        if sort is not None:
-            params['sort'] = sort
-        if offset is not None:
-            params['offset'] = offset
-        if limit is not None:
-            params['limit'] = limit
-        if fields is not None:
-            params['fields'] = fields
-        if filters is not None:
-            params['filters'] = filters
-        if range_filters is not None:
-            params['rangeFilters'] = range_filters
-        if format is not None:
-            params['format'] = format
-
-        async with self.session.get(url, params=params, headers=self.headers) as response:
-            return await self._handle_response(response, AppealDecisionResponseBag.from_dict)
+        params = _search_params(
+            q=q, sort=sort, offset=offset, limit=limit, fields=fields, filters=filters,
+            range_filters=range_filters, format=format
+        )
+
+        return await self._get_json(url, AppealDecisionResponseBag.from_dict, params=params)
 
     async def get_appeal_decision(self, document_identifier: str) -> AppealDecisionIdentifierResponseBag:
         """
@@ -1789,8 +2548,7 @@ class USPTOClient:
         """
         url = self._build_url(self._ptab_appeals_decisions_endpoint, document_identifier)
 
-        async with self.session.get(url, headers=self.headers) as response:
-            return await self._handle_response(response, AppealDecisionIdentifierResponseBag.from_dict)
+        return await self._get_json(url, AppealDecisionIdentifierResponseBag.from_dict)
 
     async def get_appeal_decisions_by_appeal(self, appeal_number: str) -> AppealDecisionByAppealResponseBag:
         """
@@ -1818,8 +2576,7 @@ class USPTOClient:
             "decisions"
         )
 
-        async with self.session.get(url, headers=self.headers) as response:
-            return await self._handle_response(response, AppealDecisionByAppealResponseBag.from_dict)
+        return await self._get_json(url, AppealDecisionByAppealResponseBag.from_dict)
 
     async def search_interference_decisions(self, payload: dict) -> InterferenceDecisionResponseBag:
         """
@@ -1838,8 +2595,7 @@ class USPTOClient:
             USPTOError: If the API request fails (400, 403, 404, 500)
         """
         url = self._build_url(self._ptab_interferences_decisions_endpoint, "search")
-        async with self.session.post(url, json=payload, headers=self.headers) as response:
-            return await self._handle_response(response, InterferenceDecisionResponseBag.from_dict)
+        return await self._post_json(url, payload, InterferenceDecisionResponseBag.from_dict)
 
     async def search_interference_decisions_get(
         self,
@@ -1888,26 +2644,12 @@ class USPTOClient:
             )
         """
         url = self._build_url(self._ptab_interferences_decisions_endpoint, "search")
-        params = {}
-        if q is not None:
-            params['q'] = q
-        if sort is not None:
-            params['sort'] = sort
-        if offset is not None:
-            params['offset'] = offset
-        if limit is not None:
-            params['limit'] = limit
-        if facets is not None:
-            params['facets'] = facets
-        if fields is not None:
-            params['fields'] = fields
-        if filters is not None:
-            params['filters'] = filters
-        if range_filters is not None:
-            params['rangeFilters'] = range_filters
-
-        async with self.session.get(url, params=params, headers=self.headers) as response:
-            return await self._handle_response(response, InterferenceDecisionResponseBag.from_dict)
+        params = _search_params(
+            q=q, sort=sort, offset=offset, limit=limit, facets=facets, fields=fields,
+            filters=filters, range_filters=range_filters
+        )
+
+        return await self._get_json(url, InterferenceDecisionResponseBag.from_dict, params=params)
 
     async def search_interference_decisions_download(self, payload: dict) -> InterferenceDecisionResponseBag:
         """
@@ -1927,8 +2669,7 @@ class USPTOClient:
             USPTOError: If the API request fails (400, 403, 404, 500)
         """
         url = self._build_url(self._ptab_interferences_decisions_endpoint, "search", "download")
-        async with self.session.post(url, json=payload, headers=self.headers) as response:
-            return await self._handle_response(response, InterferenceDecisionResponseBag.from_dict)
+        return await self._post_json(url, payload, InterferenceDecisionResponseBag.from_dict)
 
     async def search_interference_decisions_download_get(
         self,
@@ -1973,26 +2714,12 @@ class USPTOClient:
             results = await client.search_interference_decisions_download_get(q='Final', format='csv', limit=100)
         """
         url = self._build_url(self._ptab_interferences_decisions_endpoint, "search", "download")
-        params = {}
-        if q is not None:
-            params['q'] = q
-        if sort is not None:
-            params['sort'] = sort
-        if offset is not None:
-            params['offset'] = offset
-        if limit is not None:
-            params['limit'] = limit
-        if fields is not None:
-            params['fields'] = fields
-        if filters is not None:
-            params['filters'] = filters
-        if range_filters is not None:
-            params['rangeFilters'] = range_filters
-        if format is not None:
-            params['format'] = format
-
-        async with self.session.get(url, params=params, headers=self.headers) as response:
-            return await self._handle_response(response, InterferenceDecisionResponseBag.from_dict)
+        params = _search_params(
+            q=q, sort=sort, offset=offset, limit=limit, fields=fields, filters=filters,
+            range_filters=range_filters, format=format
+        )
+
+        return await self._get_json(url, InterferenceDecisionResponseBag.from_dict, params=params)
 
     async def get_interference_decision(self, document_identifier: str) -> InterferenceDecisionIdentifierResponseBag:
         """
@@ -2015,8 +2742,7 @@ class USPTOClient:
         """
         url = self._build_url(self._ptab_interferences_decisions_endpoint, document_identifier)
 
-        async with self.session.get(url, headers=self.headers) as response:
-            return await self._handle_response(response, InterferenceDecisionIdentifierResponseBag.from_dict)
+        return await self._get_json(url, InterferenceDecisionIdentifierResponseBag.from_dict)
 
     async def get_interference_decisions_by_interference(self, interference_number: str) -> InterferenceDecisionByInterferenceResponseBag:
         """
@@ -2044,8 +2770,7 @@ class USPTOClient:
             "decisions"
         )
 
-        async with self.session.get(url, headers=self.headers) as response:
-            return await self._handle_response(response, InterferenceDecisionByInterferenceResponseBag.from_dict)
+        return await self._get_json(url, InterferenceDecisionByInterferenceResponseBag.from_dict)
 
     async def search_dataset_products_get(
         self,
@@ -2094,26 +2819,12 @@ class USPTOClient:
             )
         """
         url = self._build_url(self._bulk_datasets_endpoint, "search")
-        params = {}
-        if q is not None:
-            params['q'] = q
-        if sort is not None:
-            params['sort'] = sort
-        if offset is not None:
-            params['offset'] = offset
-        if limit is not None:
-            params['limit'] = limit
-        if facets is not None:
-            params['facets'] = facets
-        if fields is not None:
-            params['fields'] = fields
-        if filters is not None:
-            params['filters'] = filters
-        if range_filters is not None:
-            params['rangeFilters'] = range_filters
-
-        async with self.session.get(url, params=params, headers=self.headers) as response:
-            return await self._handle_response(response, DatasetProductSearchResponseBag.from_dict)
+        params = _search_params(
+            q=q, sort=sort, offset=offset, limit=limit, facets=facets, fields=fields,
+            filters=filters, range_filters=range_filters
+        )
+
+        return await self._get_json(url, DatasetProductSearchResponseBag.from_dict, params=params)
 
     async def get_dataset_product(
         self,
@@ -2182,8 +2893,7 @@ class USPTOClient:
         if latest is not None:
             params['latest'] = latest
 
-        async with self.session.get(url, params=params, headers=self.headers) as response:
-            return await self._handle_response(response, DatasetProductResponseBag.from_dict)
+        return await self._get_json(url, DatasetProductResponseBag.from_dict, params=params)
 
     async def get_dataset_file(self, product_identifier: str, file_name: str) -> DatasetFileResponseBag:
         """
@@ -2207,9 +2917,9 @@ class USPTOClient:
         """
         url = self._build_url(self._bulk_datasets_endpoint, "files", product_identifier, file_name)
 
-        async with self.session.get(url, headers=self.headers) as response:
-            return await self._handle_response(response, DatasetFileResponseBag.from_dict)
+        return await self._get_json(url, DatasetFileResponseBag.from_dict)
 
+    @_memoized
     async def get_app_metadata(self, application_number: str) -> ApplicationMetadataResponse:
         """
         Get application metadata directly from the /meta-data endpoint using an application number.
@@ -2228,8 +2938,7 @@ class USPTOClient:
         # Build URL for the meta-data endpoint: /api/v1/patent/applications/{applicationNumberText}/meta-data
         url = self._build_url(self._patent_applications_endpoint, application_number, "meta-data")
         
-        async with self.session.get(url, headers=self.headers) as response:
-            return await self._handle_response(response, ApplicationMetadataResponse.from_dict)
+        return await self._conditional_get(url, ApplicationMetadataResponse.from_dict)
 
     async def get_app_metadata_from_patent_number(self, patent_number: str) -> Optional[ApplicationMetadataResponse]:
         """
@@ -2248,57 +2957,109 @@ class USPTOClient:
         Raises:
             USPTOError: If the API request fails
         """
-        # Sanitize the patent number by removing "US" prefix and any non-digit characters
-        sanitized_patent = ''.join(c for c in patent_number if c.isdigit())
+        # Sanitize the patent number by removing "US" prefix and any non-digit characters,
+        # so every spelling of the same patent shares one cached search
+        application_number = await self._application_number_for_patent(patent_number.translate(_NON_DIGITS))
+        if application_number:
+            # Use the direct meta-data endpoint with the found application number
+            return await self.get_app_metadata(application_number)
         
+        return None
+
+    @_memoized
+    async def _application_number_for_patent(self, sanitized_patent: str) -> Optional[str]:
+        """Resolve a digits-only patent number to its application number via the search endpoint."""
         # Create the search payload to find the application number from the patent number
-        payload = {
-            "q" : "applicationMetaData.patentNumber:" + sanitized_patent,
-            "filters": [
-                {
-                    "name": "applicationMetaData.applicationTypeLabelName",
-                    "value": ["Utility"]
-                },
-                {
-                    "name": "applicationMetaData.publicationCategoryBag",
-                    "value": ["Granted/Issued"]
-                }
-            ],
-            "sort": [
-                {
-                    "field": "applicationMetaData.filingDate",
-                    "order": "desc"
-                }
-            ],
-            "pagination": {
-                "offset": 0,
-                "limit": 25
-            },
-            "fields": ["applicationNumberText", "applicationMetaData"],
-            "facets": [
-                "applicationMetaData.applicationTypeLabelName"
-            ]        
-        }
+        payload = {"q": f"applicationMetaData.patentNumber:{sanitized_patent}", **_PATENT_LOOKUP_TEMPLATE}
         
         # Make the search request to find the application number
         response = await self.search_patent_applications(payload)
         
-        # Check if we got results
-        if response.get('count', 0) > 0 and 'patentFileWrapperDataBag' in response:
-            # Extract the application number from the first result
-            application_number = response['patentFileWrapperDataBag'][0].get('applicationNumberText')
-            
-            if application_number:
-                # Use the direct meta-data endpoint with the found application number
-                return await self.get_app_metadata(application_number)
+        # Extract the application number from the first result, if there is one
+        hits = response.get('patentFileWrapperDataBag')
+        if hits:
+            return hits[0].get('applicationNumberText')
         
         return None
 
+    async def get_app_metadata_from_patent_numbers(
+        self,
+        patent_numbers: Sequence[str]
+    ) -> Dict[str, Optional[ApplicationMetadataResponse]]:
+        """
+        Get the application metadata for several patent numbers.
+
+        Batch version of get_app_metadata_from_patent_number: patent numbers are resolved
+        to application numbers PATENT_LOOKUP_BATCH_SIZE at a time with one OR search per
+        batch (fetching further pages only if some patent numbers are still missing from
+        the results), and the meta-data requests are then made concurrently. This takes a
+        handful of searches instead of one per patent number.
+
+        Args:
+            patent_numbers (Sequence[str]): Patent numbers to look up (e.g., ["US9,022,434", "11989999"])
+
+        Returns:
+            Dict[str, Optional[ApplicationMetadataResponse]]: Maps each patent number, as given,
+                to its application metadata, or None if no granted utility application was found
+
+        Raises:
+            USPTOError: If an API request fails
+
+        Example:
+            results = await client.get_app_metadata_from_patent_numbers(["US9,022,434", "11,989,999"])
+            for patent_number, metadata in results.items():
+                if metadata:
+                    print(patent_number, metadata.application_number)
+        """
+        sanitized = {patent_number: patent_number.translate(_NON_DIGITS) for patent_number in patent_numbers}
+        unique_numbers = list(dict.fromkeys(number for number in sanitized.values() if number))
+        batch_size = self.PATENT_LOOKUP_BATCH_SIZE
+        batches = [unique_numbers[i:i + batch_size] for i in range(0, len(unique_numbers), batch_size)]
+
+        def hit_patent_number(hit):
+            patent_number = (hit.get('applicationMetaData') or {}).get('patentNumber')
+            return str(patent_number) if patent_number else None
+
+        async def resolve(batch):
+            query = " OR ".join(f"applicationMetaData.patentNumber:{number}" for number in batch)
+            unresolved = set(batch)
+            hits = []
+            while True:
+                payload = {
+                    **_PATENT_LOOKUP_TEMPLATE,
+                    "q": query,
+                    "pagination": {"offset": len(hits), "limit": self.PATENT_LOOKUP_PAGE_SIZE}
+                }
+                response = await self.search_patent_applications(payload)
+                page = response.get('patentFileWrapperDataBag') or []
+                hits.extend(page)
+                unresolved.difference_update(hit_patent_number(hit) for hit in page)
+                # Only the first hit per patent number is used, so stop once each has one
+                if not page or not unresolved or len(hits) >= response.get('count', 0):
+                    return hits
+
+        # Patent number -> application number; results are sorted newest filing first,
+        # so the first hit for a patent number matches get_app_metadata_from_patent_number
+        application_numbers = {}
+        for hits in await asyncio.gather(*(resolve(batch) for batch in batches)):
+            for hit in hits:
+                patent_number = hit_patent_number(hit)
+                application_number = hit.get('applicationNumberText')
+                if patent_number and application_number:
+                    application_numbers.setdefault(patent_number, application_number)
+
+        found = [number for number in unique_numbers if number in application_numbers]
+        metadata = await asyncio.gather(*(self.get_app_metadata(application_numbers[number]) for number in found))
+        by_patent_number = dict(zip(found, metadata))
+
+        return {patent_number: by_patent_number.get(number) for patent_number, number in sanitized.items()}
+
     async def search_status_codes_get(
         self,
         q: Optional[str] = None,
         offset: Optional[int] = None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        force_refresh: bool = False
     ) -> StatusCodeCollection:
         """
         Search for patent application status codes using query parameters (GET method).
@@ -2311,6 +3072,8 @@ class USPTOClient:
                               Example: 'applicationStatusDescriptionText:Preexam'
             offset (int, optional): Position in dataset to start from. Default: 0
             limit (int, optional): Number of results to return. Default: 25
+            force_refresh (bool, optional): Bypass the on-disk cache (when the client was
+                                            created with a cache_dir) and fetch from the API.
 
         Returns:
             StatusCodeCollection: Collection of status codes matching the search criteria
@@ -2331,16 +3094,70 @@ class USPTOClient:
         url = self._build_url(self._status_codes_endpoint)
 
         # Build query parameters, only including non-None values
-        params = {}
-        if q is not None:
-            params['q'] = q
-        if offset is not None:
-            params['offset'] = offset
-        if limit is not None:
-            params['limit'] = limit
+        params = _search_params(q=q, offset=offset, limit=limit)
+
+        # Status codes are static reference data, so they can be served from disk.
+        # File access runs in a worker thread so it does not block the event loop.
+        cache_key = ("status_codes", limit, offset, q)
+        if self.cache_dir and not force_refresh:
+            cached = await asyncio.to_thread(self._read_cache, "status_codes", cache_key, self.STATUS_CODES_CACHE_TTL)
+            if cached is not None:
+                return StatusCodeCollection.from_dict(cached)
+
+        data = await self._get_json(url, lambda x: x, params=params)
+
+        if self.cache_dir:
+            await asyncio.to_thread(self._write_cache, "status_codes", cache_key, data)
+        return StatusCodeCollection.from_dict(data)
+
+    async def iter_status_codes(self, q: Optional[str] = None, page_size: int = 25) -> AsyncIterator[StatusCode]:
+        """
+        Iterate over every patent application status code, one page at a time.
+
+        Pages are requested lazily as the caller consumes them. While the caller works
+        through one page, the next is prefetched in the background, so at most two
+        pages are held in memory regardless of the total count.
 
-        async with self.session.get(url, params=params, headers=self.headers) as response:
-            return await self._handle_response(response, StatusCodeCollection.from_dict)
+        Args:
+            q (str, optional): Search query applied server-side, as in search_status_codes_get.
+                              The API then reports the filtered total, so iteration stops
+                              after the matching pages instead of walking every code.
+            page_size (int, optional): Number of status codes to request per page. Default: 25
+
+        Yields:
+            StatusCode: Each status code, in the order returned by the API
+
+        Raises:
+            USPTOError: If an API request fails
+
+        Example:
+            async for status_code in client.iter_status_codes(page_size=50):
+                print(status_code.application_status_code, status_code.application_status_description_text)
+
+            # Only codes whose description mentions "Patent"
+            async for status_code in client.iter_status_codes(q='applicationStatusDescriptionText:Patent'):
+                print(status_code.application_status_code)
+        """
+        offset = 0
+        page_task = asyncio.ensure_future(self.search_status_codes_get(q=q, offset=offset, limit=page_size))
+        try:
+            while page_task is not None:
+                page = await page_task
+                page_task = None
+                offset += page_size
+                if page.status_codes and offset < page.count:
+                    # Request the next page while the caller works through this one
+                    page_task = asyncio.ensure_future(
+                        self.search_status_codes_get(q=q, offset=offset, limit=page_size)
+                    )
+                for status_code in page.status_codes:
+                    yield status_code
+        finally:
+            # The caller stopped early (or a request failed): drop the prefetched page
+            if page_task is not None:
+                page_task.cancel()
+                if page_task.done() and not page_task.cancelled():
+                    page_task.exception()
 
     async def search_status_codes(self, payload: dict) -> StatusCodeCollection:
         """
@@ -2370,5 +3187,4 @@ class USPTOClient:
             result = await client.search_status_codes(payload)
         """
         url = self._build_url(self._status_codes_endpoint)
-        async with self.session.post(url, json=payload, headers=self.headers) as response:
-            return await self._handle_response(response, StatusCodeCollection.from_dict)
+        return await self._post_json(url, payload, StatusCodeCollection.from_dict)
@@ -22,7 +22,8 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 '''
 from dataclasses import dataclass, field
-from typing import List, Optional
+from functools import cached_property
+from typing import Dict, List, Optional
 from datetime import datetime
 import re
 
@@ -52,6 +53,11 @@ class PatentDocument:
     direction_category: str
     download_options: List[DownloadOption] = field(default_factory=list)
 
+    @cached_property
+    def download_options_by_mime_type(self) -> Dict[str, DownloadOption]:
+        """Download options keyed by mime type, built on first access"""
+        return {opt.mime_type: opt for opt in self.download_options}
+
     @classmethod
     def from_dict(cls, data: dict) -> 'PatentDocument':
         # Format the timezone offset to include a colon
@@ -34,6 +34,9 @@ class StatusCode:
         application_status_code: The numeric status code
         application_status_description_text: The description of the status code
     """
+    # No per-instance __dict__: full status-code listings hold hundreds of these
+    __slots__ = ('application_status_code', 'application_status_description_text')
+
     application_status_code: int
     application_status_description_text: str
 
@@ -68,6 +71,16 @@ class StatusCodeCollection:
     status_codes: List[StatusCode] = field(default_factory=list)
     request_identifier: Optional[str] = None
 
+    @property
+    def codes(self) -> List[int]:
+        """Numeric status codes, in the same order as status_codes."""
+        return [sc.application_status_code for sc in self.status_codes]
+
+    @property
+    def descriptions(self) -> List[str]:
+        """Status descriptions, in the same order as status_codes."""
+        return [sc.application_status_description_text for sc in self.status_codes]
+
     @classmethod
     def from_dict(cls, data: dict) -> 'StatusCodeCollection':
         """
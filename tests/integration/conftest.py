@@ -2,50 +2,426 @@
 Shared fixtures for integration tests.
 Integration tests require USPTO_API_KEY environment variable to be set.
 """
+import asyncio
 import os
+import statistics
+import time
+from collections import deque
+from contextlib import asynccontextmanager, nullcontext
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, get_type_hints
+from unittest.mock import AsyncMock, Mock
 import pytest
-import aiohttp
 from dotenv import load_dotenv
-from uspto_odp.controller.uspto_odp_client import USPTOClient
+from uspto_odp.controller.uspto_odp_client import USPTOClient, USPTOError, RateLimiter, _AsyncTTLCache
+
+try:
+    import uvloop  # Installed by the speedups extra; not available on Windows
+except ImportError:
+    uvloop = None
+
+try:
+    import vcr  # Installed with pytest-recording
+except ImportError:
+    vcr = None
 
 # Load environment variables from .env if present
 load_dotenv()
 
+# Requests per second shared by the whole integration run; override with USPTO_RPS.
+# Under pytest-xdist each worker gets an equal share, so the run as a whole stays
+# within the same budget however many workers there are.
+USPTO_RPS = float(os.environ.get("USPTO_RPS", USPTOClient.RATE_LIMIT))
+WORKER_COUNT = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", 1))
+# Requests per minute allowed by the API key's quota; override with USPTO_RPM.
+# Split across xdist workers in the same way as USPTO_RPS.
+USPTO_RPM = float(os.environ.get("USPTO_RPM", 60 * USPTO_RPS))
+
+# Recorded responses for pytest-recording, one directory per test module
+CASSETTE_DIR = os.path.join(os.path.dirname(__file__), "cassettes")
+# Cassettes of the session-scoped fixtures that make requests
+SESSION_CASSETTE_DIR = os.path.join(CASSETTE_DIR, "session")
+# Sent instead of a real key when replaying; the key is filtered out of the cassettes
+REPLAY_API_KEY = "replayed-from-cassette"
+
+# pytest cache key under which the sample dataset product identifier is kept between runs
+PRODUCT_ID_CACHE_KEY = "uspto_odp/sample_product_identifier"
+
+# Known-bad identifiers probed by the not-found tests, which the API answers with a 404
+NOT_FOUND_PROBES = ("99999999", "invalid-document-identifier-12345", "invalid-product-identifier-12345")
+
+
+class NotFoundSession:
+    """
+    Stand-in for the aiohttp session of the not-found tests' client. A request
+    naming one of NOT_FOUND_PROBES in its URL or JSON body gets the API's 404
+    payload; any other request fails the test, so a request sent by mistake is
+    never answered with a canned 404.
+    """
+    closed = False
+
+    def get(self, url, **kwargs):
+        return self._respond("GET", url, kwargs.get("json"))
+
+    def post(self, url, **kwargs):
+        return self._respond("POST", url, kwargs.get("json"))
+
+    @asynccontextmanager
+    async def _respond(self, method, url, payload):
+        if not any(probe in url or probe in repr(payload) for probe in NOT_FOUND_PROBES):
+            raise AssertionError(f"Unexpected {method} {url} from a not-found test; only NOT_FOUND_PROBES are stubbed")
+        response = Mock(status=404, headers={}, content_length=None)
+        response.json = AsyncMock(
+            return_value={"code": 404, "error": "Not Found", "errorDetails": "No matching records found"}
+        )
+        yield response
+
+
+class SlidingWindowLimiter(RateLimiter):
+    """
+    Token-bucket limiter that also keeps a sliding one-minute window of request
+    times, so the run stays under the per-minute quota up front instead of
+    finding it with a 429. Callers only wait once the window is full.
+    on_acquire, if given, is called once a request has been let through.
+    """
+    def __init__(self, rate, rpm, window=60.0, on_acquire=None):
+        super().__init__(rate=rate)
+        self.rpm = rpm
+        self.window = window
+        self.times = deque()
+        self.on_acquire = on_acquire
+
+    async def wait_if_throttled(self):
+        """Wait until the window has room for another request and record it."""
+        while True:
+            now = time.monotonic()
+            while self.times and now - self.times[0] >= self.window:
+                self.times.popleft()
+            if len(self.times) < self.rpm:
+                self.times.append(now)
+                return
+            await asyncio.sleep(self.window - (now - self.times[0]))
+
+    async def acquire(self):
+        await super().acquire()
+        await self.wait_if_throttled()
+        if self.on_acquire is not None:
+            self.on_acquire()
+
+
+class AIMDController:
+    """
+    Additive-increase / multiplicative-decrease cap on requests in flight.
+
+    Stands in for the client's fixed in-flight semaphore. The cap grows by alpha
+    after each response while the median recent latency is within target_latency,
+    and is multiplied by beta on a timeout, 429 or 5xx, so the suite tracks what
+    the API can currently take instead of using a fixed pace. Latency is timed
+    from request_started(), called once the rate limiter lets the request through,
+    so time spent waiting on the limiter does not count against the server.
+    """
+    def __init__(self, alpha=0.5, beta=0.5, target_latency=2.0, min_limit=1, max_limit=32, initial=4):
+        self.alpha = alpha
+        self.beta = beta
+        self.target_latency = target_latency
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = float(initial)
+        self.latencies = deque(maxlen=20)
+        self._in_flight = 0
+        self._started = {}
+        self._condition = None
+        self._loop = None
+
+    def _get_condition(self):
+        # Created on first use, inside the session's event loop (Python 3.9 binds it on construction)
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+            self._loop = asyncio.get_running_loop()
+        return self._condition
+
+    async def __aenter__(self):
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+
+    def request_started(self):
+        """Start the latency clock of the current task's request."""
+        self._started[asyncio.current_task()] = self._loop.time()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        started = self._started.pop(asyncio.current_task(), None)
+        # is_retryable also accepts a status code given as a string in the error payload
+        overloaded = isinstance(exc, asyncio.TimeoutError) or (isinstance(exc, USPTOError) and exc.is_retryable)
+        if overloaded:
+            self.limit = max(self.min_limit, self.limit * self.beta)
+        elif started is not None:
+            # Requests that never got past the rate limiter have no latency to record
+            self.latencies.append(self._loop.time() - started)
+            if statistics.median(self.latencies) <= self.target_latency:
+                self.limit = min(self.max_limit, self.limit + self.alpha)
+        condition = self._get_condition()
+        async with condition:
+            self._in_flight -= 1
+            condition.notify_all()
+
+
+def pytest_addoption(parser):
+    """
+    Register --no-cache-identifier, read by the sample_product_identifier fixture.
+    """
+    parser.addoption(
+        "--no-cache-identifier",
+        action="store_true",
+        default=False,
+        help="Look up the sample dataset product identifier again instead of reusing the one kept in pytest's cache."
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Replay integration tests from their module's cassettes when pytest-recording
+    is installed, and record every integration test when --record-mode is given.
+    Tests left to run live are skipped without USPTO_API_KEY, so a run without
+    credentials still replays whatever has been recorded.
+    """
+    if not config.pluginmanager.hasplugin("recording"):
+        return
+    recording = config.getoption("--record-mode") is not None
+    has_api_key = bool(os.environ.get("USPTO_API_KEY", "").strip())
+    skip_live = pytest.mark.skip(reason="USPTO_API_KEY environment variable not set and no cassette to replay")
+    for item in items:
+        if not item.get_closest_marker("integration"):
+            continue
+        module_dir = os.path.join(CASSETTE_DIR, item.module.__name__.rsplit(".", 1)[-1])
+        if recording or os.path.isdir(module_dir):
+            item.add_marker(pytest.mark.vcr)
+        elif not has_api_key and "client" in item.fixturenames:
+            item.add_marker(skip_live)
+
 
 @pytest.fixture(scope="session")
-def api_key():
+def vcr_config():
+    """
+    pytest-recording settings. The API key is never written to a cassette.
+    """
+    return {
+        "filter_headers": ["X-API-KEY"],
+        "allow_playback_repeats": True,
+        "decode_compressed_response": True,
+    }
+
+
+@pytest.fixture(scope="session")
+def record_mode(request):
+    """
+    Only replay recorded requests, failing on any request missing from a cassette,
+    unless --record-mode is given (e.g. --record-mode=new_episodes to record new
+    tests, or --record-mode=rewrite to re-record everything).
+    """
+    return request.config.getoption("--record-mode") or "none"
+
+
+@pytest.fixture(scope="session")
+def fixture_cassette(request, vcr_config, record_mode):
+    """
+    Fixture providing fixture_cassette(fixture_request), a context manager for
+    module- and session-scoped fixtures that make requests. Those run outside any
+    test's cassette, so their requests are recorded to and replayed from a cassette
+    named after the fixture: in the module's cassette directory, or in
+    cassettes/session/ for session-scoped fixtures. Does nothing when the fixture
+    is neither being recorded nor has a cassette to replay.
+    """
+    enabled = vcr is not None and request.config.pluginmanager.hasplugin("recording")
+    recording = enabled and request.config.getoption("--record-mode") is not None
+
+    def use(fixture_request):
+        if not enabled:
+            return nullcontext()
+        module = getattr(fixture_request, "module", None)  # Not available to session-scoped fixtures
+        if module is None:
+            directory = SESSION_CASSETTE_DIR
+        else:
+            directory = os.path.join(CASSETTE_DIR, module.__name__.rsplit(".", 1)[-1])
+        path = os.path.join(directory, f"{fixture_request.fixturename}.yaml")
+        if not recording and not os.path.exists(path):
+            return nullcontext()
+        return vcr.use_cassette(path, record_mode=record_mode, **vcr_config)
+    return use
+
+
+@pytest.fixture(autouse=True)
+def isolate_response_cache(request, response_cache):
+    """
+    Start every recorded or replayed test with an empty memo cache, so the
+    requests on a test's cassette do not depend on which tests ran before it.
+    """
+    if request.node.get_closest_marker("vcr"):
+        response_cache.clear()
+
+
+@pytest.fixture(scope="module")
+def vcr_cassette_dir(request):
+    return os.path.join(CASSETTE_DIR, request.module.__name__.rsplit(".", 1)[-1])
+
+
+if uvloop is not None:
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """
+        Run the integration tests on uvloop when it is installed; otherwise
+        pytest-asyncio's default event loop is used. Applies to every test under
+        tests/integration, since pytest-asyncio requires a mapping for each item.
+        """
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+def api_key(request):
     """
     Fixture that provides the USPTO API key from environment.
-    Skips tests if API key is not set.
+    Without one, replayed runs get a placeholder key, since the API is never
+    called; otherwise tests are skipped.
     """
     api_key = os.environ.get("USPTO_API_KEY")
     if not api_key or not api_key.strip():
-        pytest.skip("USPTO_API_KEY environment variable not set. Skipping integration tests.")
+        replaying = (
+            request.config.pluginmanager.hasplugin("recording")
+            and request.config.getoption("--record-mode") is None
+        )
+        if not replaying:
+            pytest.skip("USPTO_API_KEY environment variable not set. Skipping integration tests.")
+        return REPLAY_API_KEY
     return api_key
 
 
-@pytest.fixture
-async def client(api_key):
+@pytest.fixture(scope="session")
+def rate_limiter(concurrency_controller):
+    """
+    Fixture providing one limiter for the whole test session, seeded from the
+    per-second and per-minute quotas. Requests only wait once the burst
+    allowance or the minute's window is spent, instead of every test sleeping
+    up front. It starts the concurrency controller's latency clock for each
+    request it lets through.
+    """
+    return SlidingWindowLimiter(
+        rate=USPTO_RPS / WORKER_COUNT,
+        rpm=USPTO_RPM / WORKER_COUNT,
+        on_acquire=concurrency_controller.request_started
+    )
+
+
+@pytest.fixture(scope="session")
+def concurrency_controller():
+    """
+    Fixture providing one adaptive in-flight cap for the whole test session.
+    """
+    return AIMDController()
+
+
+@pytest.fixture(scope="session")
+def response_cache():
+    """
+    Fixture providing one memo cache for the whole test session, so per-application
+    lookups repeated across tests (same endpoint and application number) are only
+    requested once. Errors are never cached.
+    """
+    return _AsyncTTLCache(ttl=3600, maxsize=USPTOClient.MEMO_MAXSIZE)
+
+
+@pytest.fixture(scope="session")
+async def client(api_key, rate_limiter, concurrency_controller, response_cache):
     """
-    Fixture that provides a USPTOClient instance with real aiohttp session.
-    Automatically closes the session after the test.
+    Fixture that provides one USPTOClient instance for the whole test session.
+    The client creates its own session, so requests use its tuned connector
+    (keep-alive, DNS cache, per-host limit) rather than aiohttp's defaults, and
+    every test reuses the same pooled connections.
+    Every request goes through the session-wide rate limiter and adaptive
+    concurrency cap, and memoized lookups share the session-wide cache.
+    Automatically closes the session at the end of the test run.
     """
-    session = aiohttp.ClientSession()
-    client = USPTOClient(api_key=api_key, session=session)
-    yield client
-    await session.close()
+    async with USPTOClient(api_key=api_key, concurrency_controller=concurrency_controller) as client:
+        client.limiter = rate_limiter
+        client.cache = response_cache
+        yield client
+
+
+@pytest.fixture(scope="session")
+async def sample_product_identifier(client, request, fixture_cassette):
+    """
+    Fixture providing the identifier of one bulk dataset product. The lookup is
+    stored in pytest's cache, so later runs reuse it without a request; run with
+    --cache-clear or --no-cache-identifier to look it up again. When the
+    lookup has a cassette, the recorded identifier is used instead, since the
+    dataset tests' cassettes were recorded with it.
+    Skips the test if no product can be found.
+    """
+    cache = getattr(request.config, "cache", None)  # None when the cacheprovider plugin is disabled
+    fresh = request.config.getoption("--no-cache-identifier")
+    with fixture_cassette(request) as cassette:
+        if cache is not None and cassette is None and not fresh:
+            product_identifier = cache.get(PRODUCT_ID_CACHE_KEY, None)
+            if product_identifier:
+                return product_identifier
+        search_result = await client.search_dataset_products_get(limit=1)
+    if not search_result.dataset_product_bag:
+        pytest.skip("No dataset products found to test with")
+    product_identifier = search_result.dataset_product_bag[0].product_identifier
+    if not product_identifier:
+        pytest.skip("No product identifier found in search results")
+    if cache is not None:
+        cache.set(PRODUCT_ID_CACHE_KEY, product_identifier)
+    return product_identifier
 
 
 @pytest.fixture
+def not_found_client(request):
+    """
+    Fixture providing a client for the not-found tests that probe known-bad
+    identifiers. The API's answer to those never changes, so by default the
+    client's session is a NotFoundSession: no network, no rate-limit wait and no
+    API quota spent. Set USPTO_LIVE_NOT_FOUND=1 to use the shared live client
+    and check the API's real 404 instead.
+    """
+    if os.environ.get("USPTO_LIVE_NOT_FOUND"):
+        return request.getfixturevalue("client")
+    return USPTOClient(api_key="not-found-probe", session=NotFoundSession())
+
+
+@pytest.fixture(scope="session")
+def str_fields():
+    """
+    Fixture providing str_fields(model), the names of the model's fields annotated
+    as (optional) strings, for the type checks driven by type hints.
+    Each model's hints are resolved once per session.
+    """
+    @lru_cache(maxsize=None)
+    def str_fields(model):
+        return tuple(name for name, hint in get_type_hints(model).items() if hint in (str, Optional[str]))
+    return str_fields
+
+
+@pytest.fixture(scope="session")
 def known_application_numbers():
     """
     Fixture providing known valid application numbers for testing.
+    Read-only, since one mapping is shared by the whole test session.
     """
-    return {
+    return MappingProxyType({
         "utility": "14412875",
         "utility_2": "18382093",
         "pct": "PCTUS2004027676",
-    }
+    })
+
+
+@pytest.fixture(scope="session")
+def utility_app(known_application_numbers):
+    """
+    Fixture providing the known utility application number used by most tests.
+    """
+    return known_application_numbers["utility"]
 
 
 @pytest.fixture
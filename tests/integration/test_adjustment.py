@@ -3,7 +3,6 @@ Integration tests for adjustment endpoint.
 Requires USPTO_API_KEY environment variable to be set.
 """
 import pytest
-import asyncio
 from uspto_odp.controller.uspto_odp_client import USPTOError
 
 
@@ -59,8 +58,6 @@ async def test_get_adjustment_verify_structure(client, known_application_numbers
             assert hasattr(pta, 'adjustment_reason_codes')
             assert hasattr(pta, 'adjustment_reason_descriptions')
     
-    await asyncio.sleep(1)  # Rate limiting
-    
     print(f"✓ Verified adjustment structure for application {serial_number}")
 
 
@@ -79,7 +76,6 @@ async def test_get_adjustment_multiple_applications(client, known_application_nu
     for app_num in applications:
         result = await client.get_adjustment(app_num)
         results.append(result)
-        await asyncio.sleep(1)  # Rate limiting
     
     # Verify all requests succeeded
     for i, result in enumerate(results):
@@ -101,7 +97,7 @@ async def test_get_adjustment_not_found(client):
         await client.get_adjustment(invalid_app)
     
     # Error code may be string or int depending on API response
-    assert exc_info.value.code == 404 or str(exc_info.value.code) == "404"
+    assert exc_info.value.code in (404, "404")
     assert "404" in str(exc_info.value) or "Not Found" in str(exc_info.value)
     print("✓ Correctly raised USPTOError for invalid application number")
 
@@ -132,6 +128,4 @@ async def test_get_adjustment_verify_data_types(client, known_application_number
             if pta.adjustment_reason_codes is not None:
                 assert isinstance(pta.adjustment_reason_codes, list)
     
-    await asyncio.sleep(1)  # Rate limiting
-    
     print(f"✓ Verified data types for application {serial_number}")
@@ -2,10 +2,40 @@
 Integration tests for PTAB appeals decisions endpoints.
 Requires USPTO_API_KEY environment variable to be set.
 """
-import pytest
 import asyncio
+import logging
+import pytest
 from uspto_odp.controller.uspto_odp_client import USPTOError
 
+logger = logging.getLogger(__name__)
+
+# Search payload shared by the POST search and download tests; the client does not modify it
+SEARCH_PAYLOAD = {
+    "q": "Final",
+    "pagination": {
+        "offset": 0,
+        "limit": 10
+    }
+}
+
+@pytest.fixture(scope="module")
+async def appeal_decision_search(client, request, fixture_cassette):
+    """
+    Fixture providing the result of a limit=5 appeal decision search.
+    The search is made once and shared by the tests that only need some decisions.
+    """
+    with fixture_cassette(request):
+        return await client.search_appeal_decisions_get(limit=5)
+
+
+@pytest.fixture
+def seed_appeal_decision(appeal_decision_search):
+    """
+    Fixture providing the first appeal decision from the shared search, or None.
+    """
+    bag = appeal_decision_search.appeal_decision_bag
+    return bag[0] if bag else None
+
 
 @pytest.mark.integration
 @pytest.mark.asyncio
@@ -13,8 +43,6 @@ async def test_search_appeal_decisions_get_basic(client):
     """
     Test search_appeal_decisions_get with basic query.
     """
-    await asyncio.sleep(2)  # Rate limiting
-    
     result = await client.search_appeal_decisions_get(limit=10)
     
     assert result is not None
@@ -24,8 +52,8 @@ async def test_search_appeal_decisions_get_basic(client):
     assert isinstance(result.appeal_decision_bag, list)
     assert result.count >= 0
     
-    print(f"✓ Retrieved {result.count} appeal decisions")
-    print(f"  Found {len(result.appeal_decision_bag)} results")
+    logger.info("✓ Retrieved %s appeal decisions", result.count)
+    logger.info("  Found %s results", len(result.appeal_decision_bag))
 
 
 @pytest.mark.integration
@@ -35,8 +63,6 @@ async def test_search_appeal_decisions_get_with_query(client):
     Test search_appeal_decisions_get with query string.
     Note: The API may return 404 for invalid field queries, so we test with a simple text query.
     """
-    await asyncio.sleep(2)  # Rate limiting
-    
     # Use a simple text query instead of field-specific query
     # The API may not support field-specific queries like decisionType:Final
     try:
@@ -49,13 +75,13 @@ async def test_search_appeal_decisions_get_with_query(client):
         assert result.count >= 0
         assert isinstance(result.appeal_decision_bag, list)
         
-        print(f"✓ Searched for Final appeal decisions")
-        print(f"  Count: {result.count}")
-        print(f"  Found {len(result.appeal_decision_bag)} results")
+        logger.info("✓ Searched for Final appeal decisions")
+        logger.info("  Count: %s", result.count)
+        logger.info("  Found %s results", len(result.appeal_decision_bag))
     except USPTOError as e:
-        if e.code == 404 or str(e.code) == "404":
+        if e.code in (404, "404"):
             # API may return 404 for queries that don't match - this is acceptable
-            print(f"⚠ Query returned 404 (no matching results or query not supported)")
+            logger.warning("⚠ Query returned 404 (no matching results or query not supported)")
         else:
             raise
 
@@ -67,8 +93,6 @@ async def test_search_appeal_decisions_get_with_filters(client):
     Test search_appeal_decisions_get with filters.
     Note: The API may return 404 for invalid filter syntax, so we handle errors gracefully.
     """
-    await asyncio.sleep(2)  # Rate limiting
-    
     try:
         result = await client.search_appeal_decisions_get(
             q="Final",
@@ -79,14 +103,12 @@ async def test_search_appeal_decisions_get_with_filters(client):
         assert result is not None
         assert result.count >= 0
         
-        await asyncio.sleep(2)  # Rate limiting
-        
-        print(f"✓ Searched with filters")
-        print(f"  Count: {result.count}")
+        logger.info("✓ Searched with filters")
+        logger.info("  Count: %s", result.count)
     except USPTOError as e:
-        if e.code == 404 or str(e.code) == "404":
+        if e.code in (404, "404"):
             # API may return 404 for invalid filter syntax - this is acceptable
-            print(f"⚠ Filter query returned 404 (filter syntax may not be supported)")
+            logger.warning("⚠ Filter query returned 404 (filter syntax may not be supported)")
         else:
             raise
 
@@ -97,118 +119,55 @@ async def test_search_appeal_decisions_post_basic(client):
     """
     Test search_appeal_decisions POST method with basic payload.
     """
-    await asyncio.sleep(2)  # Rate limiting
-    
-    payload = {
-        "q": "Final",
-        "pagination": {
-            "offset": 0,
-            "limit": 10
-        }
-    }
-    
-    result = await client.search_appeal_decisions(payload)
+    result = await client.search_appeal_decisions(SEARCH_PAYLOAD)
     
     assert result is not None
     assert result.count >= 0
     assert isinstance(result.appeal_decision_bag, list)
     
-    await asyncio.sleep(2)  # Rate limiting
-    
-    print(f"✓ Searched via POST")
-    print(f"  Count: {result.count}")
+    logger.info("✓ Searched via POST")
+    logger.info("  Count: %s", result.count)
 
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_search_appeal_decisions_download_get_basic(client):
+async def test_search_appeal_decisions_downloads(client):
     """
-    Test search_appeal_decisions_download_get GET method with basic query.
+    Test the download endpoints: GET as JSON, POST with a payload, and GET as CSV.
+    The three requests are independent, so they are made concurrently.
     """
-    await asyncio.sleep(2)  # Rate limiting
-    
-    result = await client.search_appeal_decisions_download_get(
-        q="Final",
-        format="json",
-        limit=10
+    json_result, post_result, csv_result = await asyncio.gather(
+        client.search_appeal_decisions_download_get(q="Final", format="json", limit=10),
+        client.search_appeal_decisions_download(SEARCH_PAYLOAD),
+        client.search_appeal_decisions_download_get(q="Final", format="csv", limit=10),
     )
     
-    assert result is not None
-    assert hasattr(result, 'count')
-    assert isinstance(result.count, int)
+    assert json_result is not None
+    assert isinstance(json_result.count, int)
+    logger.info("✓ Downloaded search results via GET (JSON)")
+    logger.info("  Count: %s", json_result.count)
     
-    await asyncio.sleep(2)  # Rate limiting
+    assert post_result is not None
+    assert post_result.count >= 0
+    logger.info("✓ Downloaded search results via POST")
+    logger.info("  Count: %s", post_result.count)
     
-    print(f"✓ Downloaded search results via GET (JSON)")
-    print(f"  Count: {result.count}")
+    assert csv_result is not None
+    assert hasattr(csv_result, 'count')
+    logger.info("✓ Downloaded search results via GET (CSV)")
+    logger.info("  Count: %s", csv_result.count)
 
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_search_appeal_decisions_download_post_basic(client):
-    """
-    Test search_appeal_decisions_download POST method with basic payload.
-    """
-    await asyncio.sleep(2)  # Rate limiting
-    
-    payload = {
-        "q": "Final",
-        "pagination": {
-            "offset": 0,
-            "limit": 10
-        }
-    }
-    
-    result = await client.search_appeal_decisions_download(payload)
-    
-    assert result is not None
-    assert result.count >= 0
-    
-    await asyncio.sleep(2)  # Rate limiting
-    
-    print(f"✓ Downloaded search results via POST")
-    print(f"  Count: {result.count}")
-
-
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_search_appeal_decisions_download_csv_format(client):
-    """
-    Test search_appeal_decisions_download_get with CSV format.
-    """
-    await asyncio.sleep(2)  # Rate limiting
-    
-    result = await client.search_appeal_decisions_download_get(
-        q="Final",
-        format="csv",
-        limit=10
-    )
-    
-    assert result is not None
-    assert hasattr(result, 'count')
-    
-    await asyncio.sleep(2)  # Rate limiting
-    
-    print(f"✓ Downloaded search results via GET (CSV)")
-    print(f"  Count: {result.count}")
-
-
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_get_appeal_decision_basic(client):
+async def test_get_appeal_decision_basic(client, seed_appeal_decision):
     """
     Test get_appeal_decision with a known document identifier.
     Note: This test may fail if the document identifier doesn't exist - that's expected.
     """
-    await asyncio.sleep(2)  # Rate limiting
-    
-    # First, get a valid document identifier from search
-    search_result = await client.search_appeal_decisions_get(limit=1)
-    
-    await asyncio.sleep(2)  # Rate limiting
-    
-    if search_result.appeal_decision_bag:
-        document_identifier = search_result.appeal_decision_bag[0].document_identifier
+    # Use a valid document identifier from the shared search
+    if seed_appeal_decision:
+        document_identifier = seed_appeal_decision.document_identifier
         
         if document_identifier:
             result = await client.get_appeal_decision(document_identifier)
@@ -218,33 +177,25 @@ async def test_get_appeal_decision_basic(client):
             assert hasattr(result, 'appeal_decision_bag')
             assert result.count >= 0
             
-            await asyncio.sleep(2)  # Rate limiting
-            
-            print(f"✓ Retrieved appeal decision")
-            print(f"  Document Identifier: {document_identifier}")
-            print(f"  Count: {result.count}")
+            logger.info("✓ Retrieved appeal decision")
+            logger.info("  Document Identifier: %s", document_identifier)
+            logger.info("  Count: %s", result.count)
         else:
-            print("⚠ No document identifier found in search results")
+            logger.warning("⚠ No document identifier found in search results")
     else:
-        print("⚠ No appeal decisions found to test individual lookup")
+        logger.warning("⚠ No appeal decisions found to test individual lookup")
 
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_get_appeal_decisions_by_appeal_basic(client):
+async def test_get_appeal_decisions_by_appeal_basic(client, seed_appeal_decision):
     """
     Test get_appeal_decisions_by_appeal with a known appeal number.
     Note: This test may fail if the appeal number doesn't exist - that's expected.
     """
-    await asyncio.sleep(2)  # Rate limiting
-    
-    # First, get a valid appeal number from search
-    search_result = await client.search_appeal_decisions_get(limit=1)
-    
-    await asyncio.sleep(2)  # Rate limiting
-    
-    if search_result.appeal_decision_bag:
-        appeal_number = search_result.appeal_decision_bag[0].appeal_number
+    # Use a valid appeal number from the shared search
+    if seed_appeal_decision:
+        appeal_number = seed_appeal_decision.appeal_number
         
         if appeal_number:
             result = await client.get_appeal_decisions_by_appeal(appeal_number)
@@ -254,44 +205,36 @@ async def test_get_appeal_decisions_by_appeal_basic(client):
             assert hasattr(result, 'appeal_decision_bag')
             assert result.count >= 0
             
-            await asyncio.sleep(2)  # Rate limiting
-            
-            print(f"✓ Retrieved appeal decisions by appeal number")
-            print(f"  Appeal Number: {appeal_number}")
-            print(f"  Count: {result.count}")
+            logger.info("✓ Retrieved appeal decisions by appeal number")
+            logger.info("  Appeal Number: %s", appeal_number)
+            logger.info("  Count: %s", result.count)
         else:
-            print("⚠ No appeal number found in search results")
+            logger.warning("⚠ No appeal number found in search results")
     else:
-        print("⚠ No appeal decisions found to test lookup by appeal number")
+        logger.warning("⚠ No appeal decisions found to test lookup by appeal number")
 
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_get_appeal_decision_not_found(client):
+async def test_get_appeal_decision_not_found(not_found_client):
     """
     Test get_appeal_decision with invalid document identifier.
     """
-    await asyncio.sleep(2)  # Rate limiting
-    
     with pytest.raises(USPTOError) as exc_info:
-        await client.get_appeal_decision("invalid-document-identifier-12345")
+        await not_found_client.get_appeal_decision("invalid-document-identifier-12345")
     
-    assert exc_info.value.code == 404 or str(exc_info.value.code) == "404"
+    assert exc_info.value.code in (404, "404")
     
-    await asyncio.sleep(2)  # Rate limiting
-    
-    print("✓ Error handling works correctly for invalid document identifier")
+    logger.info("✓ Error handling works correctly for invalid document identifier")
 
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_search_appeal_decisions_verify_structure(client):
+async def test_search_appeal_decisions_verify_structure(appeal_decision_search):
     """
     Verify the structure of appeal decision search results.
     """
-    await asyncio.sleep(2)  # Rate limiting
-    
-    result = await client.search_appeal_decisions_get(limit=5)
+    result = appeal_decision_search
     
     assert result is not None
     assert isinstance(result.count, int)
@@ -299,11 +242,9 @@ async def test_search_appeal_decisions_verify_structure(client):
     
     if len(result.appeal_decision_bag) > 0:
         first_decision = result.appeal_decision_bag[0]
-        assert hasattr(first_decision, 'document_identifier')
+        assert 'document_identifier' in first_decision.__dataclass_fields__
         # Verify common fields exist
         if first_decision.document_identifier:
             assert isinstance(first_decision.document_identifier, str)
     
-    await asyncio.sleep(2)  # Rate limiting
-    
-    print(f"✓ Verified appeal decision response structure")
+    logger.info("✓ Verified appeal decision response structure")
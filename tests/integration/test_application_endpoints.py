@@ -0,0 +1,81 @@
+"""
+Integration tests shared by the per-application endpoints that return a count
+and a list of records (attorney, associated documents, assignments).
+Endpoint-specific structure checks live in each endpoint's own test file.
+Requires USPTO_API_KEY environment variable to be set.
+"""
+import logging
+import pytest
+from uspto_odp.controller.uspto_odp_client import USPTOError
+
+logger = logging.getLogger(__name__)
+
+# (client method, attribute holding the list of records)
+APPLICATION_ENDPOINTS = [
+    ("get_attorney", "attorneys"),
+    ("get_associated_documents", "associated_documents"),
+    ("get_patent_assignments", "assignments"),
+]
+
+# Keys of the utility applications in the known_application_numbers fixture
+UTILITY_APP_KEYS = ("utility", "utility_2")
+
+endpoints = pytest.mark.parametrize(
+    "method_name, bag_attr", APPLICATION_ENDPOINTS, ids=[name for name, _ in APPLICATION_ENDPOINTS]
+)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+@endpoints
+async def test_endpoint_basic(client, utility_app, method_name, bag_attr):
+    """
+    Test the endpoint with a valid application number.
+    """
+    serial_number = utility_app
+    result = await getattr(client, method_name)(serial_number)
+
+    assert result is not None
+    assert isinstance(result.count, int)
+    assert result.count >= 0
+    assert isinstance(getattr(result, bag_attr), list)
+
+    logger.info("✓ %s: retrieved data for application %s", method_name, serial_number)
+    logger.info("  Count: %s", result.count)
+    logger.info("  Found %s records", len(getattr(result, bag_attr)))
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+@endpoints
+@pytest.mark.parametrize("app_key", UTILITY_APP_KEYS)
+async def test_endpoint_for_app(client, known_application_numbers, app_key, method_name, bag_attr):
+    """
+    Test the endpoint for each known utility application, one request per test
+    so failures point at a single application and xdist can spread them.
+    """
+    app_num = known_application_numbers[app_key]
+    result = await getattr(client, method_name)(app_num)
+
+    assert result is not None
+    assert result.count >= 0
+    logger.info("✓ %s: application %s: count=%s, records=%s",
+                method_name, app_num, result.count, len(getattr(result, bag_attr)))
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+@endpoints
+async def test_endpoint_not_found(not_found_client, method_name, bag_attr):
+    """
+    Test behavior when application number is not found.
+    """
+    invalid_app = "99999999"  # Likely invalid
+
+    with pytest.raises(USPTOError) as exc_info:
+        await getattr(not_found_client, method_name)(invalid_app)
+
+    # Error code may be string or int depending on API response
+    assert exc_info.value.code in (404, "404")
+    assert "404" in str(exc_info.value) or "Not Found" in str(exc_info.value)
+    logger.info("✓ %s: correctly raised USPTOError for invalid application number", method_name)
@@ -1,36 +1,21 @@
 """
 Integration tests for assignments endpoint.
+Basic, multi-application and not-found tests are in test_application_endpoints.py.
 Requires USPTO_API_KEY environment variable to be set.
 """
+import logging
 import pytest
-import asyncio
-from uspto_odp.controller.uspto_odp_client import USPTOClient, USPTOError
 
-
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_get_patent_assignments_basic(client, known_application_numbers):
-    """
-    Test get_patent_assignments with a valid application number.
-    """
-    serial_number = known_application_numbers["utility"]
-    result = await client.get_patent_assignments(serial_number)
-    
-    assert result is not None
-    assert hasattr(result, 'assignments')
-    assert isinstance(result.assignments, list)
-    
-    print(f"✓ Retrieved assignment data for application {serial_number}")
-    print(f"  Found {len(result.assignments)} assignments")
+logger = logging.getLogger(__name__)
 
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_get_patent_assignments_verify_structure(client, known_application_numbers):
+async def test_get_patent_assignments_verify_structure(client, utility_app):
     """
     Verify AssignmentCollection structure and fields.
     """
-    serial_number = known_application_numbers["utility"]
+    serial_number = utility_app
     result = await client.get_patent_assignments(serial_number)
     
     assert result is not None
@@ -47,39 +32,4 @@ async def test_get_patent_assignments_verify_structure(client, known_application
             assert hasattr(assignment, 'recorded_date')
             assert hasattr(assignment, 'assignees')
     
-    await asyncio.sleep(1)  # Rate limiting
-    
-    print(f"✓ Verified assignment structure for application {serial_number}")
-
-
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_get_patent_assignments_error_handling(client):
-    """
-    Test error handling for invalid application numbers.
-    """
-    invalid_serial = "99999999"  # Likely invalid
-    
-    with pytest.raises(USPTOError):
-        await client.get_patent_assignments(invalid_serial)
-    
-    print("✓ Error handling works correctly for invalid serial numbers")
-
-
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_get_patent_assignments_multiple_applications(client, known_application_numbers):
-    """
-    Test getting assignments for multiple applications.
-    """
-    applications = [
-        known_application_numbers["utility"],
-        known_application_numbers["utility_2"]
-    ]
-    
-    for app_num in applications:
-        result = await client.get_patent_assignments(app_num)
-        assert result is not None
-        await asyncio.sleep(1)  # Rate limiting
-    
-    print(f"✓ Retrieved assignment data for {len(applications)} applications")
+    logger.info("✓ Verified assignment structure for application %s", serial_number)
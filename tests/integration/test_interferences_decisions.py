@@ -3,7 +3,6 @@ Integration tests for PTAB interferences decisions endpoints.
 Requires USPTO_API_KEY environment variable to be set.
 """
 import pytest
-import asyncio
 from uspto_odp.controller.uspto_odp_client import USPTOError
 
 
@@ -13,8 +12,6 @@ async def test_search_interference_decisions_get_basic(client):
     """
     Test search_interference_decisions_get with basic query.
     """
-    await asyncio.sleep(2)  # Rate limiting
-    
     result = await client.search_interference_decisions_get(limit=10)
     
     assert result is not None
@@ -35,8 +32,6 @@ async def test_search_interference_decisions_get_with_query(client):
     Test search_interference_decisions_get with query string.
     Note: The API may return 404 for invalid field queries, so we test with a simple text query.
     """
-    await asyncio.sleep(2)  # Rate limiting
-    
     # Use a simple text query instead of field-specific query
     # The API may not support field-specific queries like decisionType:Final
     try:
@@ -53,7 +48,7 @@ async def test_search_interference_decisions_get_with_query(client):
         print(f"  Count: {result.count}")
         print(f"  Found {len(result.interference_decision_bag)} results")
     except USPTOError as e:
-        if e.code == 404 or str(e.code) == "404":
+        if e.code in (404, "404"):
             # API may return 404 for queries that don't match - this is acceptable
             print(f"⚠ Query returned 404 (no matching results or query not supported)")
         else:
@@ -67,8 +62,6 @@ async def test_search_interference_decisions_get_with_filters(client):
     Test search_interference_decisions_get with filters.
     Note: The API may return 404 for invalid filter syntax, so we handle errors gracefully.
     """
-    await asyncio.sleep(2)  # Rate limiting
-    
     try:
         result = await client.search_interference_decisions_get(
             q="Final",
@@ -79,12 +72,10 @@ async def test_search_interference_decisions_get_with_filters(client):
         assert result is not None
         assert result.count >= 0
         
-        await asyncio.sleep(2)  # Rate limiting
-        
         print(f"✓ Searched with filters")
         print(f"  Count: {result.count}")
     except USPTOError as e:
-        if e.code == 404 or str(e.code) == "404":
+        if e.code in (404, "404"):
             # API may return 404 for invalid filter syntax - this is acceptable
             print(f"⚠ Filter query returned 404 (filter syntax may not be supported)")
         else:
@@ -97,8 +88,6 @@ async def test_search_interference_decisions_post_basic(client):
     """
     Test search_interference_decisions POST method with basic payload.
     """
-    await asyncio.sleep(2)  # Rate limiting
-    
     payload = {
         "q": "Final",
         "pagination": {
@@ -113,8 +102,6 @@ async def test_search_interference_decisions_post_basic(client):
     assert result.count >= 0
     assert isinstance(result.interference_decision_bag, list)
     
-    await asyncio.sleep(2)  # Rate limiting
-    
     print(f"✓ Searched via POST")
     print(f"  Count: {result.count}")
 
@@ -125,8 +112,6 @@ async def test_search_interference_decisions_download_get_basic(client):
     """
     Test search_interference_decisions_download_get GET method with basic query.
     """
-    await asyncio.sleep(2)  # Rate limiting
-    
     result = await client.search_interference_decisions_download_get(
         q="Final",
         format="json",
@@ -137,8 +122,6 @@ async def test_search_interference_decisions_download_get_basic(client):
     assert hasattr(result, 'count')
     assert isinstance(result.count, int)
     
-    await asyncio.sleep(2)  # Rate limiting
-    
     print(f"✓ Downloaded search results via GET (JSON)")
     print(f"  Count: {result.count}")
 
@@ -149,8 +132,6 @@ async def test_search_interference_decisions_download_post_basic(client):
     """
     Test search_interference_decisions_download POST method with basic payload.
     """
-    await asyncio.sleep(2)  # Rate limiting
-    
     payload = {
         "q": "Final",
         "pagination": {
@@ -164,8 +145,6 @@ async def test_search_interference_decisions_download_post_basic(client):
     assert result is not None
     assert result.count >= 0
     
-    await asyncio.sleep(2)  # Rate limiting
-    
     print(f"✓ Downloaded search results via POST")
     print(f"  Count: {result.count}")
 
@@ -176,8 +155,6 @@ async def test_search_interference_decisions_download_csv_format(client):
     """
     Test search_interference_decisions_download_get with CSV format.
     """
-    await asyncio.sleep(2)  # Rate limiting
-    
     result = await client.search_interference_decisions_download_get(
         q="Final",
         format="csv",
@@ -187,8 +164,6 @@ async def test_search_interference_decisions_download_csv_format(client):
     assert result is not None
     assert hasattr(result, 'count')
     
-    await asyncio.sleep(2)  # Rate limiting
-    
     print(f"✓ Downloaded search results via GET (CSV)")
     print(f"  Count: {result.count}")
 
@@ -200,13 +175,9 @@ async def test_get_interference_decision_basic(client):
     Test get_interference_decision with a known document identifier.
     Note: This test may fail if the document identifier doesn't exist - that's expected.
     """
-    await asyncio.sleep(2)  # Rate limiting
-    
     # First, get a valid document identifier from search
     search_result = await client.search_interference_decisions_get(limit=1)
     
-    await asyncio.sleep(2)  # Rate limiting
-    
     if search_result.interference_decision_bag:
         document_identifier = search_result.interference_decision_bag[0].document_identifier
         
@@ -218,8 +189,6 @@ async def test_get_interference_decision_basic(client):
             assert hasattr(result, 'interference_decision_bag')
             assert result.count >= 0
             
-            await asyncio.sleep(2)  # Rate limiting
-            
             print(f"✓ Retrieved interference decision")
             print(f"  Document Identifier: {document_identifier}")
             print(f"  Count: {result.count}")
@@ -236,13 +205,9 @@ async def test_get_interference_decisions_by_interference_basic(client):
     Test get_interference_decisions_by_interference with a known interference number.
     Note: This test may fail if the interference number doesn't exist - that's expected.
     """
-    await asyncio.sleep(2)  # Rate limiting
-    
     # First, get a valid interference number from search
     search_result = await client.search_interference_decisions_get(limit=1)
     
-    await asyncio.sleep(2)  # Rate limiting
-    
     if search_result.interference_decision_bag:
         interference_number = search_result.interference_decision_bag[0].interference_number
         
@@ -254,8 +219,6 @@ async def test_get_interference_decisions_by_interference_basic(client):
             assert hasattr(result, 'interference_decision_bag')
             assert result.count >= 0
             
-            await asyncio.sleep(2)  # Rate limiting
-            
             print(f"✓ Retrieved interference decisions by interference number")
             print(f"  Interference Number: {interference_number}")
             print(f"  Count: {result.count}")
@@ -271,14 +234,10 @@ async def test_get_interference_decision_not_found(client):
     """
     Test get_interference_decision with invalid document identifier.
     """
-    await asyncio.sleep(2)  # Rate limiting
-    
     with pytest.raises(USPTOError) as exc_info:
         await client.get_interference_decision("invalid-document-identifier-12345")
     
-    assert exc_info.value.code == 404 or str(exc_info.value.code) == "404"
-    
-    await asyncio.sleep(2)  # Rate limiting
+    assert exc_info.value.code in (404, "404")
     
     print("✓ Error handling works correctly for invalid document identifier")
 
@@ -289,8 +248,6 @@ async def test_search_interference_decisions_verify_structure(client):
     """
     Verify the structure of interference decision search results.
     """
-    await asyncio.sleep(2)  # Rate limiting
-    
     result = await client.search_interference_decisions_get(limit=5)
     
     assert result is not None
@@ -304,6 +261,4 @@ async def test_search_interference_decisions_verify_structure(client):
         if first_decision.document_identifier:
             assert isinstance(first_decision.document_identifier, str)
     
-    await asyncio.sleep(2)  # Rate limiting
-    
     print(f"✓ Verified interference decision response structure")
@@ -3,7 +3,6 @@ Integration tests for patent documents endpoint.
 Requires USPTO_API_KEY environment variable to be set.
 """
 import pytest
-import asyncio
 from datetime import timedelta
 from uspto_odp.controller.uspto_odp_client import USPTOClient, USPTOError
 
@@ -92,8 +91,6 @@ async def test_get_patent_documents_different_types(client, known_application_nu
     assert utility_result is not None
     assert len(utility_result.documents) > 0
     
-    await asyncio.sleep(1)  # Rate limiting
-    
     print(f"✓ Retrieved documents for utility application: {len(utility_result.documents)} documents")
 
 
@@ -114,8 +111,6 @@ async def test_get_patent_documents_with_date_filter(client):
     
     print(f"✓ Retrieved {len(all_documents.documents)} total documents for {serial_number}")
     
-    await asyncio.sleep(1)  # Rate limiting
-    
     # Get the date range from the documents
     if len(all_documents.documents) > 0:
         # Find min and max dates
@@ -158,8 +153,6 @@ async def test_get_patent_documents_with_date_filter(client):
         
         print(f"✓ Verified all {len(filtered_documents.documents)} filtered documents "
               f"are within date range")
-    
-    await asyncio.sleep(1)  # Rate limiting
 
 
 @pytest.mark.integration
@@ -197,8 +190,6 @@ async def test_get_patent_documents_with_document_codes_filter(client):
             assert doc.document_code == test_code, \
                 f"Document has code {doc.document_code}, expected {test_code}"
         
-        await asyncio.sleep(1)  # Rate limiting
-        
         # Test with multiple document codes if we have at least 2 codes
         if len(document_codes) >= 2:
             test_codes = list(document_codes)[:2]
@@ -221,8 +212,6 @@ async def test_get_patent_documents_with_document_codes_filter(client):
                     f"Document has code {doc.document_code}, expected one of {test_codes}"
             
             print(f"✓ Verified all documents match requested codes")
-    
-    await asyncio.sleep(1)  # Rate limiting
 
 
 @pytest.mark.integration
@@ -276,5 +265,3 @@ async def test_get_patent_documents_with_combined_filters(client):
                 f"Document code {doc.document_code} doesn't match filter {test_code}"
         
         print(f"✓ Verified all documents match both filter criteria")
-    
-    await asyncio.sleep(1)  # Rate limiting
@@ -3,7 +3,6 @@ Integration tests for patent wrapper endpoint.
 Requires USPTO_API_KEY environment variable to be set.
 """
 import pytest
-import asyncio
 from uspto_odp.controller.uspto_odp_client import USPTOClient, USPTOError
 
 
@@ -38,8 +37,6 @@ async def test_get_patent_wrapper_with_us_prefix(client, known_application_numbe
     assert result is not None
     assert result.application_number == known_application_numbers["utility"]
     
-    await asyncio.sleep(1)  # Rate limiting
-    
     print(f"✓ US prefix properly stripped: {serial_with_prefix} -> {result.application_number}")
 
 
@@ -85,8 +82,6 @@ async def test_get_patent_wrapper_pct_application(client, known_application_numb
     assert result is not None
     assert result.application_number is not None
     
-    await asyncio.sleep(1)  # Rate limiting
-    
     print(f"✓ Retrieved wrapper for PCT application {pct_number}")
 
 
@@ -119,7 +114,6 @@ async def test_get_patent_wrapper_multiple_applications(client, known_applicatio
     for app_num in applications:
         result = await client.get_patent_wrapper(app_num)
         results.append(result)
-        await asyncio.sleep(1)  # Rate limiting
     
     assert len(results) == 2
     assert results[0].application_number != results[1].application_number
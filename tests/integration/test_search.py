@@ -3,7 +3,6 @@ Integration tests for search endpoints.
 Requires USPTO_API_KEY environment variable to be set.
 """
 import pytest
-import asyncio
 from uspto_odp.controller.uspto_odp_client import USPTOClient, USPTOError
 
 
@@ -288,8 +287,6 @@ async def test_search_patent_applications_by_docket_number(client):
     print(f"✓ Found application 18571476 with docket number 3NG00003USU1")
     print(f"  Total results: {result['count']}")
     print(f"  Applications found: {len(result['patentFileWrapperDataBag'])}")
-    
-    await asyncio.sleep(1)  # Rate limiting
 
 
 @pytest.mark.integration
@@ -342,8 +339,6 @@ async def test_search_patent_applications_by_docket_number_and_customer_number(c
     print(f"  Customer Number: {app_18571476['applicationMetaData']['customerNumber']}")
     print(f"  Total results: {result['count']}")
     print(f"  Applications found: {len(result['patentFileWrapperDataBag'])}")
-    
-    await asyncio.sleep(1)  # Rate limiting
 
 
 @pytest.mark.integration
@@ -433,8 +428,6 @@ async def test_search_patent_applications_post_complex_query(client):
     print(f"  Applications returned: {len(result['patentFileWrapperDataBag'])}")
     if "facets" in result:
         print(f"  Facets present: {list(result['facets'].keys())}")
-    
-    await asyncio.sleep(1)  # Rate limiting
 
 
 @pytest.mark.integration
@@ -577,8 +570,6 @@ async def test_search_patent_applications_by_docket_with_fields_and_sort(client)
     print(f"  - 63213141 (filing: {app_63213141['applicationMetaData']['filingDate']})")
     print(f"  Total results: {result['count']}")
     print(f"  Results sorted correctly by filingDate desc")
-    
-    await asyncio.sleep(1)  # Rate limiting
 
 
 @pytest.mark.integration
@@ -632,8 +623,6 @@ async def test_search_patent_applications_by_customer_number(client):
     print(f"✓ Search by customerNumber 51886 successful")
     print(f"  Total results: {result['count']}")
     print(f"  Applications returned: {len(result['patentFileWrapperDataBag'])}")
-    
-    await asyncio.sleep(1)  # Rate limiting
 
 
 @pytest.mark.integration
@@ -692,5 +681,3 @@ async def test_search_patent_applications_by_customer_number_and_partial_docket(
     print(f"✓ Search by customerNumber 51886 and docket 3NG* successful")
     print(f"  Total results: {result['count']}")
     print(f"  Applications returned: {len(result['patentFileWrapperDataBag'])}")
-    
-    await asyncio.sleep(1)  # Rate limiting
@@ -3,7 +3,6 @@ Integration tests for search/download endpoint.
 Requires USPTO_API_KEY environment variable to be set.
 """
 import pytest
-import asyncio
 from uspto_odp.controller.uspto_odp_client import USPTOError
 
 
@@ -52,8 +51,6 @@ async def test_search_patent_applications_download_get_basic(client):
     assert isinstance(result.count, int)
     assert isinstance(result.patent_file_wrapper_data_bag, list)
     
-    await asyncio.sleep(1)  # Rate limiting
-    
     print(f"✓ Downloaded search results via GET (JSON)")
     print(f"  Count: {result.count}")
     print(f"  Found {len(result.patent_file_wrapper_data_bag)} results")
@@ -80,8 +77,6 @@ async def test_search_patent_applications_download_get_csv_format(client):
     else:
         assert isinstance(result.patent_file_wrapper_data_bag, list)
     
-    await asyncio.sleep(1)  # Rate limiting
-    
     print(f"✓ Downloaded search results via GET (CSV)")
     print(f"  Count: {result.count}")
 
@@ -103,8 +98,6 @@ async def test_search_patent_applications_download_get_with_pagination(client):
     assert result.count >= 0
     assert len(result.patent_file_wrapper_data_bag) <= 50
     
-    await asyncio.sleep(1)  # Rate limiting
-    
     print(f"✓ Downloaded search results with pagination")
     print(f"  Count: {result.count}")
     print(f"  Returned: {len(result.patent_file_wrapper_data_bag)} results")
@@ -142,8 +135,6 @@ async def test_search_patent_applications_download_post_complex_query(client):
     assert result is not None
     assert result.count >= 0
     
-    await asyncio.sleep(1)  # Rate limiting
-    
     print(f"✓ Downloaded search results with complex query")
     print(f"  Count: {result.count}")
 
@@ -170,8 +161,6 @@ async def test_search_patent_applications_download_verify_structure(client):
         if "applicationNumberText" in first_result:
             assert isinstance(first_result["applicationNumberText"], str)
     
-    await asyncio.sleep(1)  # Rate limiting
-    
     print(f"✓ Verified download response structure")
 
 
@@ -183,7 +172,6 @@ async def test_search_patent_applications_download_error_handling(client):
     Note: The download endpoint may accept invalid queries and return empty results
     instead of raising an error. This test verifies the endpoint handles invalid input gracefully.
     """
-    await asyncio.sleep(1)  # Rate limiting
     
     # Test with invalid field name (similar to regular search error handling test)
     # The API may return empty results or an error depending on the query format
@@ -198,7 +186,5 @@ async def test_search_patent_applications_download_error_handling(client):
         print("✓ Invalid query handled gracefully (returned empty/valid response)")
     except USPTOError as e:
         # If an error is raised, that's also acceptable behavior
-        assert e.code == 400 or e.code == 404 or str(e.code) in ["400", "404"]
+        assert e.code in (400, 404, "400", "404")
         print(f"✓ Error handling works correctly for invalid queries (got {e.code})")
-    
-    await asyncio.sleep(1)  # Rate limiting
@@ -3,7 +3,6 @@ Integration tests for status codes endpoint.
 Requires USPTO_API_KEY environment variable to be set.
 """
 import pytest
-import asyncio
 from uspto_odp.controller.uspto_odp_client import USPTOClient, USPTOError
 from uspto_odp.models.patent_status_codes import StatusCode, StatusCodeCollection
 
@@ -45,8 +44,6 @@ async def test_search_status_codes_get_with_query(client):
         for status_code in result.status_codes:
             assert "Preexam" in status_code.application_status_description_text.lower()
     
-    await asyncio.sleep(1)  # Rate limiting
-    
     print(f"✓ Found {result.count} status codes matching 'Preexam'")
 
 
@@ -68,8 +65,6 @@ async def test_search_status_codes_get_with_comparison(client):
         for status_code in result.status_codes:
             assert status_code.application_status_code > 100
     
-    await asyncio.sleep(1)  # Rate limiting
-    
     print(f"✓ Found {result.count} status codes with code > 100")
 
 
@@ -87,8 +82,6 @@ async def test_search_status_codes_get_with_pagination(client):
     assert result is not None
     assert len(result.status_codes) <= 10
     
-    await asyncio.sleep(1)  # Rate limiting
-    
     print(f"✓ Retrieved {len(result.status_codes)} status codes with pagination (limit=10)")
 
 
@@ -105,8 +98,6 @@ async def test_search_status_codes_get_with_boolean(client):
     assert result is not None
     assert result.count >= 0
     
-    await asyncio.sleep(1)  # Rate limiting
-    
     print(f"✓ Found {result.count} status codes matching 'Application AND Preexam'")
 
 
@@ -137,8 +128,6 @@ async def test_search_status_codes_post_method(client):
         if found_150:
             print(f"✓ Found status code 150: {next(sc for sc in result.status_codes if sc.application_status_code == 150).application_status_description_text}")
     
-    await asyncio.sleep(1)  # Rate limiting
-    
     print(f"✓ POST search returned count: {result.count}, status codes: {len(result.status_codes)}")
 
 
@@ -165,8 +154,6 @@ async def test_search_status_codes_verify_structure(client):
         assert status_code.application_status_code > 0
         assert len(status_code.application_status_description_text) > 0
     
-    await asyncio.sleep(1)  # Rate limiting
-    
     print(f"✓ Verified structure of {len(result.status_codes)} status codes")
 
 
@@ -198,8 +185,6 @@ async def test_search_status_codes_specific_code(client):
             print(f"✓ Found {len(result.status_codes)} status codes (may not include 150 due to pagination)")
     else:
         print(f"✓ Query returned count: {result.count} but no status codes in response")
-    
-    await asyncio.sleep(1)  # Rate limiting
 
 
 @pytest.mark.integration
@@ -217,7 +202,5 @@ async def test_search_status_codes_error_handling(client):
         print("✓ Invalid query handled gracefully (returned empty result)")
     except USPTOError as e:
         # Error is acceptable for invalid queries (may be 400 or 404)
-        assert e.code == 400 or str(e.code) == "400" or e.code == 404 or str(e.code) == "404"
+        assert e.code == 400 or str(e.code) == "400" or e.code in (404, "404")
         print(f"✓ Invalid query correctly raised error: {e.code}")
-    
-    await asyncio.sleep(1)  # Rate limiting
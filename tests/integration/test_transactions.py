@@ -3,7 +3,6 @@ Integration tests for transactions endpoint.
 Requires USPTO_API_KEY environment variable to be set.
 """
 import pytest
-import asyncio
 from uspto_odp.controller.uspto_odp_client import USPTOClient, USPTOError
 
 
@@ -47,8 +46,6 @@ async def test_get_patent_transactions_verify_structure(client, known_applicatio
             assert hasattr(event, 'event_date')
             assert hasattr(event, 'event_code')
     
-    await asyncio.sleep(1)  # Rate limiting
-    
     print(f"✓ Verified transaction structure for application {serial_number}")
 
 
@@ -80,6 +77,5 @@ async def test_get_patent_transactions_multiple_applications(client, known_appli
     for app_num in applications:
         result = await client.get_patent_transactions(app_num)
         assert result is not None
-        await asyncio.sleep(1)  # Rate limiting
     
     print(f"✓ Retrieved transaction data for {len(applications)} applications")
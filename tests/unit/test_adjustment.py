@@ -47,6 +47,7 @@ async def test_get_adjustment_success(client):
     # Create mock response
     mock_response = Mock()
     mock_response.status = 200
+    mock_response.headers = {}
     mock_response.json = AsyncMock(return_value=mock_response_data)
     
     # Create async context manager mock
@@ -99,6 +100,7 @@ async def test_get_adjustment_empty_response(client):
     
     mock_response = Mock()
     mock_response.status = 200
+    mock_response.headers = {}
     mock_response.json = AsyncMock(return_value=mock_response_data)
     
     async_cm = AsyncMock()
@@ -128,6 +130,7 @@ async def test_get_adjustment_no_adjustment_data(client):
     
     mock_response = Mock()
     mock_response.status = 200
+    mock_response.headers = {}
     mock_response.json = AsyncMock(return_value=mock_response_data)
     
     async_cm = AsyncMock()
@@ -156,6 +159,7 @@ async def test_get_adjustment_not_found(client):
     
     mock_response = Mock()
     mock_response.status = 404
+    mock_response.headers = {}
     mock_response.json = AsyncMock(return_value=mock_error_data)
     
     async_cm = AsyncMock()
@@ -184,6 +188,7 @@ async def test_get_adjustment_bad_request(client):
     
     mock_response = Mock()
     mock_response.status = 400
+    mock_response.headers = {}
     mock_response.json = AsyncMock(return_value=mock_error_data)
     
     async_cm = AsyncMock()
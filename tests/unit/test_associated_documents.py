@@ -50,6 +50,7 @@ async def test_get_associated_documents_success_both(client):
     # Create mock response
     mock_response = Mock()
     mock_response.status = 200
+    mock_response.headers = {}
     mock_response.json = AsyncMock(return_value=mock_response_data)
     
     # Create async context manager mock
@@ -114,6 +115,7 @@ async def test_get_associated_documents_only_pgpub(client):
     
     mock_response = Mock()
     mock_response.status = 200
+    mock_response.headers = {}
     mock_response.json = AsyncMock(return_value=mock_response_data)
     
     async_cm = AsyncMock()
@@ -151,6 +153,7 @@ async def test_get_associated_documents_only_grant(client):
     
     mock_response = Mock()
     mock_response.status = 200
+    mock_response.headers = {}
     mock_response.json = AsyncMock(return_value=mock_response_data)
     
     async_cm = AsyncMock()
@@ -178,6 +181,7 @@ async def test_get_associated_documents_empty_response(client):
     
     mock_response = Mock()
     mock_response.status = 200
+    mock_response.headers = {}
     mock_response.json = AsyncMock(return_value=mock_response_data)
     
     async_cm = AsyncMock()
@@ -206,6 +210,7 @@ async def test_get_associated_documents_not_found(client):
     
     mock_response = Mock()
     mock_response.status = 404
+    mock_response.headers = {}
     mock_response.json = AsyncMock(return_value=mock_error_data)
     
     async_cm = AsyncMock()
@@ -234,6 +239,7 @@ async def test_get_associated_documents_bad_request(client):
     
     mock_response = Mock()
     mock_response.status = 400
+    mock_response.headers = {}
     mock_response.json = AsyncMock(return_value=mock_error_data)
     
     async_cm = AsyncMock()
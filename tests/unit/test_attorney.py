@@ -48,6 +48,7 @@ async def test_get_attorney_success(client):
     # Create mock response
     mock_response = Mock()
     mock_response.status = 200
+    mock_response.headers = {}
     mock_response.json = AsyncMock(return_value=mock_response_data)
     
     # Create async context manager mock
@@ -102,6 +103,7 @@ async def test_get_attorney_empty_response(client):
     
     mock_response = Mock()
     mock_response.status = 200
+    mock_response.headers = {}
     mock_response.json = AsyncMock(return_value=mock_response_data)
     
     async_cm = AsyncMock()
@@ -130,6 +132,7 @@ async def test_get_attorney_not_found(client):
     
     mock_response = Mock()
     mock_response.status = 404
+    mock_response.headers = {}
     mock_response.json = AsyncMock(return_value=mock_error_data)
     
     async_cm = AsyncMock()
@@ -158,6 +161,7 @@ async def test_get_attorney_bad_request(client):
     
     mock_response = Mock()
     mock_response.status = 400
+    mock_response.headers = {}
     mock_response.json = AsyncMock(return_value=mock_error_data)
     
     async_cm = AsyncMock()
@@ -0,0 +1,57 @@
+"""
+Unit tests for the package's lazily resolved public attributes.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+import uspto_odp
+
+
+def test_lazy_attributes_resolve():
+    from uspto_odp.models.patent_continuity import ParentContinuity
+    from uspto_odp.models.patent_file_wrapper import PatentFileWrapper
+
+    assert uspto_odp.ParentContinuity is ParentContinuity
+    assert uspto_odp.PatentFileWrapper is PatentFileWrapper
+    assert uspto_odp.models.PatentFileWrapper is PatentFileWrapper
+    assert isinstance(uspto_odp.__version__, str)
+
+
+def test_all_names_are_importable():
+    for name in uspto_odp.__all__:
+        assert getattr(uspto_odp, name) is not None
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        uspto_odp.DoesNotExist
+
+
+def test_import_does_not_load_models():
+    code = (
+        "import sys, uspto_odp; "
+        "print('uspto_odp.models.patent_file_wrapper' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, check=True,
+        env={**os.environ, "PYTHONPATH": str(Path(uspto_odp.__file__).parent.parent)},
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_version_lookup_is_deferred():
+    code = (
+        "import importlib.metadata as m; calls = []; real = m.version; "
+        "m.version = lambda name: calls.append(name) or real(name); "
+        "import uspto_odp; before = len(calls); uspto_odp.__version__; uspto_odp.__version__; "
+        "print(before, len(calls))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, check=True,
+        env={**os.environ, "PYTHONPATH": str(Path(uspto_odp.__file__).parent.parent)},
+    )
+    assert result.stdout.split() == ["0", "1"]
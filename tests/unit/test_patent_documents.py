@@ -3,6 +3,7 @@ from unittest.mock import Mock, AsyncMock
 import aiohttp
 from datetime import datetime
 from uspto_odp.controller.uspto_odp_client import USPTOClient, USPTOError
+from uspto_odp.models.patent_documents import PatentDocument, DownloadOption
 
 @pytest.fixture
 def client():
@@ -1436,4 +1437,25 @@ async def test_get_patent_documents_with_all_filters(client):
     params = call_args[1]["params"]
     assert params["officialDateFrom"] == "2023-01-01"
     assert params["officialDateTo"] == "2023-12-31"
-    assert params["documentCodes"] == "WFEE,SRNT"
\ No newline at end of file
+    assert params["documentCodes"] == "WFEE,SRNT"
+
+def test_download_options_by_mime_type():
+    """Test that download options are indexed by mime type"""
+    document = PatentDocument(
+        application_number="12345678",
+        official_date=None,
+        document_identifier="ABC123",
+        document_code="CTNF",
+        document_description="Non-Final Rejection",
+        direction_category="OUTGOING",
+        download_options=[
+            DownloadOption(mime_type="PDF", download_url="https://example.com/doc.pdf"),
+            DownloadOption(mime_type="XML", download_url="https://example.com/doc.xml")
+        ]
+    )
+    
+    options = document.download_options_by_mime_type
+    assert options["PDF"].download_url == "https://example.com/doc.pdf"
+    assert options["XML"].download_url == "https://example.com/doc.xml"
+    assert "MS_WORD" not in options
+    assert document.download_options_by_mime_type is options
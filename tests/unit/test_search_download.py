@@ -269,3 +269,42 @@ async def test_search_patent_applications_download_get_error(client):
     
     assert exc_info.value.code == 404
     assert "Not Found" in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_search_patent_applications_download_get_raw(client):
+    """Test search_patent_applications_download_get returning the undecoded body"""
+    client, mock_session = client
+    
+    mock_response = Mock()
+    mock_response.status = 200
+    mock_response.read = AsyncMock(return_value=b'{"count": 1}')
+    mock_response.json = AsyncMock()
+    
+    async_cm = AsyncMock()
+    async_cm.__aenter__.return_value = mock_response
+    mock_session.get.return_value = async_cm
+    
+    result = await client.search_patent_applications_download_get(q="Utility", raw=True)
+    
+    assert result == b'{"count": 1}'
+    mock_response.json.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_search_patent_applications_download_post_raw_error(client):
+    """Test that raw=True still raises USPTOError for failed requests"""
+    client, mock_session = client
+    
+    mock_response = Mock()
+    mock_response.status = 400
+    mock_response.json = AsyncMock(return_value={"code": 400, "error": "Bad Request"})
+    
+    async_cm = AsyncMock()
+    async_cm.__aenter__.return_value = mock_response
+    mock_session.post.return_value = async_cm
+    
+    with pytest.raises(USPTOError) as exc_info:
+        await client.search_patent_applications_download({"q": "invalid"}, raw=True)
+    
+    assert exc_info.value.code == 400
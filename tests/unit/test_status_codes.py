@@ -2,6 +2,7 @@
 Unit tests for status codes endpoint.
 These tests use mocks and do not require API access.
 """
+import asyncio
 import pytest
 from unittest.mock import Mock, AsyncMock
 import aiohttp
@@ -238,7 +239,7 @@ async def test_search_status_codes_error_handling(client):
         await client.search_status_codes_get(q="invalid:query")
     
     # Verify error details
-    assert exc_info.value.code == 404 or str(exc_info.value.code) == "404"
+    assert exc_info.value.code in (404, "404")
     assert exc_info.value.error == "Not Found"
     assert exc_info.value.error_details == "No matching records found"
 
@@ -297,3 +298,220 @@ async def test_status_code_model_parsing(client):
     status_19 = result.status_codes[2]
     assert status_19.application_status_code == 19
     assert "Preexam" in status_19.application_status_description_text
+
+
+@pytest.mark.asyncio
+async def test_search_status_codes_get_disk_cache(tmp_path, monkeypatch):
+    """Test that status-code responses are served from the on-disk cache"""
+    # Record what runs in worker threads, so cache file access is known to stay off the event loop
+    threaded = []
+    real_to_thread = asyncio.to_thread
+    async def to_thread(func, *args, **kwargs):
+        threaded.append(func.__name__)
+        return await real_to_thread(func, *args, **kwargs)
+    monkeypatch.setattr(asyncio, "to_thread", to_thread)
+    mock_session = Mock(spec=aiohttp.ClientSession)
+    client = USPTOClient(api_key="test_api_key", session=mock_session, cache_dir=str(tmp_path))
+    
+    mock_response = Mock()
+    mock_response.status = 200
+    mock_response.json = AsyncMock(return_value={
+        "count": 1,
+        "statusCodeDataBag": [
+            {
+                "applicationStatusCode": 150,
+                "applicationStatusDescriptionText": "Patented Case"
+            }
+        ],
+        "requestIdentifier": "test-request-id"
+    })
+    async_cm = AsyncMock()
+    async_cm.__aenter__.return_value = mock_response
+    mock_session.get.return_value = async_cm
+    
+    first = await client.search_status_codes_get(limit=10, offset=0)
+    second = await client.search_status_codes_get(limit=10, offset=0)
+    
+    # Second call is a cache hit and never reaches the network
+    assert mock_session.get.call_count == 1
+    assert threaded == ["_read_cache", "_write_cache", "_read_cache"]
+    assert second == first
+    assert second.status_codes[0].application_status_code == 150
+    
+    # A different page is a different cache entry
+    await client.search_status_codes_get(limit=10, offset=10)
+    assert mock_session.get.call_count == 2
+    
+    # force_refresh bypasses the cache
+    await client.search_status_codes_get(limit=10, offset=0, force_refresh=True)
+    assert mock_session.get.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_search_status_codes_get_bounds_inflight_requests(client):
+    """Test that concurrent status-code requests never exceed max_concurrency"""
+    import asyncio
+    client, mock_session = client
+    client.max_concurrency = 2
+    in_flight = 0
+    peak = 0
+    
+    async def enter_response(*args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.json = AsyncMock(return_value={"count": 0, "statusCodeDataBag": []})
+        return mock_response
+    
+    async def exit_response(*args, **kwargs):
+        nonlocal in_flight
+        in_flight -= 1
+    
+    def make_cm(*args, **kwargs):
+        async_cm = AsyncMock()
+        async_cm.__aenter__.side_effect = enter_response
+        async_cm.__aexit__.side_effect = exit_response
+        return async_cm
+    
+    mock_session.get.side_effect = make_cm
+    
+    await asyncio.gather(*(client.search_status_codes_get(offset=o) for o in range(6)))
+    
+    assert mock_session.get.call_count == 6
+    assert peak == 2
+
+
+def _status_codes_response(status, data, headers=None):
+    mock_response = Mock()
+    mock_response.status = status
+    mock_response.headers = headers or {}
+    mock_response.json = AsyncMock(return_value=data)
+    async_cm = AsyncMock()
+    async_cm.__aenter__.return_value = mock_response
+    return async_cm
+
+
+@pytest.mark.asyncio
+async def test_search_status_codes_get_retries_transient_errors(client, monkeypatch):
+    """Test that 429/503 responses are retried, honoring Retry-After"""
+    client, mock_session = client
+    sleep = AsyncMock()
+    monkeypatch.setattr("uspto_odp.controller.uspto_odp_client.asyncio.sleep", sleep)
+    
+    mock_session.get.side_effect = [
+        _status_codes_response(429, {"code": 429, "error": "Too Many Requests"}, {"Retry-After": "7"}),
+        _status_codes_response(503, {"code": 503, "error": "Service Unavailable"}),
+        _status_codes_response(200, {"count": 0, "statusCodeDataBag": []}),
+    ]
+    
+    result = await client.search_status_codes_get()
+    
+    assert result.count == 0
+    assert mock_session.get.call_count == 3
+    delays = [call.args[0] for call in sleep.call_args_list]
+    # Retry-After pauses the shared limiter; the pause is measured from when it was requested
+    assert delays[0] == pytest.approx(7.0, abs=0.01)
+    # Second retry falls back to exponential backoff with jitter
+    base = USPTOClient.RETRY_BACKOFF_BASE
+    assert base * 2 <= delays[1] <= base * 3
+
+
+@pytest.mark.asyncio
+async def test_search_status_codes_get_gives_up_after_max_retries(client, monkeypatch):
+    """Test that retryable errors are raised once retries are exhausted"""
+    client, mock_session = client
+    monkeypatch.setattr("uspto_odp.controller.uspto_odp_client.asyncio.sleep", AsyncMock())
+    client.MAX_RETRIES = 2
+    mock_session.get.side_effect = lambda *args, **kwargs: _status_codes_response(
+        503, {"code": 503, "error": "Service Unavailable"}
+    )
+    
+    with pytest.raises(USPTOError) as exc_info:
+        await client.search_status_codes_get()
+    
+    assert exc_info.value.code == 503
+    assert mock_session.get.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_iter_status_codes_streams_all_pages(client):
+    """Test that iter_status_codes walks every page and stops at the reported count"""
+    client, mock_session = client
+    pages = [
+        {"count": 3, "statusCodeDataBag": [
+            {"applicationStatusCode": 19, "applicationStatusDescriptionText": "Preexam"},
+            {"applicationStatusCode": 30, "applicationStatusDescriptionText": "Docketed"},
+        ]},
+        {"count": 3, "statusCodeDataBag": [
+            {"applicationStatusCode": 150, "applicationStatusDescriptionText": "Patented Case"},
+        ]},
+    ]
+    mock_session.get.side_effect = [_status_codes_response(200, page) for page in pages]
+    
+    codes = [sc.application_status_code async for sc in client.iter_status_codes(page_size=2)]
+    
+    assert codes == [19, 30, 150]
+    assert mock_session.get.call_count == 2
+    offsets = [call[1]["params"]["offset"] for call in mock_session.get.call_args_list]
+    assert offsets == [0, 2]
+
+
+@pytest.mark.asyncio
+async def test_iter_status_codes_passes_query_to_server(client):
+    """Test that iter_status_codes filters server-side and honors the filtered count"""
+    client, mock_session = client
+    mock_session.get.side_effect = [_status_codes_response(200, {"count": 1, "statusCodeDataBag": [
+        {"applicationStatusCode": 150, "applicationStatusDescriptionText": "Patented Case"},
+    ]})]
+    
+    codes = [sc.application_status_code
+             async for sc in client.iter_status_codes(q="applicationStatusDescriptionText:Patent")]
+    
+    assert codes == [150]
+    mock_session.get.assert_called_once()
+    assert mock_session.get.call_args[1]["params"]["q"] == "applicationStatusDescriptionText:Patent"
+
+
+@pytest.mark.asyncio
+async def test_iter_status_codes_prefetches_next_page(client):
+    """Test that the next page is requested while the current one is consumed"""
+    import asyncio
+    client, mock_session = client
+    pages = [
+        {"count": 4, "statusCodeDataBag": [
+            {"applicationStatusCode": 19, "applicationStatusDescriptionText": "Preexam"},
+            {"applicationStatusCode": 30, "applicationStatusDescriptionText": "Docketed"},
+        ]},
+        {"count": 4, "statusCodeDataBag": [
+            {"applicationStatusCode": 150, "applicationStatusDescriptionText": "Patented Case"},
+            {"applicationStatusCode": 161, "applicationStatusDescriptionText": "Abandoned"},
+        ]},
+    ]
+    mock_session.get.side_effect = [_status_codes_response(200, page) for page in pages]
+    
+    codes = client.iter_status_codes(page_size=2)
+    first = await codes.__anext__()
+    for _ in range(3):
+        await asyncio.sleep(0)
+    
+    assert first.application_status_code == 19
+    assert mock_session.get.call_count == 2
+    await codes.aclose()
+
+
+def test_status_code_collection_column_views():
+    """Test the parallel codes/descriptions views on StatusCodeCollection"""
+    collection = StatusCodeCollection.from_dict({
+        "count": 2,
+        "statusCodeDataBag": [
+            {"applicationStatusCode": 150, "applicationStatusDescriptionText": "Patented Case"},
+            {"applicationStatusCode": 19, "applicationStatusDescriptionText": "Preexam"},
+        ]
+    })
+    
+    assert collection.codes == [150, 19]
+    assert collection.descriptions == ["Patented Case", "Preexam"]
+    assert not hasattr(collection.status_codes[0], "__dict__")
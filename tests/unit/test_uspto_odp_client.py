@@ -3,7 +3,7 @@ print(f"Python Path: {sys.path}")
 import pytest
 from unittest.mock import Mock, AsyncMock
 import aiohttp
-from uspto_odp.controller.uspto_odp_client import USPTOClient, USPTOError
+from uspto_odp.controller.uspto_odp_client import USPTOClient, USPTOError, RateLimiter
 from uspto_odp.models.patent_file_wrapper import PatentFileWrapper
 from uspto_odp.models.patent_metadata import ApplicationMetadataResponse
 from datetime import date
@@ -82,6 +82,7 @@ async def test_get_patent_wrapper_success(client):
     # Create mock response
     mock_response = Mock()
     mock_response.status = 200
+    mock_response.headers = {}
     mock_response.json = AsyncMock(return_value=mock_response_data)
     
     # Create async context manager mock
@@ -199,10 +200,12 @@ async def test_get_app_metadata_from_patent_number(monkeypatch):
         # Create mock responses
         mock_search_response = Mock()
         mock_search_response.status = 200
+        mock_search_response.headers = {}
         mock_search_response.json = AsyncMock(return_value=mock_search_response_data)
 
         mock_metadata_response = Mock()
         mock_metadata_response.status = 200
+        mock_metadata_response.headers = {}
         mock_metadata_response.json = AsyncMock(return_value=mock_metadata_response_data)
 
         # Create async context manager mocks
@@ -235,9 +238,10 @@ async def test_get_app_metadata_from_patent_number(monkeypatch):
         assert isinstance(result3, ApplicationMetadataResponse)
         assert result3.application_number == "18085747"
 
-        # Check that post was called 3 times (search) and get was called 3 times (meta-data)
-        assert mock_session.post.call_count == 3
-        assert mock_session.get.call_count == 3
+        # All three spellings sanitize to the same patent number, so the search post and
+        # the meta-data get are each made once and then served from the cache
+        assert mock_session.post.call_count == 1
+        assert mock_session.get.call_count == 1
         
         # Verify search payload
         args, kwargs = mock_session.post.call_args_list[0]
@@ -263,7 +267,7 @@ async def test_get_app_metadata_from_patent_number(monkeypatch):
                 "offset": 0,
                 "limit": 25
             },
-            "fields": ["applicationNumberText", "applicationMetaData"],
+            "fields": ["applicationNumberText", "applicationMetaData.patentNumber"],
             "facets": [
                 "applicationMetaData.applicationTypeLabelName"
             ]        
@@ -306,6 +310,7 @@ async def test_get_app_metadata_success(client):
     # Create mock response
     mock_response = Mock()
     mock_response.status = 200
+    mock_response.headers = {}
     mock_response.json = AsyncMock(return_value=mock_response_data)
     
     # Create async context manager mock
@@ -349,6 +354,7 @@ async def test_get_app_metadata_not_found(client):
     
     mock_response = Mock()
     mock_response.status = 404
+    mock_response.headers = {}
     mock_response.json = AsyncMock(return_value=mock_error_data)
     
     async_cm = AsyncMock()
@@ -396,6 +402,7 @@ async def test_search_patent_applications_get_success(client):
     # Create mock response
     mock_response = Mock()
     mock_response.status = 200
+    mock_response.headers = {}
     mock_response.json = AsyncMock(return_value=mock_response_data)
     
     # Create async context manager mock
@@ -448,6 +455,7 @@ async def test_search_patent_applications_get_with_all_params(client):
     # Create mock response
     mock_response = Mock()
     mock_response.status = 200
+    mock_response.headers = {}
     mock_response.json = AsyncMock(return_value=mock_response_data)
 
     # Create async context manager mock
@@ -505,6 +513,7 @@ async def test_search_patent_applications_get_no_params(client):
     # Create mock response
     mock_response = Mock()
     mock_response.status = 200
+    mock_response.headers = {}
     mock_response.json = AsyncMock(return_value=mock_response_data)
     
     # Create async context manager mock
@@ -534,6 +543,7 @@ async def test_search_patent_applications_get_error_404(client):
     # Create error response
     mock_response = Mock()
     mock_response.status = 404
+    mock_response.headers = {}
     mock_response.json = AsyncMock(return_value={
         "code": 404,
         "error": "Not Found",
@@ -599,6 +609,7 @@ async def test_search_patent_applications_get_by_docket_number(client):
     # Create mock response
     mock_response = Mock()
     mock_response.status = 200
+    mock_response.headers = {}
     mock_response.json = AsyncMock(return_value=mock_response_data)
     
     # Create async context manager mock
@@ -692,6 +703,7 @@ async def test_search_patent_applications_post_complex_query(client):
     # Create mock response
     mock_response = Mock()
     mock_response.status = 200
+    mock_response.headers = {}
     mock_response.json = AsyncMock(return_value=mock_response_data)
     
     # Create async context manager mock
@@ -782,3 +794,741 @@ async def test_search_patent_applications_post_complex_query(client):
     assert call_args[1]["headers"]["X-API-KEY"] == "test_api_key"
     assert call_args[1]["headers"]["accept"] == "application/json"
     mock_response.json.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_async_context_manager_closes_owned_session():
+    async with USPTOClient(api_key="test_api_key") as client:
+        session = client.session
+        # The session is created lazily and reused for every request
+        assert client.session is session
+        assert session.connector.limit == USPTOClient.CONNECTION_LIMIT
+        assert session.connector.limit_per_host == USPTOClient.CONNECTION_LIMIT_PER_HOST
+        assert session.timeout.total is None
+        assert session.timeout.sock_connect == USPTOClient.CONNECT_TIMEOUT
+        assert session.timeout.sock_read == USPTOClient.READ_TIMEOUT
+    
+    assert session.closed
+
+@pytest.mark.asyncio
+async def test_aclose_closes_owned_session():
+    client = USPTOClient(api_key="test_api_key")
+    session = client.session
+    await client.aclose()
+    assert session.closed
+
+@pytest.mark.asyncio
+async def test_async_context_manager_leaves_injected_session_open(client):
+    client, mock_session = client
+    mock_session.closed = False
+    mock_session.close = AsyncMock()
+    
+    async with client:
+        assert client.session is mock_session
+    
+    mock_session.close.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_assigned_session_is_used_and_left_open():
+    session = Mock(spec=aiohttp.ClientSession)
+    session.closed = False
+    session.close = AsyncMock()
+    client = USPTOClient(api_key="test_api_key")
+    
+    client.session = session
+    assert client.session is session
+    
+    await client.close()
+    session.close.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_concurrency_controller_wraps_every_request(client):
+    _, mock_session = client
+    events = []
+    class Controller:
+        async def __aenter__(self):
+            events.append("enter")
+        async def __aexit__(self, exc_type, exc, tb):
+            events.append(("exit", exc_type))
+    client = USPTOClient(api_key="test_api_key", session=mock_session, concurrency_controller=Controller())
+    mock_response = Mock()
+    mock_response.status = 200
+    mock_response.headers = {}
+    mock_response.json = AsyncMock(return_value={"count": 0})
+    async_cm = AsyncMock()
+    async_cm.__aenter__.return_value = mock_response
+    mock_session.post.return_value = async_cm
+    
+    await client.search_patent_applications({"q": "Utility"})
+    assert events == ["enter", ("exit", None)]
+
+@pytest.mark.asyncio
+async def test_rate_limiter_allows_burst_then_waits():
+    import asyncio
+    limiter = RateLimiter(rate=5, per=0.1)
+    loop = asyncio.get_running_loop()
+    
+    # The full bucket is available immediately
+    start = loop.time()
+    for _ in range(5):
+        await limiter.acquire()
+    assert loop.time() - start < 0.015
+    
+    # The next token needs one refill interval (per / rate = 20ms)
+    start = loop.time()
+    await limiter.acquire()
+    assert loop.time() - start >= 0.015
+
+@pytest.mark.asyncio
+async def test_handle_response_uses_fast_json_decoder(client):
+    from uspto_odp.controller import uspto_odp_client
+    client, _ = client
+    mock_response = Mock()
+    mock_response.status = 200
+    mock_response.headers = {}
+    mock_response.json = AsyncMock(return_value={"count": 0})
+    
+    result = await client._handle_response(mock_response, lambda x: x)
+    
+    assert result == {"count": 0}
+    assert mock_response.json.call_args.kwargs["loads"] is uspto_odp_client._json_loads
+    assert mock_response.json.call_args.kwargs["content_type"] is None
+
+@pytest.mark.asyncio
+async def test_handle_response_skips_decoding_empty_responses(client):
+    client, _ = client
+    for status, content_length in ((200, 0), (404, 0)):
+        mock_response = AsyncMock()
+        mock_response.status = status
+        mock_response.content_length = content_length
+        mock_response.headers = {}
+        mock_response.json = AsyncMock()
+        
+        if status == 404:
+            with pytest.raises(USPTOError) as exc_info:
+                await client._handle_response(mock_response, lambda x: x)
+            assert exc_info.value.error == "Not Found"
+        else:
+            assert await client._handle_response(mock_response, lambda x: x) == {}
+        mock_response.json.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_handle_response_treats_empty_body_as_empty_dict(client):
+    client, _ = client
+    mock_response = AsyncMock()
+    mock_response.status = 200
+    mock_response.json = AsyncMock(return_value=None)
+    
+    result = await client._handle_response(mock_response, lambda x: x)
+    
+    assert result == {}
+
+@pytest.mark.asyncio
+async def test_get_application_bundle_fetches_parts_concurrently(client):
+    import asyncio
+    client, _ = client
+    started = []
+    
+    def fake_endpoint(name):
+        async def fetch(serial_number):
+            started.append(name)
+            await asyncio.sleep(0.01)
+            # Every part has started before any of them finishes
+            assert len(started) == 3
+            if name == "attorney":
+                raise USPTOError(404, "Not Found")
+            return f"{name}:{serial_number}"
+        return fetch
+    
+    client.get_patent_wrapper = fake_endpoint("wrapper")
+    client.get_continuity = fake_endpoint("continuity")
+    client.get_attorney = fake_endpoint("attorney")
+    
+    bundle = await client.get_application_bundle("16123456", parts=("wrapper", "continuity", "attorney"))
+    
+    assert list(bundle) == ["wrapper", "continuity", "attorney"]
+    assert bundle["wrapper"] == "wrapper:16123456"
+    assert bundle["continuity"] == "continuity:16123456"
+    assert isinstance(bundle["attorney"], USPTOError)
+
+@pytest.mark.asyncio
+async def test_get_application_bundle_rejects_unknown_parts(client):
+    client, mock_session = client
+    with pytest.raises(ValueError, match="bogus"):
+        await client.get_application_bundle("16123456", parts=("wrapper", "bogus"))
+    mock_session.get.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_download_document_streams_chunks_to_disk(client, tmp_path):
+    from uspto_odp.models.patent_documents import PatentDocument, DownloadOption
+    client, mock_session = client
+    document = PatentDocument(
+        application_number="16123456",
+        official_date=None,
+        document_identifier="ABC123",
+        document_code="CTNF",
+        document_description="Non-Final Rejection",
+        direction_category="OUTGOING",
+        download_options=[DownloadOption(mime_type="PDF", download_url="https://example.com/doc.pdf")]
+    )
+    requested_sizes = []
+    
+    async def iter_chunked(size):
+        requested_sizes.append(size)
+        for chunk in (b"%PDF-", b"body"):
+            yield chunk
+    
+    mock_response = AsyncMock()
+    mock_response.status = 200
+    mock_response.content = Mock()
+    mock_response.content.iter_chunked = iter_chunked
+    async_cm = AsyncMock()
+    async_cm.__aenter__.return_value = mock_response
+    mock_session.get.return_value = async_cm
+    
+    path = await client.download_document(document, str(tmp_path))
+    
+    assert path == str(tmp_path / "16123456_CTNF_ABC123.pdf")
+    assert (tmp_path / "16123456_CTNF_ABC123.pdf").read_bytes() == b"%PDF-body"
+    assert requested_sizes == [USPTOClient.DOWNLOAD_CHUNK_SIZE]
+
+@pytest.mark.asyncio
+async def test_get_endpoints_are_memoized_and_coalesced(client):
+    import asyncio
+    client, mock_session = client
+    mock_response = Mock()
+    mock_response.status = 200
+    mock_response.headers = {}
+    mock_response.json = AsyncMock(return_value={"count": 1, "patentFileWrapperDataBag": [{"applicationNumberText": "16123456"}]})
+    async_cm = AsyncMock()
+    async_cm.__aenter__.return_value = mock_response
+    mock_session.get.return_value = async_cm
+    
+    # Concurrent callers share one request, later callers hit the cache
+    first, second = await asyncio.gather(client.get_continuity("16123456"), client.get_continuity("16123456"))
+    third = await client.get_continuity("16123456")
+    assert first is second is third
+    assert mock_session.get.call_count == 1
+    
+    # Invalidating one entry forces a new request for that call only
+    client.cache.invalidate("get_continuity", "16123456")
+    await client.get_continuity("16123456")
+    assert mock_session.get.call_count == 2
+    
+    client.cache.clear()
+    assert len(client.cache) == 0
+
+@pytest.mark.asyncio
+async def test_get_endpoints_do_not_cache_errors(client):
+    client, mock_session = client
+    mock_response = Mock()
+    mock_response.status = 404
+    mock_response.headers = {}
+    mock_response.json = AsyncMock(return_value={"code": 404, "error": "Not Found"})
+    async_cm = AsyncMock()
+    async_cm.__aenter__.return_value = mock_response
+    mock_session.get.return_value = async_cm
+    
+    for _ in range(2):
+        with pytest.raises(USPTOError):
+            await client.get_attorney("16123456")
+    assert mock_session.get.call_count == 2
+    assert len(client.cache) == 0
+
+@pytest.mark.asyncio
+async def test_get_endpoints_revalidate_with_etag(client):
+    client, mock_session = client
+    fresh_response = Mock()
+    fresh_response.status = 200
+    fresh_response.headers = {"ETag": '"abc"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    fresh_response.json = AsyncMock(return_value={"count": 1, "patentFileWrapperDataBag": [{"applicationNumberText": "16123456"}]})
+    not_modified_response = Mock()
+    not_modified_response.status = 304
+    not_modified_response.headers = {}
+    not_modified_response.json = AsyncMock()
+    
+    cm_fresh = AsyncMock()
+    cm_fresh.__aenter__.return_value = fresh_response
+    cm_not_modified = AsyncMock()
+    cm_not_modified.__aenter__.return_value = not_modified_response
+    mock_session.get.side_effect = [cm_fresh, cm_not_modified]
+    
+    first = await client.get_continuity("16123456")
+    # Expire the in-memory entry so the next call goes back to the server
+    client.cache.invalidate("get_continuity", "16123456")
+    second = await client.get_continuity("16123456")
+    
+    assert second is first
+    not_modified_response.json.assert_not_called()
+    headers = mock_session.get.call_args_list[1].kwargs["headers"]
+    assert headers["If-None-Match"] == '"abc"'
+    assert headers["If-Modified-Since"] == "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert headers["X-API-KEY"] == "test_api_key"
+    assert "If-None-Match" not in client.headers
+
+def test_build_url_segments(client):
+    client, _ = client
+    endpoint = client._patent_applications_endpoint
+    assert endpoint is client._patent_applications_endpoint
+    assert client._build_url(endpoint) == endpoint
+    assert client._build_url(endpoint, "16123456") == f"{endpoint}/16123456"
+    assert client._build_url(endpoint, "16123456", "documents") == f"{endpoint}/16123456/documents"
+    assert client._build_url(endpoint, "16123456", "") == f"{endpoint}/16123456"
+    assert client._build_url(endpoint, "", "documents") == f"{endpoint}/documents"
+    assert client._build_url(endpoint, "a", "b", "c") == f"{endpoint}/a/b/c"
+
+def test_search_params_maps_names_and_drops_none():
+    from uspto_odp.controller.uspto_odp_client import _search_params
+    params = _search_params(q="Utility", sort=None, offset=0, limit=25, range_filters="grantDate 2010-01-01:2011-01-01")
+    assert params == {"q": "Utility", "offset": 0, "limit": 25, "rangeFilters": "grantDate 2010-01-01:2011-01-01"}
+
+def test_uspto_error_message_and_pickling():
+    import pickle
+    error = USPTOError(404, "Not Found", "No application found", "req-1")
+    assert str(error) == "404: Not Found - No application found"
+    assert error.args == ("404: Not Found - No application found",)
+    assert str(USPTOError(400, "Bad Request")) == "400: Bad Request - No details provided"
+    
+    restored = pickle.loads(pickle.dumps(error))
+    assert (restored.code, restored.error, restored.error_details, restored.request_identifier) == (404, "Not Found", "No application found", "req-1")
+    assert str(restored) == str(error)
+    assert restored.args == error.args
+
+def test_log_error_uses_lazy_formatting(client, caplog):
+    import logging
+    client, _ = client
+    with caplog.at_level(logging.ERROR, logger="uspto_odp.controller.uspto_odp_client"):
+        client._log_error(USPTOError(404, "Not Found", request_identifier="req-1"))
+    
+    record = caplog.records[-1]
+    assert record.args == (404, "Not Found", "No details provided", "req-1")
+    assert "Request ID: req-1" in record.getMessage()
+
+def _wrapper_session_responses(mock_session, statuses):
+    """Route mocked GETs by the last URL segment to a response with the given status."""
+    requested = []
+    
+    def get(url, **kwargs):
+        application_number = url.rsplit("/", 1)[-1]
+        requested.append(application_number)
+        response = Mock()
+        response.status = statuses[application_number]
+        response.headers = {}
+        response.json = AsyncMock(return_value={
+            "count": 1,
+            "patentFileWrapperDataBag": [{"applicationNumberText": application_number}]
+        } if response.status == 200 else {"code": response.status, "error": "Not Found"})
+        async_cm = AsyncMock()
+        async_cm.__aenter__.return_value = response
+        return async_cm
+    
+    mock_session.get.side_effect = get
+    return requested
+
+@pytest.mark.asyncio
+async def test_get_patent_wrapper_pct_leading_zero_requests_both_forms(client):
+    client, mock_session = client
+    requested = _wrapper_session_responses(mock_session, {"PCTUS0403971": 404, "PCTUS043971": 200})
+    
+    result = await client.get_patent_wrapper("PCTUS200403971")
+    
+    assert sorted(requested) == ["PCTUS0403971", "PCTUS043971"]
+    assert result.application_number == "PCTUS043971"
+
+@pytest.mark.asyncio
+async def test_get_patent_wrapper_pct_prefers_original_number(client):
+    client, mock_session = client
+    _wrapper_session_responses(mock_session, {"PCTUS0403971": 200, "PCTUS043971": 200})
+    
+    result = await client.get_patent_wrapper("PCTUS200403971")
+    
+    assert result.application_number == "PCTUS0403971"
+
+@pytest.mark.asyncio
+async def test_get_patent_wrapper_pct_raises_original_error_when_both_missing(client):
+    client, mock_session = client
+    _wrapper_session_responses(mock_session, {"PCTUS0403971": 404, "PCTUS043971": 404})
+    
+    with pytest.raises(USPTOError) as exc_info:
+        await client.get_patent_wrapper("PCTUS200403971")
+    assert exc_info.value.code == 404
+
+@pytest.mark.asyncio
+async def test_get_app_metadata_from_patent_numbers_batches_lookup(client):
+    from uspto_odp.controller import uspto_odp_client
+    client, mock_session = client
+    search_response = Mock()
+    search_response.status = 200
+    search_response.headers = {}
+    search_response.json = AsyncMock(return_value={
+        "count": 2,
+        "patentFileWrapperDataBag": [
+            {"applicationNumberText": "18085747", "applicationMetaData": {"patentNumber": "11989999"}},
+            {"applicationNumberText": "14412875", "applicationMetaData": {"patentNumber": "9022434"}}
+        ]
+    })
+    async_cm_search = AsyncMock()
+    async_cm_search.__aenter__.return_value = search_response
+    mock_session.post.return_value = async_cm_search
+    
+    def get(url, **kwargs):
+        application_number = url.rsplit("/", 2)[-2]
+        response = Mock()
+        response.status = 200
+        response.headers = {}
+        response.json = AsyncMock(return_value={
+            "count": 1,
+            "patentFileWrapperDataBag": [{"applicationNumberText": application_number, "applicationMetaData": {}}]
+        })
+        async_cm = AsyncMock()
+        async_cm.__aenter__.return_value = response
+        return async_cm
+    mock_session.get.side_effect = get
+    
+    results = await client.get_app_metadata_from_patent_numbers(["US11,989,999", "9022434", "10000000"])
+    
+    # One search resolves every patent number
+    mock_session.post.assert_called_once()
+    payload = mock_session.post.call_args[1]["json"]
+    assert payload["q"] == (
+        "applicationMetaData.patentNumber:11989999 OR "
+        "applicationMetaData.patentNumber:9022434 OR "
+        "applicationMetaData.patentNumber:10000000"
+    )
+    assert payload["filters"] == uspto_odp_client._PATENT_LOOKUP_TEMPLATE["filters"]
+    assert mock_session.get.call_count == 2
+    
+    assert results["US11,989,999"].application_number == "18085747"
+    assert results["9022434"].application_number == "14412875"
+    assert results["10000000"] is None
+
+@pytest.mark.asyncio
+async def test_get_app_metadata_from_patent_numbers_pages_past_extra_hits(client):
+    client, mock_session = client
+    client.PATENT_LOOKUP_PAGE_SIZE = 2
+    
+    def search_page(hits, count):
+        response = Mock()
+        response.status = 200
+        response.headers = {}
+        response.json = AsyncMock(return_value={"count": count, "patentFileWrapperDataBag": hits})
+        async_cm = AsyncMock()
+        async_cm.__aenter__.return_value = response
+        return async_cm
+    # 11989999 matches two applications, which fill the first page
+    mock_session.post.side_effect = [
+        search_page([
+            {"applicationNumberText": "18085747", "applicationMetaData": {"patentNumber": "11989999"}},
+            {"applicationNumberText": "17000000", "applicationMetaData": {"patentNumber": "11989999"}},
+        ], 3),
+        search_page([
+            {"applicationNumberText": "14412875", "applicationMetaData": {"patentNumber": "9022434"}},
+        ], 3),
+    ]
+    
+    def get(url, **kwargs):
+        application_number = url.rsplit("/", 2)[-2]
+        response = Mock()
+        response.status = 200
+        response.headers = {}
+        response.json = AsyncMock(return_value={
+            "count": 1,
+            "patentFileWrapperDataBag": [{"applicationNumberText": application_number, "applicationMetaData": {}}]
+        })
+        async_cm = AsyncMock()
+        async_cm.__aenter__.return_value = response
+        return async_cm
+    mock_session.get.side_effect = get
+    
+    results = await client.get_app_metadata_from_patent_numbers(["11989999", "9022434"])
+    
+    assert mock_session.post.call_count == 2
+    offsets = [call[1]["json"]["pagination"]["offset"] for call in mock_session.post.call_args_list]
+    assert offsets == [0, 2]
+    # The newest hit wins for the patent with two hits, and the other is still found
+    assert results["11989999"].application_number == "18085747"
+    assert results["9022434"].application_number == "14412875"
+
+@pytest.mark.asyncio
+async def test_all_requests_share_concurrency_cap_and_rate_limiter():
+    import asyncio
+    mock_session = Mock(spec=aiohttp.ClientSession)
+    client = USPTOClient(api_key="test_api_key", session=mock_session, max_concurrency=2, rps=100)
+    assert client.max_concurrency == 2
+    assert client.limiter.rate == 100
+    
+    in_flight = 0
+    peak = 0
+    
+    async def enter_response(*args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        mock_response = Mock()
+        mock_response.status = 200
+        mock_response.headers = {}
+        mock_response.json = AsyncMock(return_value={"count": 0})
+        return mock_response
+    
+    async def exit_response(*args, **kwargs):
+        nonlocal in_flight
+        in_flight -= 1
+    
+    def make_cm(*args, **kwargs):
+        async_cm = AsyncMock()
+        async_cm.__aenter__.side_effect = enter_response
+        async_cm.__aexit__.side_effect = exit_response
+        return async_cm
+    
+    mock_session.get.side_effect = make_cm
+    mock_session.post.side_effect = make_cm
+    client.limiter.acquire = AsyncMock(wraps=client.limiter.acquire)
+    
+    await asyncio.gather(
+        client.search_patent_applications({"q": "Utility"}),
+        client.search_patent_applications_get(q="Utility"),
+        client.get_trial_proceeding("IPR2020-00001"),
+        client.get_continuity("16123456"),
+    )
+    
+    assert peak == 2
+    assert client.limiter.acquire.call_count == 4
+
+@pytest.mark.asyncio
+async def test_endpoints_retry_transient_errors(client, monkeypatch, caplog):
+    import logging
+    client, mock_session = client
+    sleep = AsyncMock()
+    monkeypatch.setattr("uspto_odp.controller.uspto_odp_client.asyncio.sleep", sleep)
+    
+    def response_cm(status, data, headers=None):
+        mock_response = Mock()
+        mock_response.status = status
+        mock_response.headers = headers or {}
+        mock_response.json = AsyncMock(return_value=data)
+        async_cm = AsyncMock()
+        async_cm.__aenter__.return_value = mock_response
+        return async_cm
+    
+    mock_session.post.side_effect = [
+        response_cm(503, {"code": 503, "error": "Service Unavailable"}),
+        response_cm(200, {"count": 1}),
+    ]
+    mock_session.get.side_effect = [
+        response_cm(429, {"code": 429, "error": "Too Many Requests"}, {"Retry-After": "2"}),
+        response_cm(200, {"count": 2}),
+    ]
+    
+    with caplog.at_level(logging.WARNING, logger="uspto_odp.controller.uspto_odp_client"):
+        assert await client.search_patent_applications({"q": "Utility"}) == {"count": 1}
+        assert await client.search_patent_applications_get(q="Utility") == {"count": 2}
+    # Retry warnings are formatted lazily from their arguments
+    retries = [record for record in caplog.records if record.levelno == logging.WARNING]
+    assert [record.args[0] for record in retries] == ["status 503", "status 429"]
+    assert mock_session.post.call_count == 2
+    assert mock_session.get.call_count == 2
+    assert sleep.await_args_list[-1].args[0] == pytest.approx(2.0, abs=0.01)
+    assert sleep.await_args_list[0].args[0] <= USPTOClient.RETRY_BACKOFF_MAX
+
+@pytest.mark.asyncio
+async def test_download_document_validates_save_path(client, tmp_path):
+    from uspto_odp.models.patent_documents import PatentDocument, DownloadOption
+    client, mock_session = client
+    document = PatentDocument(
+        application_number="16123456",
+        official_date=None,
+        document_identifier="ABC123",
+        document_code="CTNF",
+        document_description="Non-Final Rejection",
+        direction_category="OUTGOING",
+        download_options=[DownloadOption(mime_type="PDF", download_url="https://example.com/doc.pdf")]
+    )
+    not_a_directory = tmp_path / "file.txt"
+    not_a_directory.write_text("")
+    
+    with pytest.raises(FileNotFoundError):
+        await client.download_document(document, str(tmp_path / "missing"))
+    with pytest.raises(NotADirectoryError):
+        await client.download_document(document, str(not_a_directory))
+    # An unsupported mime type fails before the save path is even checked
+    with pytest.raises(ValueError, match="Unsupported mime type"):
+        await client.download_document(document, str(tmp_path / "missing"), mime_type="pdf")
+    mock_session.get.assert_not_called()
+
+def test_unknown_transport_is_rejected():
+    with pytest.raises(ValueError, match="transport"):
+        USPTOClient(api_key="test_api_key", transport="requests")
+
+@pytest.mark.asyncio
+async def test_httpx_transport_routes_requests():
+    httpx = pytest.importorskip("httpx")
+    requests = []
+    
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"count": 1})
+    
+    client = USPTOClient(api_key="test_api_key", transport="httpx")
+    client._httpx_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with client:
+        result = await client.search_patent_applications_get(q="Utility", limit=5)
+    
+    assert result == {"count": 1}
+    assert requests[0].url.params["q"] == "Utility"
+    assert requests[0].headers["X-API-KEY"] == "test_api_key"
+    assert client._httpx_client is None
+
+@pytest.mark.asyncio
+async def test_httpx_transport_encodes_post_payloads():
+    httpx = pytest.importorskip("httpx")
+    import json
+    requests = []
+    
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"count": 0})
+    
+    client = USPTOClient(api_key="test_api_key", transport="httpx")
+    client._httpx_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    payload = {"q": "applicationMetaData.patentNumber:11989999", "pagination": {"offset": 0, "limit": 1}}
+    async with client:
+        await client.search_patent_applications(payload)
+    
+    assert json.loads(requests[0].content) == payload
+    assert requests[0].headers["Content-Type"] == "application/json"
+    assert requests[0].headers["X-API-KEY"] == "test_api_key"
+
+@pytest.mark.asyncio
+async def test_batch_preserves_order_and_collects_errors(client):
+    import asyncio
+    client, _ = client
+    
+    async def fetch(serial_number):
+        # Finish in reverse order to check results are not reordered
+        await asyncio.sleep(0.01 * (3 - int(serial_number[-1])))
+        if serial_number.endswith("2"):
+            raise USPTOError(404, "Not Found")
+        return serial_number
+    
+    results = await client.batch(["16000001", "16000002", "16000003"], fetch, return_exceptions=True)
+    assert results[0] == "16000001"
+    assert isinstance(results[1], USPTOError)
+    assert results[2] == "16000003"
+    
+    with pytest.raises(USPTOError):
+        await client.batch(["16000002"], fetch)
+
+@pytest.mark.asyncio
+async def test_batch_cancels_outstanding_calls_on_first_error(client):
+    import asyncio
+    client, _ = client
+    cancelled = []
+    
+    async def fetch(serial_number):
+        if serial_number.endswith("2"):
+            raise USPTOError(404, "Not Found")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(serial_number)
+            raise
+    
+    with pytest.raises(USPTOError):
+        await client.batch(["16000001", "16000002", "16000003"], fetch)
+    assert sorted(cancelled) == ["16000001", "16000003"]
+
+@pytest.mark.asyncio
+async def test_batch_get_wrappers(client):
+    client, mock_session = client
+    _wrapper_session_responses(mock_session, {"16123456": 200, "17654321": 200})
+    
+    wrappers = await client.batch_get_wrappers(["16123456", "17654321"])
+    
+    assert [wrapper.application_number for wrapper in wrappers] == ["16123456", "17654321"]
+
+@pytest.mark.asyncio
+async def test_share_session_reuses_one_session_per_loop():
+    first = USPTOClient(api_key="test_api_key", share_session=True)
+    second = USPTOClient(api_key="other_api_key", share_session=True)
+    try:
+        assert first.session is second.session
+        assert first.session is USPTOClient.get_shared_session()
+        
+        # Closing one client leaves the shared session open for the others
+        await first.close()
+        assert not second.session.closed
+    finally:
+        shared = second.session
+        await USPTOClient.close_shared_session()
+    assert shared.closed
+
+class _FakeContinuityClient(USPTOClient):
+    async def get_continuity(self, serial_number):
+        if serial_number.endswith("2"):
+            raise USPTOError(404, "Not Found")
+        return f"continuity-{serial_number}-{self.limiter.rate}-{self.max_concurrency}-{self.cache_dir}"
+
+@pytest.mark.asyncio
+async def test_bulk_fetch_splits_work_and_rate_across_workers(monkeypatch, tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+    import uspto_odp.controller.uspto_odp_client as client_module
+    # Threads stand in for processes; each worker still runs its own event loop
+    monkeypatch.setattr(client_module, "ProcessPoolExecutor", ThreadPoolExecutor)
+    client = _FakeContinuityClient(api_key="test_api_key", rps=8, max_concurrency=6, cache_dir=str(tmp_path))
+    serials = ["16000001", "16000002", "16000003", "16000004", "16000005"]
+    
+    results = await client.bulk_fetch(serials, "get_continuity", processes=2, return_exceptions=True)
+    
+    # Workers get the client's settings, with the rate and concurrency cap split between them
+    assert results[0] == f"continuity-16000001-4.0-3-{tmp_path}"
+    assert isinstance(results[1], USPTOError)
+    assert results[2:] == [f"continuity-{serial}-4.0-3-{tmp_path}" for serial in serials[2:]]
+    with pytest.raises(USPTOError):
+        await client.bulk_fetch(serials, "get_continuity", processes=2)
+    assert await client.bulk_fetch([], "get_continuity") == []
+    with pytest.raises(ValueError):
+        await client.bulk_fetch(serials, "_request")
+
+@pytest.mark.asyncio
+async def test_bulk_fetch_does_not_wait_for_workers_on_failure(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    import uspto_odp.controller.uspto_odp_client as client_module
+    shutdowns = []
+    class RecordingExecutor(ThreadPoolExecutor):
+        def shutdown(self, wait=True, *, cancel_futures=False):
+            shutdowns.append((wait, cancel_futures))
+            super().shutdown(wait=wait, cancel_futures=cancel_futures)
+    def failing_worker(*args):
+        raise RuntimeError("worker failed")
+    monkeypatch.setattr(client_module, "ProcessPoolExecutor", RecordingExecutor)
+    monkeypatch.setattr(client_module, "_bulk_fetch_worker", failing_worker)
+    client = _FakeContinuityClient(api_key="test_api_key")
+    
+    with pytest.raises(RuntimeError):
+        await client.bulk_fetch(["16000001", "16000003"], "get_continuity", processes=2)
+    assert shutdowns == [(False, True)]
+
+@pytest.mark.asyncio
+async def test_rate_limiter_pause_holds_back_other_callers():
+    import asyncio
+    limiter = RateLimiter(rate=100)
+    loop = asyncio.get_running_loop()
+    
+    start = loop.time()
+    pause = asyncio.ensure_future(limiter.pause(0.05))
+    await asyncio.sleep(0)
+    # Tokens are available, but the pause comes first
+    await limiter.acquire()
+    assert loop.time() - start >= 0.045
+    await pause
+
+def test_rate_limiter_can_be_shared_across_event_loops():
+    import asyncio
+    limiter = RateLimiter(rate=2, per=0.02)
+    
+    async def burst():
+        # More acquisitions than tokens, so callers queue on the limiter's lock
+        await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+    
+    asyncio.run(burst())
+    asyncio.run(burst())